@@ -5,6 +5,7 @@ __all_plugins__ = [
     "compas_timber.rhino",
     "compas_timber.rhino.install",
     "compas_timber.utils.r_tree",
+    "compas_timber.solvers.disassembly_numpy",
 ]
 
 
@@ -1,7 +1,10 @@
+import compas
+
 from .french_ridge_lap import FrenchRidgeLapJoint
 from .joint import BeamJoinningError
 from .joint import Joint
 from .joint import beam_side_incidence
+from .joint import beam_side_incidence_angles
 from .lap_joint import LapJoint
 from .l_butt import LButtJoint
 from .l_miter import LMiterJoint
@@ -13,9 +16,14 @@ from .solver import JointTopology
 from .solver import find_neighboring_beams
 from .t_butt import TButtJoint
 
+if not compas.IPY:
+    from .lap_joint_numpy import lap_negative_polyhedrons_numpy
+    from .lap_joint_numpy import lap_negative_volumes_numpy
+
 __all__ = [
     "Joint",
     "beam_side_incidence",
+    "beam_side_incidence_angles",
     "LapJoint",
     "BeamJoinningError",
     "TButtJoint",
@@ -29,3 +37,9 @@ __all__ = [
     "ConnectionSolver",
     "find_neighboring_beams",
 ]
+
+if not compas.IPY:
+    __all__ += [
+        "lap_negative_volumes_numpy",
+        "lap_negative_polyhedrons_numpy",
+    ]
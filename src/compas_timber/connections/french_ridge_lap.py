@@ -6,7 +6,7 @@ from compas.geometry import cross_vectors
 
 from .joint import BeamJoinningError
 from .joint import Joint
-from .joint import beam_side_incidence
+from .joint import beam_side_incidence_angles
 from .solver import JointTopology
 
 
@@ -77,15 +77,21 @@ class FrenchRidgeLapJoint(Joint):
 
     @property
     def cutting_plane_top(self):
-        angles_faces = beam_side_incidence(self.beam_a, self.beam_b)
-        cfr = max(angles_faces, key=lambda x: x[0])[1]
-        cfr = Frame(cfr.point, cfr.xaxis, cfr.yaxis * -1.0)  # flip normal
-        return cfr
+        return self._cached_geometry("cutting_plane_top", self._calculate_cutting_plane_top)
 
     @property
     def cutting_plane_bottom(self):
-        angles_faces = beam_side_incidence(self.beam_b, self.beam_a)
-        cfr = max(angles_faces, key=lambda x: x[0])[1]
+        return self._cached_geometry("cutting_plane_bottom", self._calculate_cutting_plane_bottom)
+
+    def _calculate_cutting_plane_top(self):
+        angles = beam_side_incidence_angles(self.beam_a, self.beam_b)
+        cfr = self.beam_b.face_frame(angles.index(max(angles)))
+        cfr = Frame(cfr.point, cfr.xaxis, cfr.yaxis * -1.0)  # flip normal
+        return cfr
+
+    def _calculate_cutting_plane_bottom(self):
+        angles = beam_side_incidence_angles(self.beam_b, self.beam_a)
+        cfr = self.beam_a.face_frame(angles.index(max(angles)))
         return cfr
 
     def restore_beams_from_keys(self, assemly):
@@ -1,11 +1,18 @@
+import math
+
 from compas.data import Data
 from compas.geometry import Frame
-from compas.geometry import Point
-from compas.geometry import angle_vectors
-from compas.geometry import intersection_line_line
+from compas.geometry import cross_vectors
+from compas.geometry import dot_vectors
+from compas.geometry import subtract_vectors
+
+from compas_timber.utils import profile_count
+from compas_timber.utils import profile_span
 
 from .solver import JointTopology
 
+INCIDENCE_TOLERANCE = 1e-6
+
 
 def beam_side_incidence(beam1, beam2):
     """Returns a map of faces of beam2 and the angle of their normal with beam1's centerline.
@@ -23,21 +30,54 @@ def beam_side_incidence(beam1, beam2):
     -------
     list(tuple(float, :class:`~compas.geometry.Frame`))
 
+    See Also
+    --------
+    :func:`~compas_timber.connections.beam_side_incidence_angles`
+
     """
+    angles = beam_side_incidence_angles(beam1, beam2)
+    return [(angle, beam2.face_frame(index)) for index, angle in enumerate(angles)]
 
-    # find the orientation of beam1's centerline so that it's pointing outward of the joint
-    #   find the closest end
-    p1x, p2x = intersection_line_line(beam1.centerline, beam2.centerline)
-    which, _ = beam1.endpoint_closest_to_point(Point(*p1x))
 
-    if which == "start":
-        centerline_vec = beam1.centerline.vector
-    else:
-        centerline_vec = beam1.centerline.vector * -1
+def beam_side_incidence_angles(beam1, beam2):
+    """Returns the angles between the normals of the 4 long faces of beam2 and beam1's centerline.
 
-    # map faces to their angle with centerline, choose smallest
-    angle_face = [(angle_vectors(side.normal, centerline_vec), side) for side in beam2.faces[:4]]
-    return angle_face
+    Same as :func:`~compas_timber.connections.beam_side_incidence` but without creating the face frames.
+    The angles are ordered like `beam2.faces[:4]`, use `beam2.face_frame(index)` to get the frame of the selected face.
+
+    Parameters
+    ----------
+    beam1 : :class:`~compas_timber.parts.Beam`
+        The beam that attaches with one of its ends to the side of Beam2.
+    beam2 : :class:`~compas_timber.parts.Beam`
+        The other beam.
+
+    Returns
+    -------
+    list(float)
+
+    """
+    # find the orientation of beam1's centerline so that it's pointing outward of the joint
+    #   find the closest end
+    a = beam1.frame.point
+    u = beam1.frame.xaxis
+    c = beam2.frame.point
+    v = beam2.frame.xaxis
+    n = cross_vectors(u, v)
+    nn = dot_vectors(n, n)
+    if nn < INCIDENCE_TOLERANCE**2:
+        raise ValueError("Cannot determine side incidence of parallel beams.")
+
+    # parameter of beam1's centerline point closest to beam2's centerline, normalized to beam1's length
+    t = dot_vectors(cross_vectors(subtract_vectors(c, a), v), n) / nn / beam1.length
+    sign = 1.0 if t <= 0.5 else -1.0
+
+    # map faces to their angle with centerline
+    angles = []
+    for normal in beam2.face_normals[:4]:
+        cosine = sign * dot_vectors(normal, u)
+        angles.append(math.acos(max(min(cosine, 1.0), -1.0)))
+    return angles
 
 
 class BeamJoinningError(Exception):
@@ -76,6 +116,7 @@ class Joint(Data):
         super(Joint, self).__init__()
         self.frame = frame or Frame.worldXY()
         self.key = key
+        self._geometry_cache = {}
 
     @property
     def __data__(self):
@@ -85,6 +126,47 @@ class Joint(Data):
     def beams(self):
         raise NotImplementedError
 
+    def clear_geometry_cache(self):
+        """Discards all the cached geometry derived from the beams of this joint.
+
+        This is not needed when the beams change, as the cached geometry is recalculated whenever the frame or
+        the dimensions of any of the beams differ from the ones it was calculated with.
+
+        """
+        self._geometry_cache = {}
+
+    def _get_geometry_key(self):
+        """Returns a value which changes whenever the geometry derived by this joint should be recalculated.
+
+        Implementations whose derived geometry depends on additional parameters should extend it accordingly.
+
+        """
+        return tuple(beam.geometry_signature for beam in self.beams)
+
+    def _cached_geometry(self, name, compute):
+        """Returns the result of `compute()`, calculated only once for the current geometry of the beams.
+
+        Parameters
+        ----------
+        name : str
+            A name identifying the cached value.
+        compute : callable
+            Called without arguments to calculate the value when there's no valid cached value.
+
+        Returns
+        -------
+        object
+            The cached value. It is shared between callers and should not be modified.
+
+        """
+        key = self._get_geometry_key()
+        cached = self._geometry_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = compute()
+        self._geometry_cache[name] = (key, value)
+        return value
+
     def add_features(self):
         """Adds the features defined by this joint to affected beam(s).
 
@@ -141,9 +223,12 @@ class Joint(Data):
 
         if len(beams) < 2:
             raise ValueError("Expected at least 2 beams. Got instead: {}".format(len(beams)))
-        joint = cls(*beams, **kwargs)
-        assembly.add_joint(joint, beams)
-        joint.add_features()
+        with profile_span(cls.__name__ + ".create", "joints"):
+            joint = cls(*beams, **kwargs)
+            assembly.add_joint(joint, beams)
+            with profile_span(cls.__name__ + ".add_features", "joints"):
+                joint.add_features()
+        profile_count("joints")
         return joint
 
     @property
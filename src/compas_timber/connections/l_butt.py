@@ -3,7 +3,7 @@ from compas_timber.parts import CutFeature
 
 from .joint import BeamJoinningError
 from .joint import Joint
-from .joint import beam_side_incidence
+from .joint import beam_side_incidence_angles
 from .solver import JointTopology
 
 
@@ -78,15 +78,29 @@ class LButtJoint(Joint):
     def joint_type(self):
         return "L-Butt"
 
+    @property
+    def cutting_plane_main(self):
+        return self.get_main_cutting_plane()
+
+    @property
+    def cutting_plane_cross(self):
+        return self.get_cross_cutting_plane()
+
     def get_main_cutting_plane(self):
-        angles_faces = beam_side_incidence(self.main_beam, self.cross_beam)
-        cfr = min(angles_faces, key=lambda x: x[0])[1]
+        return self._cached_geometry("cutting_plane_main", self._calculate_main_cutting_plane)
+
+    def get_cross_cutting_plane(self):
+        return self._cached_geometry("cutting_plane_cross", self._calculate_cross_cutting_plane)
+
+    def _calculate_main_cutting_plane(self):
+        angles = beam_side_incidence_angles(self.main_beam, self.cross_beam)
+        cfr = self.cross_beam.face_frame(angles.index(min(angles)))
         cfr = Frame(cfr.point, cfr.xaxis, cfr.yaxis * -1.0)  # flip normal
         return cfr
 
-    def get_cross_cutting_plane(self):
-        angles_faces = beam_side_incidence(self.cross_beam, self.main_beam)
-        cfr = max(angles_faces, key=lambda x: x[0])[1]
+    def _calculate_cross_cutting_plane(self):
+        angles = beam_side_incidence_angles(self.cross_beam, self.main_beam)
+        cfr = self.main_beam.face_frame(angles.index(max(angles)))
         return cfr
 
     def restore_beams_from_keys(self, assemly):
@@ -120,6 +134,6 @@ class LButtJoint(Joint):
         self.main_beam.add_features(f_main)
         self.features.append(f_main)
 
-        f_cross = CutFeature(self.get_cross_cutting_plane())
+        f_cross = CutFeature(cross_cutting_plane)
         self.cross_beam.add_features(f_cross)
         self.features.append(f_cross)
@@ -77,7 +77,14 @@ class LMiterJoint(Joint):
     def beams(self):
         return [self.beam_a, self.beam_b]
 
+    @property
+    def cutting_planes(self):
+        return self.get_cutting_planes()
+
     def get_cutting_planes(self):
+        return self._cached_geometry("cutting_planes", self._calculate_cutting_planes)
+
+    def _calculate_cutting_planes(self):
         vA = Vector(*self.beam_a.frame.xaxis)  # frame.axis gives a reference, not a copy
         vB = Vector(*self.beam_b.frame.xaxis)
 
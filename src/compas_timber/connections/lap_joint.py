@@ -8,7 +8,7 @@ from compas.geometry import angle_vectors
 from compas.geometry import intersection_line_plane
 from compas.geometry import intersection_plane_plane_plane
 
-from .joint import beam_side_incidence
+from .joint import beam_side_incidence_angles
 from .joint import Joint
 
 
@@ -45,6 +45,16 @@ class LapJoint(Joint):
 
     """
 
+    # faces of the hexahedron created from the 8 intersection points of `_create_polyhedron`
+    NEGATIVE_VOLUME_FACES = (
+        (1, 7, 5, 3),  # top
+        (0, 2, 4, 6),  # bottom
+        (1, 3, 2, 0),  # left
+        (3, 5, 4, 2),  # back
+        (5, 7, 6, 4),  # right
+        (7, 1, 0, 6),  # front
+    )
+
     def __init__(self, main_beam=None, cross_beam=None, flip_lap_side=False, cut_plane_bias=0.5, frame=None, key=None):
         super(LapJoint, self).__init__(frame=frame, key=key)
         self.main_beam = main_beam
@@ -118,30 +128,32 @@ class LapJoint(Joint):
             int_points = b, a, d, c, f, e, h, g
 
         # Step 3: Create a Hexahedron with 6 Faces from the 8 Points
-        return Polyhedron(
-            int_points,
-            [
-                [1, 7, 5, 3],  # top
-                [0, 2, 4, 6],  # bottom
-                [1, 3, 2, 0],  # left
-                [3, 5, 4, 2],  # back
-                [5, 7, 6, 4],  # right
-                [7, 1, 0, 6],  # front
-            ],
-        )
+        return Polyhedron(int_points, [list(face) for face in LapJoint.NEGATIVE_VOLUME_FACES])
+
+    def _get_geometry_key(self):
+        return super(LapJoint, self)._get_geometry_key() + (self.flip_lap_side, self.cut_plane_bias)
 
     def get_main_cutting_frame(self):
-        angles_faces = beam_side_incidence(self.beams[0], self.beams[1])
-        cfr = max(angles_faces, key=lambda x: x[0])[1]
+        return self._cached_geometry("main_cutting_frame", self._calculate_main_cutting_frame)
+
+    def get_cross_cutting_frame(self):
+        return self._cached_geometry("cross_cutting_frame", self._calculate_cross_cutting_frame)
+
+    def _create_negative_volumes(self):
+        return self._cached_geometry("negative_volumes", self._calculate_negative_volumes)
+
+    def _calculate_main_cutting_frame(self):
+        angles = beam_side_incidence_angles(self.main_beam, self.cross_beam)
+        cfr = self.cross_beam.face_frame(angles.index(max(angles)))
         cfr = Frame(cfr.point, cfr.yaxis, cfr.xaxis)  # flip normal towards the inside of main beam
         return cfr
 
-    def get_cross_cutting_frame(self):
-        angles_faces = beam_side_incidence(self.beams[1], self.beams[0])
-        cfr = max(angles_faces, key=lambda x: x[0])[1]
+    def _calculate_cross_cutting_frame(self):
+        angles = beam_side_incidence_angles(self.cross_beam, self.main_beam)
+        cfr = self.main_beam.face_frame(angles.index(max(angles)))
         return cfr
 
-    def _create_negative_volumes(self):
+    def _calculate_negative_volumes(self):
         # Get Cut Plane
         plane_cut_vector = self.beams[0].centerline.vector.cross(self.beams[1].centerline.vector)
 
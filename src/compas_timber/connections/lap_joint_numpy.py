@@ -0,0 +1,139 @@
+import numpy as np
+from compas.geometry import Polyhedron
+
+from .lap_joint import LapJoint
+
+
+def _sorted_side_planes(normals, origins, vectors):
+    # Sorts the Beam Face Planes according to the Cut Plane, same as `LapJoint._sort_beam_planes`
+    lengths = np.linalg.norm(vectors, axis=1)[:, np.newaxis]
+    cosines = np.einsum("nij,nj->ni", normals, vectors) / lengths
+    angles = np.arccos(np.clip(cosines, -1.0, 1.0))
+    order = np.argsort(angles, axis=1, kind="stable")
+    normals = np.take_along_axis(normals, order[:, :, np.newaxis], axis=1)
+    origins = np.take_along_axis(origins, order[:, :, np.newaxis], axis=1)
+    return normals, origins
+
+
+def _polyhedron_vertices(tops, bottoms):
+    # Interleaves top and bottom points as in `LapJoint._create_polyhedron` and fixes the orientation
+    vertices = np.empty((tops.shape[0], 8, 3))
+    vertices[:, 0::2] = tops
+    vertices[:, 1::2] = bottoms
+
+    test_face_normal = np.cross(vertices[:, 2] - vertices[:, 0], vertices[:, 6] - vertices[:, 0])
+    check_vector = vertices[:, 1] - vertices[:, 0]
+    with np.errstate(invalid="ignore", divide="ignore"):  # degenerate volumes of invalid joints
+        cosines = np.einsum("ij,ij->i", test_face_normal, check_vector)
+        cosines /= np.linalg.norm(test_face_normal, axis=1) * np.linalg.norm(check_vector, axis=1)
+        flip = cosines > np.cos(1.0)
+
+    flipped = vertices[flip]
+    vertices[flip, 0::2] = flipped[:, 1::2]
+    vertices[flip, 1::2] = flipped[:, 0::2]
+    return vertices
+
+
+def lap_negative_volumes_numpy(joints, tol=1e-9):
+    """Computes the vertices of the negative volumes of many lap joints at once.
+
+    This is a batched version of `LapJoint._create_negative_volumes`. All plane-plane-plane intersections
+    of all joints are solved as a single stack of 3x3 linear systems.
+
+    The vertices are ordered such that :attr:`~compas_timber.connections.LapJoint.NEGATIVE_VOLUME_FACES`
+    can be used as the faces of each volume.
+
+    Parameters
+    ----------
+    joints : list(:class:`~compas_timber.connections.LapJoint`)
+        The lap joints for which to calculate the negative volumes.
+    tol : float, optional
+        Joints whose beams are parallel or whose planes intersect at a degenerate angle within this tolerance
+        are reported as invalid.
+
+    Returns
+    -------
+    tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        Vertices of the negative volumes of the main beams, shape (n, 8, 3),
+        vertices of the negative volumes of the cross beams, shape (n, 8, 3),
+        and a boolean mask of shape (n,) which is False for joints for which no volumes could be calculated.
+        The vertices of invalid joints are set to NaN.
+
+    """
+    n = len(joints)
+    main_normals = np.array([joint.main_beam.face_normals[:4] for joint in joints], dtype=float).reshape((n, 4, 3))
+    main_origins = np.array([joint.main_beam.face_origins[:4] for joint in joints], dtype=float).reshape((n, 4, 3))
+    cross_normals = np.array([joint.cross_beam.face_normals[:4] for joint in joints], dtype=float).reshape((n, 4, 3))
+    cross_origins = np.array([joint.cross_beam.face_origins[:4] for joint in joints], dtype=float).reshape((n, 4, 3))
+    main_vectors = np.array([joint.main_beam.frame.xaxis for joint in joints], dtype=float).reshape((n, 3))
+    cross_vectors = np.array([joint.cross_beam.frame.xaxis for joint in joints], dtype=float).reshape((n, 3))
+    flip = np.array([joint.flip_lap_side for joint in joints], dtype=bool)
+    bias = np.array([joint.cut_plane_bias for joint in joints], dtype=float).reshape((n, 1, 1))
+
+    # Get Cut Plane
+    cut_vectors = np.cross(main_vectors, cross_vectors)
+    cut_vectors[flip] *= -1.0
+    valid = np.linalg.norm(cut_vectors, axis=1) > tol
+    cut_vectors[~valid] = [0.0, 0.0, 1.0]
+
+    # Get Beam Faces (Planes) in right order
+    main_normals, main_origins = _sorted_side_planes(main_normals, main_origins, cut_vectors)
+    cross_normals, cross_origins = _sorted_side_planes(cross_normals, cross_origins, -cut_vectors)
+    main_offsets = np.einsum("nij,nij->ni", main_normals, main_origins)
+    cross_offsets = np.einsum("nij,nij->ni", cross_normals, cross_origins)
+
+    # Lines as Frame Intersections, 4 lines from plane a0 to plane b0 for each joint
+    side_pairs = ((1, 1), (1, 2), (2, 2), (2, 1))
+    systems = np.empty((n, 4, 2, 3, 3))
+    offsets = np.empty((n, 4, 2, 3))
+    end_planes = ((main_normals[:, 0], main_offsets[:, 0]), (cross_normals[:, 0], cross_offsets[:, 0]))
+    for line, (ia, ib) in enumerate(side_pairs):
+        for end, (end_normals, end_offsets) in enumerate(end_planes):
+            systems[:, line, end, 0] = main_normals[:, ia]
+            systems[:, line, end, 1] = cross_normals[:, ib]
+            systems[:, line, end, 2] = end_normals
+            offsets[:, line, end, 0] = main_offsets[:, ia]
+            offsets[:, line, end, 1] = cross_offsets[:, ib]
+            offsets[:, line, end, 2] = end_offsets
+
+    valid &= np.all(np.abs(np.linalg.det(systems)) > tol, axis=(1, 2))
+    systems[~valid] = np.eye(3)
+    points = np.linalg.solve(systems, offsets[..., np.newaxis])[..., 0]
+    points_a = points[:, :, 0]
+    points_b = points[:, :, 1]
+    points_bias = points_a + (points_b - points_a) * bias
+
+    # Create Polyhedrons
+    main_vertices = _polyhedron_vertices(points_a, points_bias)
+    cross_vertices = _polyhedron_vertices(points_b, points_bias)
+    main_vertices[~valid] = np.nan
+    cross_vertices[~valid] = np.nan
+    return main_vertices, cross_vertices, valid
+
+
+def lap_negative_polyhedrons_numpy(joints, tol=1e-9):
+    """Creates the negative volumes of many lap joints at once.
+
+    Parameters
+    ----------
+    joints : list(:class:`~compas_timber.connections.LapJoint`)
+        The lap joints for which to create the negative volumes.
+    tol : float, optional
+        See :func:`~compas_timber.connections.lap_negative_volumes_numpy`.
+
+    Returns
+    -------
+    list(tuple(:class:`~compas.geometry.Polyhedron`, :class:`~compas.geometry.Polyhedron`) | None)
+        For each joint, the negative volumes of its main beam and its cross beam.
+        None for joints for which no volumes could be calculated.
+
+    """
+    main_vertices, cross_vertices, valid = lap_negative_volumes_numpy(joints, tol=tol)
+    faces = [list(face) for face in LapJoint.NEGATIVE_VOLUME_FACES]
+    result = []
+    for main, cross, is_valid in zip(main_vertices.tolist(), cross_vertices.tolist(), valid.tolist()):
+        if not is_valid:
+            result.append(None)
+            continue
+        result.append((Polyhedron(main, faces), Polyhedron(cross, faces)))
+    return result
@@ -12,6 +12,8 @@ from compas.geometry import scale_vector
 from compas.geometry import subtract_vectors
 from compas.plugins import pluggable
 
+from compas_timber.utils import profiled
+
 
 @pluggable(category="solvers")
 def find_neighboring_beams(beams, inflate_by=None):
@@ -109,6 +111,7 @@ class ConnectionSolver(object):
         """
         return find_neighboring_beams(beams, inflate_by=max_distance) if rtree else itertools.combinations(beams, 2)
 
+    @profiled("ConnectionSolver.find_topology", "solver")
     def find_topology(self, beam_a, beam_b, tol=TOLERANCE, max_distance=None):
         """If `beam_a` and `beam_b` intersect within the given `max_distance`, return the topology type of the intersection.
 
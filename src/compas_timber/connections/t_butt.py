@@ -4,7 +4,7 @@ from compas_timber.parts import CutFeature
 
 from .joint import BeamJoinningError
 from .joint import Joint
-from .joint import beam_side_incidence
+from .joint import beam_side_incidence_angles
 from .solver import JointTopology
 
 
@@ -29,10 +29,8 @@ class TButtJoint(Joint):
     ----------
     beams : list(:class:`~compas_timber.parts.Beam`)
         The beams joined by this joint.
-    cutting_plane_main : :class:`~compas.geometry.Frame`
+    cutting_plane : :class:`~compas.geometry.Frame`
         The frame by which the main beam is trimmed.
-    cutting_plane_cross : :class:`~compas.geometry.Frame`
-        The frame by which the cross beam is trimmed.
     joint_type : str
         A string representation of this joint's type.
 
@@ -74,9 +72,16 @@ class TButtJoint(Joint):
     def joint_type(self):
         return "T-Butt"
 
+    @property
+    def cutting_plane(self):
+        return self.get_cutting_plane()
+
     def get_cutting_plane(self):
-        angles_faces = beam_side_incidence(self.main_beam, self.cross_beam)
-        cfr = min(angles_faces, key=lambda x: x[0])[1]
+        return self._cached_geometry("cutting_plane", self._calculate_cutting_plane)
+
+    def _calculate_cutting_plane(self):
+        angles = beam_side_incidence_angles(self.main_beam, self.cross_beam)
+        cfr = self.cross_beam.face_frame(angles.index(min(angles)))
         cfr = Frame(cfr.point, cfr.yaxis, cfr.xaxis)  # flip normal towards the inside of main beam
         return cfr
 
@@ -1,13 +1,31 @@
+import compas
+
 from .geometry import BeamGeometry
 from .geometry import BrepGeometryConsumer
 from .geometry import FeatureApplicationError
 from .geometry import FeatureApplicator
+from .geometry import FeatureApplicationStats
 from .geometry import CutFeature
 from .geometry import CutFeatureGeometry
 from .geometry import MillVolume
 from .geometry import MillVolumeGeometry
 from .geometry import DrillFeature
 from .geometry import DrillFeatureGeometry
+from .geometry import MillVolumeUnionGeometry
+from .geometry import volume_intersects_box
+from .lod import LOD
+from .lod import LODPolicy
+from .lod import DistanceLODPolicy
+from .lod import ScreenSizeLODPolicy
+from .optimize import MillVolumeUnion
+from .optimize import optimize_features
+
+if not compas.IPY:
+    from .convex_numpy import ConvexGeometryConsumer
+    from .convex_numpy import ConvexPolyhedron
+    from .convex_numpy import CutFeatureConvexGeometry
+    from .mesh_numpy import MeshGeometryConsumer
+    from .mesh_numpy import convex_remainder_plane
 
 
 __all__ = [
@@ -15,10 +33,28 @@ __all__ = [
     "BeamGeometry",
     "FeatureApplicationError",
     "FeatureApplicator",
+    "FeatureApplicationStats",
     "CutFeature",
     "CutFeatureGeometry",
     "MillVolume",
     "MillVolumeGeometry",
     "DrillFeature",
     "DrillFeatureGeometry",
+    "LOD",
+    "LODPolicy",
+    "DistanceLODPolicy",
+    "ScreenSizeLODPolicy",
+    "MillVolumeUnion",
+    "MillVolumeUnionGeometry",
+    "optimize_features",
+    "volume_intersects_box",
 ]
+
+if not compas.IPY:
+    __all__ += [
+        "ConvexGeometryConsumer",
+        "ConvexPolyhedron",
+        "CutFeatureConvexGeometry",
+        "MeshGeometryConsumer",
+        "convex_remainder_plane",
+    ]
@@ -0,0 +1,300 @@
+import numpy as np
+from compas.datastructures import Mesh
+from compas.geometry import Brep
+
+from compas_timber.parts import CutFeature
+from compas_timber.utils import profile_count
+from compas_timber.utils import profile_span
+
+from .geometry import BeamGeometry
+from .geometry import FeatureApplicationError
+from .geometry import FeatureApplicator
+from .lod import LOD
+
+
+class ConvexPolyhedron(object):
+    """A convex polyhedron described by its planar faces, which can be trimmed with planes without a boolean kernel.
+
+    The polyhedron is a light-weight preview of a beam whose features are all planar cuts.
+    Conversion to :class:`~compas.datastructures.Mesh` or :class:`~compas.geometry.Brep` only happens on request.
+
+    Parameters
+    ----------
+    faces : list(:class:`numpy.ndarray`)
+        The vertices of each face, shape (k, 3), ordered counter-clockwise when seen from the outside.
+
+    Attributes
+    ----------
+    faces : list(:class:`numpy.ndarray`)
+        The vertices of each face.
+    is_empty : bool
+        True if nothing is left of the polyhedron.
+
+    """
+
+    def __init__(self, faces):
+        self.faces = faces
+
+    @classmethod
+    def from_box(cls, box):
+        """Creates a polyhedron from a box, e.g. the blank of a beam.
+
+        Parameters
+        ----------
+        box : :class:`~compas.geometry.Box`
+
+        Returns
+        -------
+        :class:`~compas_timber.consumers.ConvexPolyhedron`
+
+        """
+        vertices, faces = box.to_vertices_and_faces()
+        vertices = np.array(vertices, dtype=float)
+        return cls([vertices[face] for face in faces])
+
+    @property
+    def is_empty(self):
+        return len(self.faces) < 4
+
+    def trimmed(self, plane, tol=1e-9):
+        """Returns the part of this polyhedron behind the plane, on the side opposite to its normal.
+
+        This is the part kept by :meth:`compas.geometry.Brep.trimmed` and by the cutting planes of the joints.
+
+        Parameters
+        ----------
+        plane : :class:`~compas.geometry.Plane` | :class:`~compas.geometry.Frame`
+            The plane to trim with. A frame is used as the plane of its origin and normal.
+        tol : float, optional
+            Vertices closer to the plane than this are considered to be on the plane.
+
+        Returns
+        -------
+        :class:`~compas_timber.consumers.ConvexPolyhedron`
+            The trimmed polyhedron, which is empty if the polyhedron is entirely in front of the plane.
+
+        """
+        origin = np.array(plane.point, dtype=float)
+        # the kept side is in front of the flipped normal
+        normal = -np.array(plane.normal, dtype=float)
+        normal /= np.linalg.norm(normal)
+
+        # distances of all vertices of all faces at once
+        counts = [len(face) for face in self.faces]
+        distances = np.split(np.dot(np.concatenate(self.faces) - origin, normal), np.cumsum(counts)[:-1])
+
+        faces = []
+        cap = []
+        for face, distance in zip(self.faces, distances):
+            if np.all(distance >= -tol):
+                faces.append(face)
+                cap.extend(face[np.abs(distance) <= tol])
+                continue
+            if np.all(distance <= tol):
+                cap.extend(face[np.abs(distance) <= tol])
+                continue
+            clipped, on_plane = _clip_polygon(face, distance, tol)
+            faces.append(clipped)
+            cap.extend(on_plane)
+
+        cap_face = _order_cap(cap, -normal, tol)
+        if cap_face is not None:
+            faces.append(cap_face)
+        return ConvexPolyhedron(faces)
+
+    def to_vertices_and_faces(self, precision=6):
+        """Returns the vertices and faces of this polyhedron, with shared vertices merged.
+
+        Parameters
+        ----------
+        precision : int, optional
+            Vertices which are equal when rounded to this number of decimals are merged.
+
+        Returns
+        -------
+        tuple(:class:`numpy.ndarray`, list(list(int)))
+            The vertices, shape (n, 3), and the vertex indices of each face.
+
+        """
+        if self.is_empty:
+            return np.zeros((0, 3)), []
+        points = np.concatenate(self.faces)
+        # +0.0 turns -0.0 into 0.0 so that both are merged
+        _, first, inverse = np.unique(np.round(points, precision) + 0.0, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        vertices = points[first]
+
+        faces = []
+        start = 0
+        for face in self.faces:
+            indices = []
+            for index in inverse[start : start + len(face)].tolist():
+                if index not in indices:
+                    indices.append(index)
+            start += len(face)
+            if len(indices) > 2:
+                faces.append(indices)
+        return vertices, faces
+
+    def to_mesh(self):
+        """Converts this polyhedron to a mesh.
+
+        Returns
+        -------
+        :class:`~compas.datastructures.Mesh`
+
+        """
+        vertices, faces = self.to_vertices_and_faces()
+        return Mesh.from_vertices_and_faces(vertices.tolist(), faces)
+
+    def to_brep(self):
+        """Converts this polyhedron to a Brep, this requires a Brep backend.
+
+        Returns
+        -------
+        :class:`~compas.geometry.Brep`
+
+        """
+        return Brep.from_mesh(self.to_mesh())
+
+
+def _clip_polygon(face, distance, tol):
+    # keeps the part of a polygon in front of the plane, returns it with the points of it which lie on the plane
+    following = np.roll(distance, -1)
+    crossing = ((distance > tol) & (following < -tol)) | ((distance < -tol) & (following > tol))
+    with np.errstate(divide="ignore", invalid="ignore"):  # only the intersections of crossing edges are used
+        t = distance / (distance - following)
+        intersections = face + t[:, np.newaxis] * (np.roll(face, -1, axis=0) - face)
+
+    points = []
+    on_plane = []
+    for index in range(len(face)):
+        if distance[index] >= -tol:
+            points.append(face[index])
+            if distance[index] <= tol:
+                on_plane.append(face[index])
+        if crossing[index]:
+            points.append(intersections[index])
+            on_plane.append(intersections[index])
+    return np.array(points), on_plane
+
+
+def _order_cap(points, normal, tol):
+    # orders the points of the new face on the plane counter-clockwise around its outward normal
+    if len(points) < 3:
+        return None
+    points = np.array(points)
+    _, first = np.unique(np.round(points / max(tol, 1e-12)), axis=0, return_index=True)
+    points = points[np.sort(first)]
+    if len(points) < 3:
+        return None
+
+    center = points.mean(axis=0)
+    u = points[0] - center
+    u -= np.dot(u, normal) * normal
+    if np.linalg.norm(u) <= tol:
+        return None
+    u /= np.linalg.norm(u)
+    v = np.cross(normal, u)
+    vectors = points - center
+    angles = np.arctan2(np.dot(vectors, v), np.dot(vectors, u))
+    return points[np.argsort(angles)]
+
+
+class CutFeatureConvexGeometry(FeatureApplicator):
+    """Applies CutFeature to the convex polyhedron of a beam.
+
+    Parameters
+    ----------
+    beam_geometry : :class:`~compas_timber.consumers.ConvexPolyhedron`
+        The geometry of the beam.
+    feature : :class:`~compas_timber.parts.CutFeature`
+        The feature to apply.
+
+    """
+
+    def __init__(self, beam_geometry, feature):
+        super(CutFeatureConvexGeometry, self).__init__()
+        self.cutting_plane = feature.cutting_plane
+        self.beam_geometry = beam_geometry
+
+    def apply(self):
+        """Apply the feature to the beam geometry.
+
+        Raises
+        ------
+        :class:`~compas_timber.consumers.FeatureApplicationError`
+            If nothing is left of the beam geometry after the cut.
+
+        Returns
+        -------
+        :class:`~compas_timber.consumers.ConvexPolyhedron`
+            The resulting geometry after processing.
+
+        """
+        result = self.beam_geometry.trimmed(self.cutting_plane)
+        if result.is_empty:
+            raise FeatureApplicationError(
+                self.cutting_plane,
+                self.beam_geometry,
+                "The cutting plane does not intersect with beam geometry.",
+            )
+        return result
+
+
+class ConvexGeometryConsumer(object):
+    """A consumer that applies the cuts of beams to their blanks analytically and yields convex polyhedra.
+
+    Beams with features other than :class:`~compas_timber.parts.CutFeature` are yielded with their cuts applied
+    and a :class:`~compas_timber.consumers.FeatureApplicationError` listing the features which were not applied.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_timber.assembly.TimberAssembly`
+        The assembly to consume.
+    lod : int | :class:`~compas_timber.consumers.LODPolicy`, optional
+        The level of detail of the geometry, one of :class:`~compas_timber.consumers.LOD`, or a policy which picks
+        it for each beam.
+
+    Attributes
+    ----------
+    result : generator(:class:`~compas_timber.consumers.BeamGeometry`)
+        The resulting :class:`~compas_timber.consumers.ConvexPolyhedron` of each beam.
+
+    """
+
+    def __init__(self, assembly, lod=LOD.FULL):
+        self.assembly = assembly
+        self.lod = lod
+
+    @property
+    def result(self):
+        for beam in self.assembly.beams:
+            lod = LOD.resolve(self.lod, beam)
+            geometry = ConvexPolyhedron.from_box(LOD.box(beam, lod))
+            debug_info = None
+            try:
+                geometry = self._apply_cuts(geometry, LOD.filter_features(beam.features, lod))
+            except FeatureApplicationError as error:
+                geometry = error.beam_geometry
+                debug_info = error
+            yield BeamGeometry(beam, geometry, debug_info)
+
+    def _apply_cuts(self, geometry, features):
+        skipped = []
+        for feature in features:
+            if not isinstance(feature, CutFeature):
+                skipped.append(feature)
+                continue
+            with profile_span("CutFeatureConvexGeometry.apply", "features"):
+                geometry = CutFeatureConvexGeometry(geometry, feature).apply()
+            profile_count("features")
+        if skipped:
+            raise FeatureApplicationError(
+                skipped,
+                geometry,
+                "Only cut features can be applied to convex geometry, skipped: {}".format(
+                    ", ".join(type(feature).__name__ for feature in skipped)
+                ),
+            )
+        return geometry
@@ -1,11 +1,22 @@
 from compas.geometry import Brep
+from compas.geometry import BrepError
 from compas.geometry import Cylinder
 from compas.geometry import Frame
 from compas.geometry import Plane
+from compas.geometry import dot_vectors
+from compas.geometry import subtract_vectors
+from compas.plugins import PluginNotInstalledError
 
 from compas_timber.parts import CutFeature
 from compas_timber.parts import DrillFeature
 from compas_timber.parts import MillVolume
+from compas_timber.utils import profile_count
+from compas_timber.utils import profile_span
+from compas_timber.utils import profiled
+
+from .lod import LOD
+from .optimize import MillVolumeUnion
+from .optimize import optimize_features
 
 
 class FeatureApplicationError(Exception):
@@ -29,7 +40,34 @@ class FeatureApplicationError(Exception):
 
 
 class FeatureApplicator(object):
-    """Base class for feature applicators."""
+    """Base class for feature applicators.
+
+    Attributes
+    ----------
+    tools : list(:class:`compas.geometry.Brep`)
+        The bodies subtracted from the beam geometry by subtractive features, empty for other features.
+
+    """
+
+    @property
+    def tools(self):
+        return []
+
+    @classmethod
+    def tool_volume(cls, feature):
+        """Returns a light-weight volume of the tool of a feature, for culling before any Brep is created.
+
+        Parameters
+        ----------
+        feature : :class:`~compas_timber.parts.Feature`
+
+        Returns
+        -------
+        :class:`compas.geometry.Geometry` | list(:class:`compas.geometry.Geometry`) | None
+            The volume, or None if the feature is not subtractive.
+
+        """
+        return None
 
     def apply(self):
         """Apply the feature to the beam geometry.
@@ -62,6 +100,21 @@ class DrillFeatureGeometry(FeatureApplicator):
         self.length = feature.length
         self.beam_geometry = beam_geometry
 
+    @property
+    def drill_volume(self):
+        """:class:`compas.geometry.Cylinder`: The volume removed by the drill."""
+        plane = Plane(point=self.line.start, normal=self.line.vector)
+        plane.point += plane.normal * 0.5 * self.length
+        return Cylinder(frame=Frame.from_plane(plane), radius=self.diameter / 2.0, height=self.length)
+
+    @property
+    def tools(self):
+        return [Brep.from_cylinder(self.drill_volume)]
+
+    @classmethod
+    def tool_volume(cls, feature):
+        return cls(None, feature).drill_volume
+
     def apply(self):
         """Apply the feature to the beam geometry.
 
@@ -76,9 +129,7 @@ class DrillFeatureGeometry(FeatureApplicator):
             The resulting geometry after processing.
 
         """
-        plane = Plane(point=self.line.start, normal=self.line.vector)
-        plane.point += plane.normal * 0.5 * self.length
-        drill_volume = Cylinder(frame=Frame.from_plane(plane), radius=self.diameter / 2.0, height=self.length)
+        drill_volume = self.drill_volume
 
         try:
             return self.beam_geometry - Brep.from_cylinder(drill_volume)
@@ -149,6 +200,14 @@ class MillVolumeGeometry(FeatureApplicator):
         self.volume = Brep.from_mesh(feature.volume)
         self.beam_geometry = beam_geometry
 
+    @property
+    def tools(self):
+        return [self.volume]
+
+    @classmethod
+    def tool_volume(cls, feature):
+        return feature.volume
+
     def apply(self):
         """Apply the feature to the beam geometry.
 
@@ -173,6 +232,212 @@ class MillVolumeGeometry(FeatureApplicator):
             )
 
 
+class MillVolumeUnionGeometry(FeatureApplicator):
+    """Applies MillVolumeUnion to beam geometry, the volumes are united before they are subtracted.
+
+    Volumes which don't touch remain separate bodies of the union, each body is subtracted.
+
+    Parameters
+    ----------
+    beam_geometry : :class:`compas.geometry.Brep`
+        The geometry of the beam.
+    feature : :class:`compas_timber.consumers.MillVolumeUnion`
+        The feature to apply.
+
+    """
+
+    def __init__(self, beam_geometry, feature):
+        super(MillVolumeUnionGeometry, self).__init__()
+        self.volumes = [Brep.from_mesh(mill_volume.volume) for mill_volume in feature.features]
+        self.beam_geometry = beam_geometry
+        self._bodies = None
+
+    @property
+    def bodies(self):
+        """list(:class:`compas.geometry.Brep`): The bodies of the union of the mill volumes."""
+        if self._bodies is None:
+            self._bodies = []
+            for volume in self.volumes:
+                for body in list(self._bodies):
+                    united = Brep.from_boolean_union(body, volume)
+                    if not isinstance(united, list):
+                        united = [united]
+                    if len(united) == 1:
+                        self._bodies.remove(body)
+                        volume = united[0]
+                self._bodies.append(volume)
+        return self._bodies
+
+    @property
+    def tools(self):
+        # a compound difference does not need the union
+        return list(self.volumes)
+
+    @classmethod
+    def tool_volume(cls, feature):
+        return [mill_volume.volume for mill_volume in feature.features]
+
+    def apply(self):
+        """Apply the feature to the beam geometry.
+
+        Raises
+        ------
+        :class:`compas_timber.consumers.FeatureApplicationError`
+            If the volume does not intersect with the beam geometry.
+
+        Returns
+        -------
+        :class:`compas.geometry.Brep`
+            The resulting geometry after processing.
+
+        """
+        geometry = self.beam_geometry
+        try:
+            for body in self.bodies:
+                geometry = geometry - body
+        except IndexError:
+            raise FeatureApplicationError(
+                self.volumes,
+                self.beam_geometry,
+                "The volume does not intersect with beam geometry.",
+            )
+        return geometry
+
+
+def volume_intersects_box(volume, box, tol=1e-6):
+    """Checks if a volume may intersect with a box, without a Brep backend.
+
+    The corners of the oriented bounding box of a cylinder, or the vertices of other volumes, are compared
+    with the extents of the box along its axes. The test is conservative, volumes close to an edge of the box
+    may be reported as intersecting although they are not.
+
+    Parameters
+    ----------
+    volume : :class:`compas.geometry.Cylinder` | :class:`compas.geometry.Polyhedron` | list
+        The volume, a mesh, or a list of volumes of which any may intersect.
+    box : :class:`compas.geometry.Box`
+        The box, e.g. the blank of a beam.
+    tol : float, optional
+        The distance by which the box is enlarged.
+
+    Returns
+    -------
+    bool
+        False if the volume is certainly outside of the box.
+
+    """
+    if isinstance(volume, list):
+        return any(volume_intersects_box(item, box, tol) for item in volume)
+    if isinstance(volume, Cylinder):
+        frame = volume.frame
+        points = []
+        for x in (-volume.radius, volume.radius):
+            for y in (-volume.radius, volume.radius):
+                for z in (-0.5 * volume.height, 0.5 * volume.height):
+                    points.append(frame.point + frame.xaxis * x + frame.yaxis * y + frame.zaxis * z)
+    else:
+        points, _ = volume.to_vertices_and_faces()
+
+    origin = box.frame.point
+    for axis, size in zip((box.frame.xaxis, box.frame.yaxis, box.frame.zaxis), (box.xsize, box.ysize, box.zsize)):
+        coordinates = [dot_vectors(subtract_vectors(point, origin), axis) for point in points]
+        if min(coordinates) > 0.5 * size + tol or max(coordinates) < -0.5 * size - tol:
+            return False
+    return True
+
+
+# errors of a compound difference after which the tools are subtracted one at a time, backends which only accept
+# a single tool raise a TypeError or AttributeError for the list of tools
+_COMPOUND_ERRORS = (BrepError, IndexError, NotImplementedError, PluginNotInstalledError, TypeError, AttributeError)
+
+
+class FeatureApplicationStats(object):
+    """Statistics of the features applied by a geometry consumer.
+
+    Attributes
+    ----------
+    applied : int
+        The number of features which were applied.
+    culled : int
+        The number of features whose tool does not intersect with the beam, they are reported without a boolean.
+    failed : int
+        The number of features which failed to apply.
+    culled_errors : list(:class:`~compas_timber.consumers.FeatureApplicationError`)
+        The errors of the culled features.
+    by_feature_type : dict(str, dict(str, int))
+        The number of applied, culled and failed features of each feature type.
+    compound_fallbacks : int
+        The number of beams whose compound boolean difference failed, their features were subtracted one by one.
+    compound_errors : list(Exception)
+        The errors raised by the failed compound boolean differences.
+
+    """
+
+    def __init__(self):
+        self.applied = 0
+        self.culled = 0
+        self.failed = 0
+        self.culled_errors = []
+        self.by_feature_type = {}
+        self.compound_fallbacks = 0
+        self.compound_errors = []
+
+    def add(self, feature, outcome, count=1):
+        """Counts features of the type of `feature` as applied, culled or failed.
+
+        A :class:`~compas_timber.consumers.MillVolumeUnion` is counted as the mill volumes it replaces.
+
+        Parameters
+        ----------
+        feature : :class:`~compas_timber.parts.Feature`
+            The feature, or one of the features, which are counted.
+        outcome : str
+            One of ["applied", "culled", "failed"].
+        count : int, optional
+            The number of features.
+
+        """
+        if isinstance(feature, MillVolumeUnion) and feature.features:
+            count *= len(feature.features)
+            feature = feature.features[0]
+        setattr(self, outcome, getattr(self, outcome) + count)
+        name = type(feature).__name__
+        if name not in self.by_feature_type:
+            self.by_feature_type[name] = {"applied": 0, "culled": 0, "failed": 0}
+        self.by_feature_type[name][outcome] += count
+
+    def failure_rate(self, feature_type=None):
+        """Returns the fraction of the attempted booleans which failed.
+
+        Culled features are not attempted.
+
+        Parameters
+        ----------
+        feature_type : str, optional
+            The name of a feature type, e.g. "DrillFeature". Defaults to all features.
+
+        Returns
+        -------
+        float
+
+        """
+        if feature_type is None:
+            applied, failed = self.applied, self.failed
+        else:
+            counts = self.by_feature_type.get(feature_type, {})
+            applied, failed = counts.get("applied", 0), counts.get("failed", 0)
+        attempted = applied + failed
+        return float(failed) / attempted if attempted else 0.0
+
+    def __repr__(self):
+        return "{}({} applied, {} culled, {} failed, {} compound fallbacks)".format(
+            FeatureApplicationStats.__name__, self.applied, self.culled, self.failed, self.compound_fallbacks
+        )
+
+    def ToString(self):
+        return repr(self)
+
+
 class BeamGeometry(object):
     """A data class containing the result of applying features to a beam.
 
@@ -200,6 +465,16 @@ class BrepGeometryConsumer(object):
     ----------
     assembly : :class:`~compas_timber.assembly.Assembly`
         The assembly to consume.
+    lod : int | :class:`~compas_timber.consumers.LODPolicy`, optional
+        The level of detail of the geometry, one of :class:`~compas_timber.consumers.LOD`, or a policy which picks
+        it for each beam. Features which are not applied at the level of detail of a beam are skipped.
+    optimize : bool, optional
+        If True, the features of each beam are prepared with :func:`~compas_timber.consumers.optimize_features`
+        to be applied with fewer booleans. Defaults to False.
+    compound : bool, optional
+        If True, the tool bodies of all subtractive features of a beam are subtracted with a single boolean
+        difference. If the backend does not support this, or it fails, they are subtracted one by one.
+        Defaults to False.
 
     Attributes
     ----------
@@ -207,27 +482,62 @@ class BrepGeometryConsumer(object):
         A mapping of feature types to feature applicators.
     result : generator(:class:`~compas_timber.consumers.BeamGeometry`)
         The resulting geometry after processing.
+    stats : :class:`~compas_timber.consumers.FeatureApplicationStats`
+        The statistics of the features applied by the last iteration of `result`.
 
     """
 
-    FEATURE_MAP = {CutFeature: CutFeatureGeometry, DrillFeature: DrillFeatureGeometry, MillVolume: MillVolumeGeometry}
+    FEATURE_MAP = {
+        CutFeature: CutFeatureGeometry,
+        DrillFeature: DrillFeatureGeometry,
+        MillVolume: MillVolumeGeometry,
+        MillVolumeUnion: MillVolumeUnionGeometry,
+    }
 
-    def __init__(self, assembly):
+    def __init__(self, assembly, lod=LOD.FULL, optimize=False, compound=False):
         self.assembly = assembly
+        self.lod = lod
+        self.optimize = optimize
+        self.compound = compound
+        self.stats = FeatureApplicationStats()
 
     @property
     def result(self):
+        self.stats = FeatureApplicationStats()
         for beam in self.assembly.beams:
-            geometry = Brep.from_box(beam.blank)
+            lod = LOD.resolve(self.lod, beam)
+            box = LOD.box(beam, lod)
+            geometry = Brep.from_box(box)
+            features = LOD.filter_features(beam.features, lod)
+            if self.optimize:
+                features = optimize_features(features)
             debug_info = None
             try:
-                resulting_geometry = self._apply_features(geometry, beam.features)
+                self._cull_features(box, geometry, features)
+                resulting_geometry = self._apply_features(geometry, features)
             except FeatureApplicationError as error:
                 resulting_geometry = geometry
                 debug_info = error
             yield BeamGeometry(beam, resulting_geometry, debug_info)
 
+    def _cull_features(self, box, geometry, features):
+        errors = []
+        for feature in features:
+            cls = self.FEATURE_MAP.get(type(feature), None)
+            volume = cls.tool_volume(feature) if cls else None
+            if volume is None or volume_intersects_box(volume, box):
+                continue
+            errors.append(
+                FeatureApplicationError(volume, geometry, "The volume does not intersect with beam geometry.")
+            )
+            self.stats.add(feature, "culled")
+        if errors:
+            self.stats.culled_errors.extend(errors)
+            raise errors[0]
+
     def _apply_features(self, geometry, features):
+        # trims and subtractions commute, all trims are applied before the subtractions
+        subtractions = []
         for feature in features:
             cls = self.FEATURE_MAP.get(type(feature), None)
             if not cls:
@@ -235,5 +545,48 @@ class BrepGeometryConsumer(object):
             feature_applicator = cls(geometry, feature)
             if not feature_applicator:
                 continue
-            geometry = feature_applicator.apply()
+            if self.compound and cls.tool_volume(feature) is not None:
+                subtractions.append((feature, feature_applicator))
+                continue
+            geometry = self._apply(feature, feature_applicator)
+
+        if len(subtractions) > 1:
+            result = self._subtract_compound(geometry, [applicator for _, applicator in subtractions])
+            if result is not None:
+                for feature, _ in subtractions:
+                    self.stats.add(feature, "applied")
+                profile_count("features", len(subtractions))
+                return result
+        for feature, feature_applicator in subtractions:
+            feature_applicator.beam_geometry = geometry
+            geometry = self._apply(feature, feature_applicator)
+        return geometry
+
+    def _apply(self, feature, feature_applicator):
+        try:
+            with profile_span(type(feature_applicator).__name__ + ".apply", "features"):
+                geometry = feature_applicator.apply()
+        except FeatureApplicationError:
+            self.stats.add(feature, "failed")
+            raise
+        self.stats.add(feature, "applied")
+        profile_count("features")
         return geometry
+
+    @profiled("BrepGeometryConsumer.subtract_compound", "features")
+    def _subtract_compound(self, geometry, subtractions):
+        tools = []
+        for feature_applicator in subtractions:
+            tools.extend(feature_applicator.tools)
+        try:
+            results = Brep.from_boolean_difference(geometry, tools)
+        except _COMPOUND_ERRORS as error:
+            # the features are then subtracted one by one, which reports the feature which fails
+            self.stats.compound_fallbacks += 1
+            self.stats.compound_errors.append(error)
+            return None
+        if isinstance(results, list):
+            results = results[0] if results else None
+        if results is None:
+            self.stats.compound_fallbacks += 1
+        return results
@@ -0,0 +1,223 @@
+import math
+
+from compas.geometry import Box
+from compas.geometry import bounding_box
+from compas.geometry import distance_point_point
+
+from compas_timber.parts import CutFeature
+
+
+class LOD(object):
+    """Enumeration of the levels of detail of the geometry created by the geometry consumers.
+
+    Attributes
+    ----------
+    BOUNDING_BOX
+        The axis-aligned bounding box of the blank of the beam.
+    BLANK
+        The blank of the beam, no features are applied.
+    TRIMS
+        The blank of the beam trimmed by its cut features.
+    FULL
+        The blank of the beam with all of its features applied.
+
+    """
+
+    BOUNDING_BOX = 0
+    BLANK = 1
+    TRIMS = 2
+    FULL = 3
+
+    TRIM_FEATURES = (CutFeature,)
+
+    @classmethod
+    def get_name(cls, value):
+        """Returns the string representation of given level of detail.
+
+        Parameters
+        ----------
+        value : int
+            One of [LOD.BOUNDING_BOX, LOD.BLANK, LOD.TRIMS, LOD.FULL]
+
+        Returns
+        -------
+        str
+            One of ["BOUNDING_BOX", "BLANK", "TRIMS", "FULL"]
+
+        """
+        return {v: k for k, v in LOD.__dict__.items() if k.isupper() and isinstance(v, int)}[value]
+
+    @staticmethod
+    def resolve(lod, beam):
+        """Returns the level of detail of a beam.
+
+        Parameters
+        ----------
+        lod : int | :class:`~compas_timber.consumers.LODPolicy`
+            A level of detail, or a policy which picks the level of detail of each beam.
+        beam : :class:`~compas_timber.parts.Beam`
+
+        Returns
+        -------
+        int
+
+        """
+        if isinstance(lod, LODPolicy):
+            return lod.get_lod(beam)
+        return lod
+
+    @staticmethod
+    def box(beam, lod):
+        """Returns the box the geometry of a beam is created from at the given level of detail.
+
+        Parameters
+        ----------
+        beam : :class:`~compas_timber.parts.Beam`
+        lod : int
+
+        Returns
+        -------
+        :class:`~compas.geometry.Box`
+
+        """
+        if lod == LOD.BOUNDING_BOX:
+            vertices, _ = beam.blank.to_vertices_and_faces()
+            return Box.from_bounding_box(bounding_box(vertices))
+        return beam.blank
+
+    @staticmethod
+    def filter_features(features, lod):
+        """Returns the features which are applied at the given level of detail.
+
+        Parameters
+        ----------
+        features : list(:class:`~compas_timber.parts.Feature`)
+        lod : int
+
+        Returns
+        -------
+        list(:class:`~compas_timber.parts.Feature`)
+
+        """
+        if lod >= LOD.FULL:
+            return list(features)
+        if lod == LOD.TRIMS:
+            return [feature for feature in features if isinstance(feature, LOD.TRIM_FEATURES)]
+        return []
+
+
+class LODPolicy(object):
+    """Base class for policies which pick the level of detail of each beam."""
+
+    def get_lod(self, beam):
+        """Returns the level of detail of a beam.
+
+        Parameters
+        ----------
+        beam : :class:`~compas_timber.parts.Beam`
+
+        Returns
+        -------
+        int
+            One of the levels of :class:`~compas_timber.consumers.LOD`.
+
+        """
+        raise NotImplementedError
+
+
+class DistanceLODPolicy(LODPolicy):
+    """Picks the level of detail of each beam by its distance to the camera.
+
+    Parameters
+    ----------
+    camera_point : :class:`~compas.geometry.Point`
+        The location of the camera.
+    thresholds : list(tuple(float, int))
+        Pairs of a maximum distance and the level of detail used up to this distance.
+    default : int, optional
+        The level of detail of beams farther away than all thresholds.
+
+    Examples
+    --------
+    >>> policy = DistanceLODPolicy([0, 0, 0], [(10.0, LOD.FULL), (50.0, LOD.TRIMS), (200.0, LOD.BLANK)])
+
+    """
+
+    def __init__(self, camera_point, thresholds, default=LOD.BOUNDING_BOX):
+        super(DistanceLODPolicy, self).__init__()
+        self.camera_point = camera_point
+        self.thresholds = sorted(thresholds)
+        self.default = default
+
+    def get_lod(self, beam):
+        distance = distance_point_point(self.camera_point, beam.blank.frame.point)
+        for threshold, lod in self.thresholds:
+            if distance <= threshold:
+                return lod
+        return self.default
+
+
+class ScreenSizeLODPolicy(LODPolicy):
+    """Picks the level of detail of each beam by the size of the beam on the screen.
+
+    The size on the screen is the height in pixels of the sphere around the blank of the beam, seen from the camera.
+    Unlike distances, it does not depend on the units of the model.
+
+    Parameters
+    ----------
+    camera_point : :class:`~compas.geometry.Point`
+        The location of the camera.
+    thresholds : list(tuple(float, int)), optional
+        Pairs of a minimum size in pixels and the level of detail used from this size on.
+    field_of_view : float, optional
+        The vertical field of view of the camera in radians.
+    viewport_height : int, optional
+        The height of the viewport in pixels.
+    default : int, optional
+        The level of detail of beams smaller than all thresholds.
+
+    """
+
+    DEFAULT_THRESHOLDS = [(200.0, LOD.FULL), (50.0, LOD.TRIMS), (5.0, LOD.BLANK)]
+
+    def __init__(
+        self,
+        camera_point,
+        thresholds=None,
+        field_of_view=math.radians(50.0),
+        viewport_height=1080,
+        default=LOD.BOUNDING_BOX,
+    ):
+        super(ScreenSizeLODPolicy, self).__init__()
+        self.camera_point = camera_point
+        self.thresholds = sorted(thresholds or self.DEFAULT_THRESHOLDS, reverse=True)
+        self.field_of_view = field_of_view
+        self.viewport_height = viewport_height
+        self.default = default
+
+    def screen_size(self, beam):
+        """Returns the size of a beam on the screen.
+
+        Parameters
+        ----------
+        beam : :class:`~compas_timber.parts.Beam`
+
+        Returns
+        -------
+        float
+            The size in pixels, infinite if the camera is inside the sphere around the blank of the beam.
+
+        """
+        blank = beam.blank
+        radius = 0.5 * blank.diagonal.length
+        distance = distance_point_point(self.camera_point, blank.frame.point)
+        if distance <= radius:
+            return float("inf")
+        return radius / (distance * math.tan(0.5 * self.field_of_view)) * self.viewport_height
+
+    def get_lod(self, beam):
+        size = self.screen_size(beam)
+        for threshold, lod in self.thresholds:
+            if size >= threshold:
+                return lod
+        return self.default
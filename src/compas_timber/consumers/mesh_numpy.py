@@ -0,0 +1,186 @@
+import numpy as np
+from compas.geometry import Plane
+from compas.geometry import boolean_difference_mesh_mesh
+from compas.plugins import PluginNotInstalledError
+
+from compas_timber.parts import CutFeature
+from compas_timber.parts import DrillFeature
+from compas_timber.parts import MillVolume
+from compas_timber.utils import profile_count
+from compas_timber.utils import profile_span
+
+from .convex_numpy import ConvexPolyhedron
+from .convex_numpy import CutFeatureConvexGeometry
+from .geometry import BeamGeometry
+from .geometry import DrillFeatureGeometry
+from .geometry import FeatureApplicationError
+from .lod import LOD
+
+
+def _triangulate(faces):
+    # fan triangulation of convex faces
+    triangles = []
+    for face in faces:
+        for i in range(1, len(face) - 1):
+            triangles.append([face[0], face[i], face[i + 1]])
+    return np.array(triangles, dtype=int).reshape((-1, 3))
+
+
+def convex_remainder_plane(polyhedron, volume, tol=1e-9):
+    """Returns the plane which trims a convex polyhedron like subtracting a convex volume from it, if there is one.
+
+    This is the case if the polyhedron lies behind all face planes of the volume except for one, e.g. when the volume
+    removes the end of a beam. Volumes which are not convex, whose vertices are not all behind each of their face
+    planes, are never replaced by a plane.
+
+    Parameters
+    ----------
+    polyhedron : :class:`~compas_timber.consumers.ConvexPolyhedron`
+        The polyhedron to subtract from.
+    volume : :class:`~compas.geometry.Polyhedron` | :class:`~compas.datastructures.Mesh`
+        The volume to subtract.
+    tol : float, optional
+        Vertices closer to a plane than this are considered to be on the plane.
+
+    Returns
+    -------
+    :class:`~compas.geometry.Plane` | None
+        The plane to use with :meth:`~compas_timber.consumers.ConvexPolyhedron.trimmed`,
+        None if the volume or the difference is not convex.
+
+    """
+    vertices, faces = volume.to_vertices_and_faces()
+    vertices = np.array(vertices, dtype=float)
+    center = vertices.mean(axis=0)
+    origins = np.array([vertices[face].mean(axis=0) for face in faces])
+    # Newell's method, the normals are flipped to point away from the center of the volume
+    normals = np.array(
+        [np.sum(np.cross(vertices[face], vertices[np.roll(face, -1)]), axis=0) for face in faces], dtype=float
+    )
+    signs = np.sign(np.einsum("ij,ij->i", normals, origins - center))
+    if not np.all(signs):
+        return None
+    normals *= signs[:, np.newaxis]
+    normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+    offsets = np.einsum("ij,ij->i", normals, origins)
+    if np.any(np.einsum("ij,kj->ik", normals, vertices) - offsets[:, np.newaxis] > tol):
+        return None
+
+    points = np.concatenate(polyhedron.faces)
+    distances = np.einsum("ij,kj->ik", normals, points) - offsets[:, np.newaxis]
+    in_front = np.any(distances > tol, axis=1)
+    if np.count_nonzero(in_front) != 1:
+        return None
+    index = int(np.flatnonzero(in_front)[0])
+    # the part in front of the face is kept, which is behind the flipped plane
+    return Plane(origins[index].tolist(), (-normals[index]).tolist())
+
+
+class MeshGeometryConsumer(object):
+    """A consumer that creates triangle meshes of beams for previews and collision checks, without a Brep backend.
+
+    Cuts, and mill volumes which leave a convex beam, are applied to the blank by convex clipping.
+    Drills and the other mill volumes are subtracted with a mesh boolean, which requires a plugin for
+    :func:`compas.geometry.boolean_difference_mesh_mesh`. Features which could not be applied are reported in the
+    `debug_info` of the result of the beam.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_timber.assembly.TimberAssembly`
+        The assembly to consume.
+    drill_segments : int, optional
+        The number of segments of the cylinders approximating drill holes. Drills are skipped if 0.
+    lod : int | :class:`~compas_timber.consumers.LODPolicy`, optional
+        The level of detail of the geometry, one of :class:`~compas_timber.consumers.LOD`, or a policy which picks
+        it for each beam.
+
+    Attributes
+    ----------
+    result : generator(:class:`~compas_timber.consumers.BeamGeometry`)
+        The vertices, shape (n, 3), and triangles, shape (m, 3), of each beam.
+
+    """
+
+    def __init__(self, assembly, drill_segments=16, lod=LOD.FULL):
+        self.assembly = assembly
+        self.drill_segments = drill_segments
+        self.lod = lod
+
+    @property
+    def result(self):
+        for beam in self.assembly.beams:
+            lod = LOD.resolve(self.lod, beam)
+            geometry, debug_info = self._create_geometry(LOD.box(beam, lod), LOD.filter_features(beam.features, lod))
+            yield BeamGeometry(beam, geometry, debug_info)
+
+    def merged(self):
+        """Returns the meshes of all beams as a single buffer.
+
+        Returns
+        -------
+        tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`)
+            The vertices, shape (n, 3), the triangles, shape (m, 3), and the index of the beam of each triangle
+            in `assembly.beams`, shape (m,).
+
+        """
+        vertices = []
+        triangles = []
+        beam_indices = []
+        offset = 0
+        for index, result in enumerate(self.result):
+            beam_vertices, beam_triangles = result.geometry
+            vertices.append(beam_vertices)
+            triangles.append(beam_triangles + offset)
+            beam_indices.append(np.full(len(beam_triangles), index, dtype=int))
+            offset += len(beam_vertices)
+        if not vertices:
+            return np.zeros((0, 3)), np.zeros((0, 3), dtype=int), np.zeros(0, dtype=int)
+        return np.concatenate(vertices), np.concatenate(triangles), np.concatenate(beam_indices)
+
+    def _create_geometry(self, box, features):
+        polyhedron = ConvexPolyhedron.from_box(box)
+        errors = []
+        subtractions = []
+        for feature in features:
+            if isinstance(feature, CutFeature):
+                try:
+                    with profile_span("CutFeatureConvexGeometry.apply", "features"):
+                        polyhedron = CutFeatureConvexGeometry(polyhedron, feature).apply()
+                    profile_count("features")
+                except FeatureApplicationError as error:
+                    errors.append(error)
+            elif isinstance(feature, MillVolume):
+                plane = convex_remainder_plane(polyhedron, feature.volume)
+                if plane and not polyhedron.trimmed(plane).is_empty:
+                    polyhedron = polyhedron.trimmed(plane)
+                    profile_count("features")
+                else:
+                    vertices, faces = feature.volume.to_vertices_and_faces()
+                    subtractions.append((feature.volume, np.array(vertices, dtype=float), _triangulate(faces)))
+            elif isinstance(feature, DrillFeature):
+                if self.drill_segments:
+                    cylinder = DrillFeatureGeometry(None, feature).drill_volume
+                    vertices, faces = cylinder.to_vertices_and_faces(u=self.drill_segments)
+                    subtractions.append((cylinder, np.array(vertices, dtype=float), _triangulate(faces)))
+            else:
+                errors.append(FeatureApplicationError(feature, polyhedron, "Unsupported feature type."))
+
+        vertices, faces = polyhedron.to_vertices_and_faces()
+        geometry = (vertices, _triangulate(faces))
+        for volume, volume_vertices, volume_triangles in subtractions:
+            try:
+                result = boolean_difference_mesh_mesh(geometry, (volume_vertices, volume_triangles))
+            except PluginNotInstalledError:
+                errors.append(FeatureApplicationError(volume, geometry, "No mesh boolean plugin is installed."))
+                continue
+            geometry = (np.asarray(result[0], dtype=float), np.asarray(result[1], dtype=int))
+            profile_count("features")
+
+        debug_info = None
+        if errors:
+            debug_info = FeatureApplicationError(
+                [error.feature_geometry for error in errors],
+                geometry,
+                " ".join(error.message for error in errors),
+            )
+        return geometry, debug_info
@@ -0,0 +1,122 @@
+from compas.geometry import bounding_box
+from compas.geometry import dot_vectors
+from compas.geometry import normal_polygon
+from compas.geometry import normalize_vector
+
+from compas_timber.parts import CutFeature
+from compas_timber.parts import DrillFeature
+from compas_timber.parts import MillVolume
+
+
+class MillVolumeUnion(object):
+    """Overlapping mill volumes which are united into tool bodies before they are subtracted from a beam.
+
+    Parameters
+    ----------
+    features : list(:class:`~compas_timber.parts.MillVolume`)
+        The united mill volumes.
+
+    """
+
+    def __init__(self, features):
+        self.features = features
+
+
+# features which are cheaper to apply are applied first, cuts also simplify the geometry for the later booleans
+FEATURE_COSTS = {CutFeature: 0, DrillFeature: 1, MillVolume: 2, MillVolumeUnion: 3}
+
+
+def optimize_features(features, tol=1e-9):
+    """Returns the features of a beam prepared to be applied with fewer booleans.
+
+    - Of parallel cuts with the same direction, only the deepest one is kept, as it removes everything the others do.
+    - Mill volumes which may intersect are grouped into a :class:`~compas_timber.consumers.MillVolumeUnion`. Volumes
+      are kept apart when their bounding boxes don't overlap or a face plane of one of them separates them.
+    - The features are ordered cheapest-first: cuts, drills, mill volumes and unions of mill volumes.
+
+    Parameters
+    ----------
+    features : list(:class:`~compas_timber.parts.Feature`)
+        The features of the beam.
+    tol : float, optional
+        The tolerance of the parallel check of the normals of the cuts.
+
+    Returns
+    -------
+    list(:class:`~compas_timber.parts.Feature` | :class:`~compas_timber.consumers.MillVolumeUnion`)
+
+    """
+    cuts = []
+    mill_volumes = []
+    others = []
+    for feature in features:
+        if isinstance(feature, CutFeature):
+            cuts.append(feature)
+        elif isinstance(feature, MillVolume):
+            mill_volumes.append(feature)
+        else:
+            others.append(feature)
+
+    optimized = _remove_dominated_cuts(cuts, tol) + others + _unite_mill_volumes(mill_volumes)
+    # sorted is stable, features of the same cost keep their order
+    return sorted(optimized, key=lambda feature: FEATURE_COSTS.get(type(feature), len(FEATURE_COSTS)))
+
+
+def _remove_dominated_cuts(cuts, tol):
+    # a cut keeps the side opposite to its normal, of two cuts with the same normal the one
+    # with the smaller offset along the normal keeps less and dominates the other
+    kept = []
+    for cut in cuts:
+        normal = normalize_vector(cut.cutting_plane.normal)
+        offset = dot_vectors(cut.cutting_plane.point, normal)
+        for index, (other, other_normal, other_offset) in enumerate(kept):
+            if dot_vectors(normal, other_normal) < 1.0 - tol:
+                continue
+            if offset < other_offset:
+                kept[index] = (cut, normal, offset)
+            break
+        else:
+            kept.append((cut, normal, offset))
+    return [cut for cut, _, _ in kept]
+
+
+def _unite_mill_volumes(mill_volumes):
+    shapes = []
+    for feature in mill_volumes:
+        vertices, faces = feature.volume.to_vertices_and_faces()
+        box = bounding_box(vertices)
+        normals = [normal_polygon([vertices[index] for index in face]) for face in faces]
+        shapes.append((box[0], box[6], vertices, normals))
+
+    # groups of transitively intersecting volumes, in the order of their first volume
+    groups = []
+    for index, shape in enumerate(shapes):
+        intersecting = [group for group in groups if any(_may_intersect(shape, shapes[other]) for other in group)]
+        merged = [index]
+        for group in intersecting:
+            merged.extend(group)
+            groups.remove(group)
+        groups.append(sorted(merged))
+    groups.sort()
+
+    result = []
+    for group in groups:
+        if len(group) == 1:
+            result.append(mill_volumes[group[0]])
+        else:
+            result.append(MillVolumeUnion([mill_volumes[index] for index in group]))
+    return result
+
+
+def _may_intersect(shape, other, tol=1e-9):
+    # solids are disjoint if their projections on any axis are, the face normals of both are tested as axes
+    low, high, vertices, normals = shape
+    other_low, other_high, other_vertices, other_normals = other
+    if not all(low[i] <= other_high[i] and other_low[i] <= high[i] for i in range(3)):
+        return False
+    for normal in normals + other_normals:
+        projections = [dot_vectors(vertex, normal) for vertex in vertices]
+        other_projections = [dot_vectors(vertex, normal) for vertex in other_vertices]
+        if max(projections) < min(other_projections) - tol or max(other_projections) < min(projections) - tol:
+            return False
+    return True
@@ -1,7 +1,14 @@
 from .btlx import BTLx
+from .btlx import BTLxExportReport
+from .btlx import BTLxPartCache
 from .btlx import BTLxProcess
 from .btlx_processes.btlx_french_ridge_lap import BTLxFrenchRidgeLap
 from .btlx_processes.btlx_jack_cut import BTLxJackCut
+from .btlx_reader import BTLxPartRecord
+from .btlx_reader import BTLxReader
+from .btlx_shards import partition_beams_by_attribute
+from .btlx_shards import partition_beams_by_count
+from .btlx_shards import partition_beams_by_region
 from .joint_factories.french_ridge_factory import FrenchRidgeFactory
 from .joint_factories.l_butt_factory import LButtFactory
 from .joint_factories.l_miter_factory import LMiterFactory
@@ -9,11 +16,18 @@ from .joint_factories.t_butt_factory import TButtFactory
 
 __all__ = [
     "BTLx",
+    "BTLxExportReport",
+    "BTLxPartCache",
     "BTLxProcess",
+    "BTLxPartRecord",
+    "BTLxReader",
     "BTLxJackCut",
     "BTLxFrenchRidgeLap",
     "LButtFactory",
     "TButtFactory",
     "LMiterFactory",
     "FrenchRidgeFactory",
+    "partition_beams_by_attribute",
+    "partition_beams_by_count",
+    "partition_beams_by_region",
 ]
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import uuid
 import xml.dom.minidom as MD
@@ -9,6 +11,20 @@ from datetime import datetime
 import compas
 from compas.geometry import Frame
 from compas.geometry import Transformation
+from compas.geometry import add_vectors
+from compas.geometry import dot_vectors
+from compas.geometry import normalize_vector
+from compas.geometry import scale_vector
+from compas.geometry import transform_points
+
+from compas_timber.utils import profile_count
+from compas_timber.utils import profile_span
+from compas_timber.utils import profiled
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
 
 
 class BTLx(object):
@@ -20,6 +36,16 @@ class BTLx(object):
     ----------
     assembly : :class:`~compas_timber.assembly.Assembly`
         The assembly object.
+    cache : :class:`~compas_timber.fabrication.BTLxPartCache`, optional
+        If given, parts which did not change since the previous export with the same cache are reused
+        instead of being regenerated.
+    merge_identical_parts : bool, optional
+        If True, parts with the same dimensions, processings and shape in their local frame are written as a single
+        `Part` with the number of instances as `Count` and the transformation of each instance.
+    lazy : bool, optional
+        If True, the parts are not generated when the BTLx is created. They are generated, serialized and released
+        one at a time when the BTLx is written, see :meth:`~compas_timber.fabrication.BTLx.iter_parts`.
+        Can not be combined with `cache` or `merge_identical_parts`, which need all parts at once.
 
     Attributes
     ----------
@@ -28,15 +54,27 @@ class BTLx(object):
     btlx_string : str
         A pretty XML string for visualization.
     parts : dict
-        A dictionary of the BTLxParts in the assembly.
+        A dictionary of the BTLxParts in the assembly. Empty if `lazy` is True.
     joints : list
         A list of the joints in the assembly.
+    cache : :class:`~compas_timber.fabrication.BTLxPartCache`
+        The cache of previously exported parts, if any.
+    regenerated_part_keys : list(str)
+        The keys of the parts which were (re)generated by this export.
+    report : :class:`~compas_timber.fabrication.BTLxExportReport`
+        The joints which could not be exported.
+    merge_identical_parts : bool
+        If True, identical parts are written as a single `Part`.
+    lazy : bool
+        If True, parts are generated one at a time when the BTLx is written.
 
     """
 
     POINT_PRECISION = 3
     ANGLE_PRECISION = 3
     REGISTERED_JOINTS = {}
+    _JOINT_FACTORIES = {}
+    _VALUE_FORMATS = {}
     FILE_ATTRIBUTES = OrderedDict(
         [
             ("xmlns", "https://www.design2machine.com"),
@@ -50,12 +88,20 @@ class BTLx(object):
         ]
     )
 
-    def __init__(self, assembly):
+    def __init__(self, assembly, cache=None, merge_identical_parts=False, lazy=False):
+        if lazy and (cache is not None or merge_identical_parts):
+            raise ValueError("A lazy BTLx can not be combined with a cache or with merge_identical_parts.")
         self.assembly = assembly
+        self.cache = cache
+        self.merge_identical_parts = merge_identical_parts
+        self.lazy = lazy
         self.parts = {}
+        self.regenerated_part_keys = []
+        self.report = BTLxExportReport()
         self._test = []
         self.joints = assembly.joints
-        self.process_assembly()
+        if not lazy:
+            self.process_assembly()
 
     @property
     def history(self):
@@ -74,22 +120,303 @@ class BTLx(object):
 
     def btlx_string(self):
         """Returns a pretty XML string for visualization in GH, Terminal, etc."""
-        self.ET_element = ET.Element("BTLx", BTLx.FILE_ATTRIBUTES)
-        self.ET_element.append(self.file_history)
-        self.project_element = ET.SubElement(self.ET_element, "Project", Name="testProject")
-        self.parts_element = ET.SubElement(self.project_element, "Parts")
+        return "".join(self.iter_btlx_string())
+
+    def iter_btlx_string(self):
+        """Yields the pretty XML string of the BTLx file in chunks, one chunk per part.
+
+        In lazy mode, each part is generated when its chunk is requested and released afterwards.
+
+        Returns
+        -------
+        generator(str)
+
+        """
+        self.ET_element = self._create_document_element()
+        self.project_element = self.ET_element.find("Project")
+        self.parts_element = self.project_element.find("Parts")
+        for chunk in self._iter_document(self.ET_element, self.assembly.beams):
+            yield chunk
+
+    def write(self, filepath):
+        """Writes the BTLx file, in lazy mode without keeping more than one part in memory.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the BTLx file.
+
+        """
+        with open(filepath, "w") as f:
+            for chunk in self.iter_btlx_string():
+                f.write(chunk)
+
+    def write_shards(self, directory, shards, basename="part", max_workers=None):
+        """Writes the parts of the assembly to several BTLx files and a manifest of these files.
+
+        The files are written concurrently by a pool of threads, if available.
+
+        Parameters
+        ----------
+        directory : str
+            The directory to write the files to.
+        shards : list(list(:class:`~compas_timber.parts.Beam`))
+            The beams of each file, e.g. created with :func:`~compas_timber.fabrication.partition_beams_by_count`,
+            :func:`~compas_timber.fabrication.partition_beams_by_attribute` or
+            :func:`~compas_timber.fabrication.partition_beams_by_region`.
+        basename : str, optional
+            The files are named `<basename>_<index>.btlx`.
+        max_workers : int, optional
+            The maximum number of files written at the same time. Defaults to the default of the thread pool.
 
-        for part in self.parts.values():
-            self.parts_element.append(part.et_element)
-        return MD.parseString(ET.tostring(self.ET_element)).toprettyxml(indent="   ")
+        Returns
+        -------
+        dict
+            The manifest, which is also written to `<basename>_manifest.json`. It contains the file name, the part
+            numbers, the range of part numbers and the SHA-256 checksum of each file.
 
+        """
+        jobs = []
+        for index, beams in enumerate(shards):
+            filepath = os.path.join(directory, "{}_{:03d}.btlx".format(basename, index))
+            jobs.append((filepath, list(beams)))
+
+        if ThreadPoolExecutor is None or max_workers == 1:
+            checksums = [self._write_shard(filepath, beams) for filepath, beams in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._write_shard, filepath, beams) for filepath, beams in jobs]
+                checksums = [future.result() for future in futures]
+
+        manifest = {"shards": []}
+        for (filepath, beams), checksum in zip(jobs, checksums):
+            part_numbers = [beam.key for beam in beams]
+            manifest["shards"].append(
+                {
+                    "filename": os.path.basename(filepath),
+                    "part_count": len(part_numbers),
+                    "part_number_range": [min(part_numbers), max(part_numbers)] if part_numbers else None,
+                    "part_numbers": part_numbers,
+                    "sha256": checksum,
+                }
+            )
+        with open(os.path.join(directory, "{}_manifest.json".format(basename)), "w") as f:
+            json.dump(manifest, f, indent=4)
+        return manifest
+
+    def _write_shard(self, filepath, beams):
+        # writes the parts of the given beams to a file and returns its checksum
+        checksum = hashlib.sha256()
+        with open(filepath, "wb") as f:
+            for chunk in self._iter_document(self._create_document_element(), beams):
+                data = chunk.encode("utf-8")
+                f.write(data)
+                checksum.update(data)
+        return checksum.hexdigest()
+
+    def _create_document_element(self):
+        element = ET.Element("BTLx", BTLx.FILE_ATTRIBUTES)
+        element.append(self.file_history)
+        project_element = ET.SubElement(element, "Project", Name="testProject")
+        ET.SubElement(project_element, "Parts")
+        return element
+
+    def _iter_document(self, element, beams):
+        # the (cached) pretty XML of the part of each beam is spliced into the otherwise empty document
+        document = MD.parseString(ET.tostring(element)).toprettyxml(indent="   ")
+        indent = BTLxPart.XML_INDENT * 2
+        head, tail = document.split("{}<Parts/>\n".format(indent), 1)
+        has_parts = False
+        for part_string in self._iter_part_strings(beams, element.find("Project/Parts")):
+            if not has_parts:
+                yield "{}{}<Parts>\n".format(head, indent)
+                has_parts = True
+            yield part_string
+        if has_parts:
+            yield "{}</Parts>\n{}".format(indent, tail)
+        else:
+            yield document
+
+    def _iter_part_strings(self, beams, parts_element):
+        if self.lazy:
+            # parts are not added to `parts_element` to keep them from staying in memory
+            for part in self._generate_parts(beams):
+                yield part.xml_string
+            return
+
+        for instances in self._get_part_groups([self.parts[str(beam.key)] for beam in beams]):
+            if len(instances) == 1:
+                element = instances[0].et_element
+                part_string = instances[0].xml_string
+            else:
+                element = instances[0].create_et_element(instances)
+                lines = []
+                _write_pretty_xml(element, BTLxPart.XML_INDENT * 3, BTLxPart.XML_INDENT, lines)
+                part_string = "".join(lines)
+            parts_element.append(element)
+            yield part_string
+
+    def iter_parts(self):
+        """Yields the BTLx parts of the assembly.
+
+        In lazy mode, each part is generated with the processings of the joints connected to its beam, taken from
+        the assembly graph, and is not kept by this BTLx.
+
+        Returns
+        -------
+        generator(:class:`~compas_timber.fabrication.btlx.BTLxPart`)
+
+        """
+        if not self.lazy:
+            for part in self.parts.values():
+                yield part
+            return
+        for part in self._generate_parts(self.assembly.beams):
+            yield part
+
+    def _generate_parts(self, beams):
+        beam_joints = self._get_beam_joints(beams)
+        for beam in beams:
+            key = str(beam.key)
+            part = BTLxPart(beam)
+            joints = beam_joints[key]
+            # the processings of the other parts of these joints are discarded
+            parts = {key: part}
+            for joint in joints:
+                for other_beam in joint.beams:
+                    if str(other_beam.key) not in parts:
+                        parts[str(other_beam.key)] = BTLxPart(other_beam)
+            self._apply_processings(joints, parts)
+            yield part
+
+    def _get_part_groups(self, parts):
+        """Returns the parts to write, as lists of identical parts if `merge_identical_parts` is set."""
+        if not self.merge_identical_parts:
+            return [[part] for part in parts]
+        groups = OrderedDict()
+        for part in parts:
+            groups.setdefault(part.canonical_key, []).append(part)
+        return list(groups.values())
+
+    @profiled("BTLx.process_assembly", "btlx")
     def process_assembly(self):
-        """Processes the assembly and generates BTLx parts."""
+        """Processes the assembly and generates BTLx parts.
+
+        If this BTLx has a cache, only the parts whose fingerprint changed since the previous export are generated,
+        the others are taken from the cache.
+
+        """
+        if self.cache is None:
+            for beam in self.assembly.beams:
+                self.parts[str(beam.key)] = BTLxPart(beam)
+            self.regenerated_part_keys = list(self.parts.keys())
+            self._apply_processings(self.joints, self.parts)
+            return
+
+        beam_joints = self._get_beam_joints()
+        fingerprints = {}
         for beam in self.assembly.beams:
-            self.parts[str(beam.key)] = BTLxPart(beam)
+            key = str(beam.key)
+            fingerprint = BTLxPartCache.fingerprint(beam, beam_joints.get(key, []))
+            part = self.cache.get(key, fingerprint)
+            if part is None:
+                part = BTLxPart(beam)
+                fingerprints[key] = fingerprint
+            self.parts[key] = part
+        self.regenerated_part_keys = list(fingerprints.keys())
+
+        # processings for the unchanged parts of these joints are discarded, their cached ones are still valid
+        joints = []
+        parts = {}
         for joint in self.joints:
-            factory_type = self.REGISTERED_JOINTS.get(str(type(joint)))
-            factory_type.apply_processings(joint, self.parts)
+            keys = [str(beam.key) for beam in joint.beams]
+            if not any(key in fingerprints for key in keys):
+                if self.get_joint_factory(type(joint)) is None:
+                    self.report.add_unsupported_joint(joint)
+                continue
+            joints.append(joint)
+            for key, beam in zip(keys, joint.beams):
+                if key not in parts:
+                    parts[key] = self.parts[key] if key in fingerprints else BTLxPart(beam)
+        self._apply_processings(joints, parts)
+
+        for key, fingerprint in fingerprints.items():
+            self.cache.add(key, fingerprint, self.parts[key])
+        self.cache.retain(self.parts.keys())
+
+    def _apply_processings(self, joints, parts):
+        """Applies the processings of the given joints to the parts with the registered joint factories.
+
+        Joints without a factory are added to the report. Factories which define `apply_processings_many`
+        get all of their joints at once, after the processings of the other joints were applied in order.
+
+        """
+        batches = OrderedDict()
+        for joint in joints:
+            factory = self.get_joint_factory(type(joint))
+            if factory is None:
+                self.report.add_unsupported_joint(joint)
+            elif hasattr(factory, "apply_processings_many"):
+                batches.setdefault(factory, []).append(joint)
+            else:
+                with profile_span(factory.__name__ + ".apply_processings", "btlx"):
+                    factory.apply_processings(joint, parts)
+                profile_count("btlx_joints")
+        for factory, factory_joints in batches.items():
+            with profile_span(factory.__name__ + ".apply_processings_many", "btlx", joints=len(factory_joints)):
+                factory.apply_processings_many(factory_joints, parts)
+            profile_count("btlx_joints", len(factory_joints))
+
+    def _get_beam_joints(self, beams=None):
+        """Returns a map of beam key to the joints connected to it, based on the assembly graph.
+
+        The joints are sorted by their graph key, which is the order in which they were added to the assembly.
+
+        """
+        graph = self.assembly.graph
+        beam_joints = {}
+        if beams is None:
+            beams = self.assembly.beams
+        for beam in beams:
+            joints = []
+            for neighbor in sorted(graph.neighbors(beam.key)):
+                if graph.node_attribute(neighbor, "type") == "joint":
+                    joints.append(self.assembly.find_by_key(neighbor))
+            beam_joints[str(beam.key)] = joints
+        return beam_joints
+
+    @classmethod
+    def format_values(cls, values, precision=None):
+        """Formats many numbers with one call instead of formatting each number separately.
+
+        The format strings are cached per sequence of precisions, so formatting the values of e.g.
+        every transformation of a project reuses the same format string.
+
+        Parameters
+        ----------
+        values : list(float)
+            The values to format.
+        precision : int | list(int), optional
+            The number of decimals of all values, or of each value. Defaults to :attr:`BTLx.POINT_PRECISION`.
+
+        Returns
+        -------
+        list(str)
+
+        """
+        if not values:
+            return []
+        if precision is None:
+            precision = cls.POINT_PRECISION
+        if isinstance(precision, int):
+            precisions = (precision,) * len(values)
+        else:
+            precisions = tuple(precision)
+        value_format = cls._VALUE_FORMATS.get(precisions)
+        if value_format is None:
+            value_format = " ".join("{:.%df}" % precision for precision in precisions)
+            cls._VALUE_FORMATS[precisions] = value_format
+        return value_format.format(*values).split(" ")
 
     @classmethod
     def register_joint(cls, joint_type, joint_factory):
@@ -107,7 +434,37 @@ class BTLx(object):
         None
 
         """
-        cls.REGISTERED_JOINTS[str(joint_type)] = joint_factory
+        cls.REGISTERED_JOINTS[joint_type] = joint_factory
+        cls._JOINT_FACTORIES.clear()
+
+    @classmethod
+    def get_joint_factory(cls, joint_type):
+        """Returns the factory registered for a joint type or for the closest of its base classes.
+
+        The factory of each joint type is resolved once and cached.
+
+        Parameters
+        ----------
+        joint_type : type
+            The type of the joint.
+
+        Returns
+        -------
+        :class:`~compas_timber.fabrication.joint_factories.joint_factory.JointFactory` | None
+            The factory, None if no factory was registered for the joint type or its base classes.
+
+        """
+        try:
+            return cls._JOINT_FACTORIES[joint_type]
+        except KeyError:
+            pass
+        factory = None
+        for base in joint_type.__mro__:
+            factory = cls.REGISTERED_JOINTS.get(base)
+            if factory is not None:
+                break
+        cls._JOINT_FACTORIES[joint_type] = factory
+        return factory
 
     @property
     def file_history(self):
@@ -117,6 +474,33 @@ class BTLx(object):
         return file_history
 
 
+def _escape_text(value):
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _escape_attribute(value):
+    # attribute values are quoted with double quotes, which are only escaped there
+    return _escape_text(value).replace('"', "&quot;")
+
+
+def _write_pretty_xml(element, indent, addindent, lines):
+    # writes the element like minidom's `Element.writexml` with newl="\n", without parsing it again
+    lines.append(indent)
+    lines.append("<")
+    lines.append(element.tag)
+    for name, value in element.attrib.items():
+        lines.append(' {}="{}"'.format(name, _escape_attribute(value)))
+    if len(element):
+        lines.append(">\n")
+        for child in element:
+            _write_pretty_xml(child, indent + addindent, addindent, lines)
+        lines.append("{}</{}>\n".format(indent, element.tag))
+    elif element.text:
+        lines.append(">{}</{}>\n".format(_escape_text(element.text), element.tag))
+    else:
+        lines.append("/>\n")
+
+
 class BTLxPart(object):
     """Class representing a BTLx part. This acts as a wrapper for a Beam object.
 
@@ -149,44 +533,97 @@ class BTLxPart(object):
         The blank length of the beam.
     processings : list
         A list of the processings applied to the beam.
+    geometry : :class:`~compas.geometry.Brep`
+        The geometry written to the shape of the part. If None, the blank of the beam is used.
+    shape_strings : list(str)
+        The face indices and the vertex coordinates of the shape of the part.
     et_element : :class:`~xml.etree.ElementTree.Element`
         The ET element of the BTLx part.
+    xml_string : str
+        The pretty XML string of the BTLx part, indented for its position in the BTLx document.
 
     """
 
+    XML_INDENT = "   "
+
+    # the faces of the blank as indices of its vertices, in the vertex and face order of Box
+    BLANK_FACES = ((0, 1, 2, 3), (0, 3, 5, 4), (3, 2, 6, 5), (2, 1, 7, 6), (1, 0, 4, 7), (4, 5, 6, 7))
+    # reference side key of a face normal pointing along -y, -z, +y, +z, -x, +x of the part frame
+    REFERENCE_SIDE_KEYS = {(1, -1): "1", (2, -1): "2", (1, 1): "3", (2, 1): "4", (0, -1): "5", (0, 1): "6"}
+    NORMAL_TOLERANCE = 1e-6
+
     def __init__(self, beam):
         self.beam = beam
         self.key = beam.key
         self.length = beam.length
         self.width = beam.height
         self.height = beam.width
-        self.frame = Frame(
-            self.beam.long_edges[2].closest_point(self.beam.blank_frame.point),
-            beam.frame.xaxis,
-            beam.frame.yaxis,
-        )  # I used long_edge[2] because it is in Y and Z negative. Using that as reference puts the beam entirely in positive coordinates.
+        xaxis = beam.frame.xaxis
+        yaxis = beam.frame.yaxis
+        # the corner of the blank box on long_edges[2], which is in Y and Z negative.
+        # Using that as reference puts the beam entirely in positive coordinates.
+        corner = add_vectors(beam.blank_frame.point, scale_vector(yaxis, -0.5 * beam.width))
+        corner = add_vectors(corner, scale_vector(beam.frame.zaxis, -0.5 * beam.height))
+        self.frame = Frame(corner, xaxis, yaxis)
         self.blank_length = beam.blank_length
-        self._reference_surfaces = []
+        self._reference_surface_table = self._create_reference_surface_table()
+        self._reference_surfaces = [None] * 6
+        self._test = []
+        self.geometry = None
         self.processings = []
         self._et_element = None
+        self._shape_strings = None
+        self._canonical_key = None
+        self._xml_string = None
+
+    def _create_reference_surface_table(self):
+        # origin, xaxis and yaxis of the reference surfaces 1-6 per BTLx docs
+        point = list(self.frame.point)
+        xaxis = list(self.frame.xaxis)
+        yaxis = list(self.frame.yaxis)
+        zaxis = list(self.frame.zaxis)
+        to_side = scale_vector(yaxis, self.width)
+        to_top = scale_vector(zaxis, self.height)
+        to_end = scale_vector(xaxis, self.blank_length)
+        return (
+            (point, xaxis, zaxis),
+            (add_vectors(point, to_side), xaxis, scale_vector(yaxis, -1.0)),
+            (add_vectors(add_vectors(point, to_side), to_top), xaxis, scale_vector(zaxis, -1.0)),
+            (add_vectors(point, to_top), xaxis, yaxis),
+            (point, zaxis, yaxis),
+            (add_vectors(add_vectors(point, to_end), to_side), zaxis, scale_vector(yaxis, -1.0)),
+        )
 
-    def reference_surface_from_beam_face(self, beam_face):
+    @property
+    def reference_surfaces(self):
+        """dict: The reference surface frames of this part with the keys "1" to "6"."""
+        return {str(index): self.reference_surface_planes(index) for index in range(1, 7)}
+
+    def reference_surface_from_beam_face(self, beam_face, tolerance=None):
         """Finds the reference surface with normal that matches the normal of the beam face argument
 
         Parameters
         -----------
         beam_face : :class:`~compas.geometry.Frame`
             The frame of a beam face from beam.faces.
+        tolerance : float, optional
+            Maximum deviation of the cosine between the normals from 1.0.
+            Defaults to :attr:`BTLxPart.NORMAL_TOLERANCE`.
 
         Returns
         --------
         key : str
-            The key(index 1-6) of the reference surface.
+            The key(index 1-6) of the reference surface. None if no reference surface matches.
 
         """
-        for key, face in self.reference_surfaces.items():
-            if face.normal == beam_face.normal:
-                return key
+        if tolerance is None:
+            tolerance = self.NORMAL_TOLERANCE
+        normal = normalize_vector(beam_face.normal)
+        components = [dot_vectors(normal, axis) for axis in (self.frame.xaxis, self.frame.yaxis, self.frame.zaxis)]
+        axis = max(range(3), key=lambda i: abs(components[i]))
+        if abs(components[axis]) < 1.0 - tolerance:
+            return None
+        return self.REFERENCE_SIDE_KEYS[(axis, 1 if components[axis] > 0 else -1)]
 
     def reference_surface_planes(self, index):
         """Returns the reference surface planes for a given index per BTLx docs.
@@ -198,55 +635,34 @@ class BTLxPart(object):
 
         Returns
         -------
-        dict
+        :class:`~compas.geometry.Frame`
             The BTLx reference surface frame.
 
         """
-        if len(self._reference_surfaces) != 6:
-            self._reference_surfaces = {
-                "1": Frame(self.frame.point, self.frame.xaxis, self.frame.zaxis),
-                "2": Frame(
-                    self.frame.point + self.frame.yaxis * self.width,
-                    self.frame.xaxis,
-                    -self.frame.yaxis,
-                ),
-                "3": Frame(
-                    self.frame.point + self.frame.yaxis * self.width + self.frame.zaxis * self.height,
-                    self.frame.xaxis,
-                    -self.frame.zaxis,
-                ),
-                "4": Frame(
-                    self.frame.point + self.frame.zaxis * self.height,
-                    self.frame.xaxis,
-                    self.frame.yaxis,
-                ),
-                "5": Frame(self.frame.point, self.frame.zaxis, self.frame.yaxis),
-                "6": Frame(
-                    self.frame.point + self.frame.xaxis * self.blank_length + self.frame.yaxis * self.width,
-                    self.frame.zaxis,
-                    -self.frame.yaxis,
-                ),
-            }
-        return self._reference_surfaces[str(index)]
+        index = int(index) - 1
+        if not self._reference_surfaces[index]:
+            self._reference_surfaces[index] = Frame(*self._reference_surface_table[index])
+        return self._reference_surfaces[index]
 
     @property
     def attr(self):
+        length, height, width = BTLx.format_values([self.blank_length, self.height, self.width])
         return {
             "SingleMemberNumber": str(self.key),
             "AssemblyNumber": "",
             "OrderNumber": str(self.key),
             "Designation": "",
             "Annotation": "",
-            "Storey": "",
-            "Group": "",
-            "Package": "",
+            "Storey": str(self.beam.attributes.get("storey", "")),
+            "Group": str(self.beam.attributes.get("group", "")),
+            "Package": str(self.beam.attributes.get("package", "")),
             "Material": "",
             "TimberGrade": "",
             "QualityGrade": "",
             "Count": "1",
-            "Length": "{:.{prec}f}".format(self.blank_length, prec=BTLx.POINT_PRECISION),
-            "Height": "{:.{prec}f}".format(self.height, prec=BTLx.POINT_PRECISION),
-            "Width": "{:.{prec}f}".format(self.width, prec=BTLx.POINT_PRECISION),
+            "Length": length,
+            "Height": height,
+            "Width": width,
             "Weight": "0",
             "ProcessingQuality": "automatic",
             "StoreyType": "",
@@ -279,80 +695,292 @@ class BTLxPart(object):
             The ET point values formatted for the ET element.
 
         """
-        return {
-            "X": "{:.{prec}f}".format(point.x, prec=BTLx.POINT_PRECISION),
-            "Y": "{:.{prec}f}".format(point.y, prec=BTLx.POINT_PRECISION),
-            "Z": "{:.{prec}f}".format(point.z, prec=BTLx.POINT_PRECISION),
-        }
+        x, y, z = BTLx.format_values(point)
+        return {"X": x, "Y": y, "Z": z}
 
     @property
     def et_element(self):
         if not self._et_element:
-            self._et_element = ET.Element("Part", self.attr)
-            self._shape_strings = None
-            self._et_element.append(self.et_transformations)
-            self._et_element.append(ET.Element("GrainDirection", X="1", Y="0", Z="0", Align="no"))
-            self._et_element.append(ET.Element("ReferenceSide", Side="1", Align="no"))
-            processings_et = ET.Element("Processings")
-            for process in self.processings:
-                processings_et.append(process.et_element)
-            self._et_element.append(processings_et)
-            self._et_element.append(self.et_shape)
+            self._et_element = self.create_et_element([self])
         return self._et_element
 
+    @property
+    def canonical_key(self):
+        # dimensions, processings and shape of the part in its local frame, the same for identical parts
+        if not self._canonical_key:
+            attr = self.attr
+            lines = [attr[name] for name in ("Length", "Height", "Width", "Storey", "Group", "Package")]
+            for process in self.processings:
+                _write_pretty_xml(process.et_element, "", "", lines)
+            lines.extend(self.shape_strings)
+            self._canonical_key = "|".join(lines)
+        return self._canonical_key
+
+    def create_et_element(self, instances):
+        """Creates the ET element of this part, written once for several identical parts.
+
+        Parameters
+        ----------
+        instances : list(:class:`~compas_timber.fabrication.btlx.BTLxPart`)
+            The identical parts, including this part, whose transformations are written to the element.
+
+        Returns
+        -------
+        :class:`~xml.etree.ElementTree.Element`
+
+        """
+        attr = self.attr
+        attr["Count"] = str(len(instances))
+        element = ET.Element("Part", attr)
+        transformations = ET.SubElement(element, "Transformations")
+        for instance in instances:
+            transformations.append(instance.et_transformation)
+        element.append(ET.Element("GrainDirection", X="1", Y="0", Z="0", Align="no"))
+        element.append(ET.Element("ReferenceSide", Side="1", Align="no"))
+        processings_et = ET.Element("Processings")
+        for process in self.processings:
+            processings_et.append(process.et_element)
+        element.append(processings_et)
+        element.append(self.et_shape)
+        return element
+
+    @property
+    def xml_string(self):
+        if not self._xml_string:
+            lines = []
+            _write_pretty_xml(self.et_element, self.XML_INDENT * 3, self.XML_INDENT, lines)
+            self._xml_string = "".join(lines)
+        return self._xml_string
+
     @property
     def et_transformations(self):
         transformations = ET.Element("Transformations")
+        transformations.append(self.et_transformation)
+        return transformations
+
+    @property
+    def et_transformation(self):
         guid = "{" + str(uuid.uuid4()) + "}"
-        transformation = ET.SubElement(transformations, "Transformation", GUID=guid)
+        transformation = ET.Element("Transformation", GUID=guid)
         position = ET.SubElement(transformation, "Position")
-        position.append(ET.Element("ReferencePoint", self.et_point_vals(self.frame.point)))
-        position.append(ET.Element("XVector", self.et_point_vals(self.frame.xaxis)))
-        position.append(ET.Element("YVector", self.et_point_vals(self.frame.yaxis)))
-        return transformations
+        values = BTLx.format_values(list(self.frame.point) + list(self.frame.xaxis) + list(self.frame.yaxis))
+        for index, name in enumerate(("ReferencePoint", "XVector", "YVector")):
+            x, y, z = values[index * 3 : index * 3 + 3]
+            position.append(ET.Element(name, X=x, Y=y, Z=z))
+        return transformation
 
     @property
     def et_shape(self):
         shape = ET.Element("Shape")
-        indexed_face_set = ET.SubElement(shape, "IndexedFaceSet", convex="true", coordIndex="")
-        indexed_face_set.set("coordIndex", " ")
-        indexed_face_set.append(ET.Element("Coordinate"))
-        # indexed_face_set.set("coordIndex", self.shape_strings[0])
-        # indexed_face_set.append(ET.Element("Coordinate", point=self.shape_strings[1]))
+        coord_index, points = self.shape_strings
+        indexed_face_set = ET.SubElement(shape, "IndexedFaceSet", convex="true", coordIndex=coord_index)
+        indexed_face_set.append(ET.Element("Coordinate", point=points))
         return shape
 
     @property
     def shape_strings(self):
         if not self._shape_strings:
-            brep_vertex_points = []
-            brep_indices = []
+            self._shape_strings = self._create_shape_strings(self._shape_polygons())
+        return self._shape_strings
+
+    def _shape_polygons(self):
+        # the faces of the part geometry as lists of points in the part frame, falls back to the blank of the beam
+        if self.geometry is not None:
             try:
-                for face in self.beam.geometry.faces:
-                    for loop in face.loops:
-                        for vertex in loop.vertices:
-                            if brep_vertex_points.contains(vertex.point):
-                                brep_indices.append(brep_vertex_points.index(vertex.point))
-                            else:
-                                brep_vertex_points.append(vertex.point)
-                                brep_indices.append(len(brep_vertex_points))
-
-                brep_indices.append(-1)
-                brep_indices.pop(-1)
+                polygons = [
+                    [vertex.point for vertex in loop.vertices] for face in self.geometry.faces for loop in face.loops
+                ]
+                xform = Transformation.from_frame_to_frame(self.frame, Frame.worldXY())
+                points = iter(transform_points([point for polygon in polygons for point in polygon], xform))
+                return [[next(points) for _ in polygon] for polygon in polygons]
             except NotImplementedError:
-                print("brep.face.loop.vertices not implemented")
-            brep_indices_string = " "
-            for index in brep_indices:
-                brep_indices_string += str(index) + " "
-
-            brep_vertices_string = " "
-            for point in brep_vertex_points:
-                xform = Transformation.from_frame_to_frame(self.frame, Frame((0, 0, 0), (1, 0, 0), (0, 1, 0)))
-                point.transform(xform)
-                brep_vertices_string += "{:.{prec}f} {:.{prec}f} {:.{prec}f} ".format(
-                    point.x, point.y, point.z, prec=BTLx.POINT_PRECISION
-                )
-            self._shape_strings = [brep_indices_string, brep_vertices_string]
-        return self._shape_strings
+                pass  # the Brep backend does not provide the vertices of the face loops
+        # the blank is axis aligned in the part frame, with the same vertex and face order as Box
+        x, y, z = self.blank_length, self.beam.width, self.beam.height
+        vertices = [(0, 0, 0), (0, y, 0), (x, y, 0), (x, 0, 0), (0, 0, z), (x, 0, z), (x, y, z), (0, y, z)]
+        return [[vertices[index] for index in face] for face in self.BLANK_FACES]
+
+    def _create_shape_strings(self, polygons):
+        # vertices which are equal at POINT_PRECISION are merged
+        points = [point for polygon in polygons for point in polygon]
+        precision = BTLx.POINT_PRECISION
+
+        vertex_indices = {}
+        coord_index = []
+        points = iter(points)
+        for polygon in polygons:
+            for _ in polygon:
+                # adding 0.0 turns -0.0 into 0.0
+                x, y, z = [round(value, precision) + 0.0 for value in next(points)]
+                vertex = "{:.{prec}f} {:.{prec}f} {:.{prec}f}".format(x, y, z, prec=precision)
+                index = vertex_indices.get(vertex)
+                if index is None:
+                    index = vertex_indices[vertex] = len(vertex_indices)
+                coord_index.append(str(index))
+            coord_index.append("-1")
+
+        vertices = sorted(vertex_indices, key=vertex_indices.get)
+        return [" ".join(coord_index), " ".join(vertices)]
+
+
+class BTLxExportReport(object):
+    """Collects the joints which could not be exported to BTLx.
+
+    Attributes
+    ----------
+    unsupported_joints : list(:class:`~compas_timber.connections.Joint`)
+        The joints for which no joint factory is registered.
+    unsupported_joint_types : list(str)
+        The names of the types of the unsupported joints.
+
+    """
+
+    def __init__(self):
+        self.unsupported_joints = []
+
+    def __bool__(self):
+        return bool(self.unsupported_joints)
+
+    __nonzero__ = __bool__
+
+    def __str__(self):
+        if not self.unsupported_joints:
+            return "All joints exported."
+        return "{} joint(s) not exported, no joint factory registered for: {}".format(
+            len(self.unsupported_joints), ", ".join(self.unsupported_joint_types)
+        )
+
+    @property
+    def unsupported_joint_types(self):
+        names = []
+        for joint in self.unsupported_joints:
+            name = type(joint).__name__
+            if name not in names:
+                names.append(name)
+        return names
+
+    def add_unsupported_joint(self, joint):
+        """Adds a joint for which no joint factory is registered, if it was not added yet.
+
+        Parameters
+        ----------
+        joint : :class:`~compas_timber.connections.Joint`
+            The joint.
+
+        """
+        if joint not in self.unsupported_joints:
+            self.unsupported_joints.append(joint)
+
+
+class BTLxPartCache(object):
+    """Keeps the BTLxParts of previous exports so that unchanged parts don't have to be regenerated.
+
+    A part is reused when its fingerprint, which covers the beam, its storey, group and package attributes and all the
+    joints connected to it, is unchanged.
+    Pass the same cache to consecutive :class:`~compas_timber.fabrication.BTLx` exports of an assembly.
+
+    Attributes
+    ----------
+    hits : int
+        The number of parts which were reused from this cache.
+    misses : int
+        The number of parts which had to be regenerated.
+
+    """
+
+    def __init__(self):
+        self._parts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._parts)
+
+    @staticmethod
+    def fingerprint(beam, joints):
+        """Returns a value which changes whenever the BTLx part of the given beam should be regenerated.
+
+        Parameters
+        ----------
+        beam : :class:`~compas_timber.parts.Beam`
+            The beam of the part.
+        joints : list(:class:`~compas_timber.connections.Joint`)
+            The joints connected to the beam.
+
+        Returns
+        -------
+        tuple
+
+        """
+        fingerprint = [
+            str(beam.key),
+            beam.geometry_signature,
+            beam.blank_length,
+            tuple(beam.blank_frame.point),
+            tuple(str(beam.attributes.get(name, "")) for name in ("storey", "group", "package")),
+            BTLx.POINT_PRECISION,
+            BTLx.ANGLE_PRECISION,
+        ]
+        for joint in joints:
+            fingerprint.append(type(joint).__name__)
+            fingerprint.append(json.dumps(joint.__data__, sort_keys=True))
+            fingerprint.append(tuple(other.geometry_signature for other in joint.beams))
+        return tuple(fingerprint)
+
+    def get(self, key, fingerprint):
+        """Returns the cached part with the given key if its fingerprint matches, None otherwise.
+
+        Parameters
+        ----------
+        key : str
+            The key of the part.
+        fingerprint : tuple
+            The current fingerprint of the part, see :meth:`fingerprint`.
+
+        Returns
+        -------
+        :class:`~compas_timber.fabrication.btlx.BTLxPart` | None
+
+        """
+        cached = self._parts.get(key)
+        if cached and cached[0] == fingerprint:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        return None
+
+    def add(self, key, fingerprint, part):
+        """Adds a generated part to this cache, replacing any previous part with the same key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the part.
+        fingerprint : tuple
+            The fingerprint of the part, see :meth:`fingerprint`.
+        part : :class:`~compas_timber.fabrication.btlx.BTLxPart`
+            The part.
+
+        """
+        self._parts[key] = (fingerprint, part)
+
+    def retain(self, keys):
+        """Removes all the parts from this cache except the ones with the given keys.
+
+        Parameters
+        ----------
+        keys : iterable(str)
+            The keys of the parts to keep.
+
+        """
+        keys = set(keys)
+        for key in list(self._parts.keys()):
+            if key not in keys:
+                del self._parts[key]
+
+    def clear(self):
+        """Removes all the parts from this cache."""
+        self._parts = {}
 
 
 class BTLxProcess(object):
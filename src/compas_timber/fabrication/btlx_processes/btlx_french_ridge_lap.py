@@ -105,15 +105,16 @@ class BTLxFrenchRidgeLap(object):
         This property is required for all process types. It returns a dict with the geometric parameters to fabricate the joint. Use OrderedDict to maintain original order
         """
         self.get_params()
+        start_x, angle, drill_hole_diameter = BTLx.format_values([self.startX, self.angle, self.drill_hole_diameter])
 
         self.process_parameters = OrderedDict(
             [
                 ("Orientation", str(self.orientation)),
-                ("StartX", "{:.{prec}f}".format(self.startX, prec=BTLx.POINT_PRECISION)),
-                ("Angle", "{:.{prec}f}".format(self.angle, prec=BTLx.POINT_PRECISION)),
+                ("StartX", start_x),
+                ("Angle", angle),
                 ("RefPosition", self.ref_edge),
                 ("Drillhole", self.drill_hole),
-                ("DrillholeDiam", "{:.{prec}f}".format(self.drill_hole_diameter, prec=BTLx.POINT_PRECISION)),
+                ("DrillholeDiam", drill_hole_diameter),
             ]
         )
 
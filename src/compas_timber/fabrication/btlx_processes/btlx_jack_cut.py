@@ -56,14 +56,18 @@ class BTLxJackCut(object):
 
         if self.apply_process:
             """the following attributes are specific to Jack Cut"""
+            start_x, start_y, start_depth, angle, inclination = BTLx.format_values(
+                [self.startX, self.startY, self.start_depth, self.angle, self.inclination],
+                [BTLx.POINT_PRECISION] * 3 + [BTLx.ANGLE_PRECISION] * 2,
+            )
             od = OrderedDict(
                 [
                     ("Orientation", str(self.orientation)),
-                    ("StartX", "{:.{prec}f}".format(self.startX, prec=BTLx.POINT_PRECISION)),
-                    ("StartY", "{:.{prec}f}".format(self.startY, prec=BTLx.POINT_PRECISION)),
-                    ("StartDepth", "{:.{prec}f}".format(self.start_depth, prec=BTLx.POINT_PRECISION)),
-                    ("Angle", "{:.{prec}f}".format(self.angle, prec=BTLx.ANGLE_PRECISION)),
-                    ("Inclination", "{:.{prec}f}".format(self.inclination, prec=BTLx.ANGLE_PRECISION)),
+                    ("StartX", start_x),
+                    ("StartY", start_y),
+                    ("StartDepth", start_depth),
+                    ("Angle", angle),
+                    ("Inclination", inclination),
                 ]
             )
             return od
@@ -0,0 +1,205 @@
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+
+from compas_timber.assembly import TimberAssembly
+from compas_timber.parts import Beam
+
+from .btlx import BTLxProcess
+
+
+def _local_name(tag):
+    # removes the namespace, e.g. "{https://www.design2machine.com}Part" -> "Part"
+    return tag.rsplit("}", 1)[-1]
+
+
+def _read_vector(element):
+    return [float(element.get(name)) for name in ("X", "Y", "Z")]
+
+
+class BTLxPartRecord(object):
+    """A part read from a BTLx file.
+
+    Parameters
+    ----------
+    attr : dict
+        The attributes of the `Part` element.
+    transformations : list(:class:`~compas.geometry.Frame`)
+        The frame of each instance of the part, at the corner of its blank.
+    processings : list(:class:`~compas_timber.fabrication.BTLxProcess`)
+        The processings of the part.
+    shape_strings : list(str), optional
+        The face indices and the vertex coordinates of the shape of the part.
+
+    Attributes
+    ----------
+    attr : dict
+        The attributes of the `Part` element.
+    key : str
+        The single member number of the part.
+    count : int
+        The number of instances of the part.
+    length : float
+        The length of the blank of the part.
+    width : float
+        The width of the part.
+    height : float
+        The height of the part.
+    transformations : list(:class:`~compas.geometry.Frame`)
+        The frame of each instance of the part, at the corner of its blank.
+    processings : list(:class:`~compas_timber.fabrication.BTLxProcess`)
+        The processings of the part.
+    shape_strings : list(str)
+        The face indices and the vertex coordinates of the shape of the part.
+
+    """
+
+    def __init__(self, attr, transformations, processings, shape_strings=None):
+        self.attr = attr
+        self.transformations = transformations
+        self.processings = processings
+        self.shape_strings = shape_strings
+
+    @property
+    def key(self):
+        return self.attr.get("SingleMemberNumber")
+
+    @property
+    def count(self):
+        return int(self.attr.get("Count", 1))
+
+    @property
+    def length(self):
+        return float(self.attr["Length"])
+
+    @property
+    def width(self):
+        return float(self.attr["Width"])
+
+    @property
+    def height(self):
+        return float(self.attr["Height"])
+
+    def to_beams(self):
+        """Creates a beam at each transformation of this part.
+
+        The beams have the length of the blank, blank extensions are not stored in the BTLx file.
+
+        Returns
+        -------
+        list(:class:`~compas_timber.parts.Beam`)
+
+        """
+        # inverse of `BTLxPart`, which swaps width and height and places its frame at the corner of the blank
+        beam_width = self.height
+        beam_height = self.width
+        beams = []
+        for frame in self.transformations:
+            point = frame.point + frame.yaxis * (beam_width * 0.5) + frame.zaxis * (beam_height * 0.5)
+            beams.append(Beam(Frame(point, frame.xaxis, frame.yaxis), self.length, beam_width, beam_height))
+        return beams
+
+
+class BTLxReader(object):
+    """Reads the parts of a BTLx file one at a time, without loading the whole document.
+
+    Parameters
+    ----------
+    source : str | file
+        The path of the BTLx file or a file object opened in binary mode.
+
+    Examples
+    --------
+    >>> reader = BTLxReader("project.btlx")  # doctest: +SKIP
+    >>> for part in reader.iter_parts():  # doctest: +SKIP
+    ...     print(part.key, len(part.processings))
+
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    def iter_parts(self):
+        """Yields the parts of the file in the order of the file.
+
+        Each `Part` element is removed from the parsed tree once its record was created,
+        so only one part is kept in memory at a time.
+
+        Returns
+        -------
+        generator(:class:`~compas_timber.fabrication.BTLxPartRecord`)
+
+        """
+        parents = []
+        for event, element in ET.iterparse(self.source, events=("start", "end")):
+            if event == "start":
+                parents.append(element)
+                continue
+            parents.pop()
+            if _local_name(element.tag) != "Part":
+                continue
+            record = self._create_record(element)
+            if parents:
+                parents[-1].remove(element)
+            yield record
+
+    def iter_beams(self):
+        """Yields a beam for each instance of each part of the file.
+
+        Returns
+        -------
+        generator(:class:`~compas_timber.parts.Beam`)
+
+        """
+        for part in self.iter_parts():
+            for beam in part.to_beams():
+                yield beam
+
+    def to_assembly(self):
+        """Creates an assembly of the beams of the file, without joints.
+
+        Returns
+        -------
+        :class:`~compas_timber.assembly.TimberAssembly`
+
+        """
+        assembly = TimberAssembly()
+        for beam in self.iter_beams():
+            assembly.add_beam(beam)
+        return assembly
+
+    def _create_record(self, element):
+        transformations = []
+        processings = []
+        shape_strings = None
+        for child in element:
+            name = _local_name(child.tag)
+            if name == "Transformations":
+                for transformation in child:
+                    transformations.append(self._read_transformation(transformation))
+            elif name == "Processings":
+                for processing in child:
+                    processings.append(self._read_processing(processing))
+            elif name == "Shape":
+                for face_set in child:
+                    coordinates = [coordinate.get("point", "") for coordinate in face_set]
+                    shape_strings = [face_set.get("coordIndex", ""), " ".join(coordinates)]
+        return BTLxPartRecord(dict(element.attrib), transformations, processings, shape_strings)
+
+    @staticmethod
+    def _read_transformation(element):
+        vectors = {}
+        for position in element:
+            for child in position:
+                vectors[_local_name(child.tag)] = _read_vector(child)
+        return Frame(Point(*vectors["ReferencePoint"]), Vector(*vectors["XVector"]), Vector(*vectors["YVector"]))
+
+    @staticmethod
+    def _read_processing(element):
+        parameters = OrderedDict()
+        for child in element:
+            parameters[_local_name(child.tag)] = child.text or ""
+        return BTLxProcess(_local_name(element.tag), dict(element.attrib), parameters)
@@ -0,0 +1,72 @@
+import math
+from collections import OrderedDict
+
+
+def partition_beams_by_count(beams, count):
+    """Partitions beams into shards of at most `count` beams, in the order of the beams.
+
+    Parameters
+    ----------
+    beams : list(:class:`~compas_timber.parts.Beam`)
+        The beams to partition.
+    count : int
+        The maximum number of beams per shard.
+
+    Returns
+    -------
+    list(list(:class:`~compas_timber.parts.Beam`))
+
+    """
+    if count < 1:
+        raise ValueError("The number of beams per shard must be at least 1, got: {}".format(count))
+    beams = list(beams)
+    return [beams[index : index + count] for index in range(0, len(beams), count)]
+
+
+def partition_beams_by_attribute(beams, name, default=None):
+    """Partitions beams into shards of beams with the same value of an attribute, e.g. "storey", "group" or "package".
+
+    Parameters
+    ----------
+    beams : list(:class:`~compas_timber.parts.Beam`)
+        The beams to partition.
+    name : str
+        The name of the attribute in `beam.attributes`.
+    default : object, optional
+        The value used for beams which do not have the attribute.
+
+    Returns
+    -------
+    list(list(:class:`~compas_timber.parts.Beam`))
+        The shards in the order in which their attribute values first occur.
+
+    """
+    shards = OrderedDict()
+    for beam in beams:
+        shards.setdefault(beam.attributes.get(name, default), []).append(beam)
+    return list(shards.values())
+
+
+def partition_beams_by_region(beams, cell_size):
+    """Partitions beams into shards of beams whose midpoints are in the same cell of a regular grid.
+
+    Parameters
+    ----------
+    beams : list(:class:`~compas_timber.parts.Beam`)
+        The beams to partition.
+    cell_size : float
+        The size of the cubic cells of the grid.
+
+    Returns
+    -------
+    list(list(:class:`~compas_timber.parts.Beam`))
+        The shards in the order in which their cells first occur.
+
+    """
+    if cell_size <= 0:
+        raise ValueError("The cell size must be positive, got: {}".format(cell_size))
+    shards = OrderedDict()
+    for beam in beams:
+        cell = tuple(int(math.floor(value / cell_size)) for value in beam.midpoint)
+        shards.setdefault(cell, []).append(beam)
+    return list(shards.values())
@@ -5,6 +5,7 @@ from .workflow import FeatureDefinition
 from .workflow import JointOptions
 from .workflow import JointDefinition
 from .workflow import DebugInfomation
+from .workflow import SolveStats
 
 __all__ = [
     "JointDefinition",
@@ -14,4 +15,5 @@ __all__ = [
     "FeatureDefinition",
     "JointOptions",
     "DebugInfomation",
+    "SolveStats",
 ]
@@ -12,6 +12,7 @@ from compas_timber.ghpython import CategoryRule
 from compas_timber.ghpython import TopologyRule
 from compas_timber.ghpython import DirectRule
 from compas_timber.ghpython import DebugInfomation
+from compas_timber.ghpython import SolveStats
 
 
 class Assembly(component):
@@ -103,6 +104,7 @@ class Assembly(component):
 
         Assembly = TimberAssembly()
         debug_info = DebugInfomation()
+        solve_stats = SolveStats()
 
         topologies = []
         solver = ConnectionSolver()
@@ -134,7 +136,8 @@ class Assembly(component):
                 if beam_pair_ids in handled_beams:
                     continue
                 try:
-                    joint.joint_type.create(Assembly, *beams_to_pair, **joint.kwargs)
+                    with solve_stats.measure_joint(joint.joint_type, beams_to_pair):
+                        joint.joint_type.create(Assembly, *beams_to_pair, **joint.kwargs)
                 except BeamJoinningError as bje:
                     debug_info.add_joint_error(bje)
                 else:
@@ -150,11 +153,12 @@ class Assembly(component):
         Geometry = None
         scene = Scene()
         if CreateGeometry:
-            vis_consumer = BrepGeometryConsumer(Assembly)
+            vis_consumer = BrepGeometryConsumer(Assembly, optimize=True, compound=True)
             for result in vis_consumer.result:
                 scene.add(result.geometry)
                 if result.debug_info:
                     debug_info.add_feature_error(result.debug_info)
+            solve_stats.add_feature_stats(vis_consumer.stats)
         else:
             for beam in Assembly.beams:
                 scene.add(beam.blank)
@@ -163,4 +167,4 @@ class Assembly(component):
             self.AddRuntimeMessage(Warning, "Error found during joint creation. See DebugInfo output for details.")
 
         Geometry = scene.draw()
-        return Assembly, Geometry, debug_info
+        return Assembly, Geometry, debug_info, solve_stats
@@ -3,16 +3,24 @@ from ghpythonlib.componentbase import executingcomponent as component
 from Grasshopper.Kernel.GH_RuntimeMessageLevel import Warning
 
 from compas_timber.fabrication import BTLx
+from compas_timber.fabrication import BTLxPartCache
 
 
 class WriteBTLx(component):
+    def __init__(self):
+        super(WriteBTLx, self).__init__()
+        # keeps the parts of the previous solution, only changed parts are regenerated
+        self._cache = BTLxPartCache()
+
     def RunScript(self, Assembly, Path, Write):
         if not Assembly:
             self.AddRuntimeMessage(Warning, "Input parameter Assembly failed to collect data")
             return
 
-        btlx = BTLx(Assembly)
+        btlx = BTLx(Assembly, cache=self._cache)
         btlx.history["FileName"] = Rhino.RhinoDoc.ActiveDoc.Name
+        if btlx.report:
+            self.AddRuntimeMessage(Warning, str(btlx.report))
 
         if Write:
             if not Path:
@@ -0,0 +1,20 @@
+# flake8: noqa
+from Grasshopper.Kernel.GH_RuntimeMessageLevel import Warning
+from ghpythonlib.componentbase import executingcomponent as component
+
+
+class ShowSolveStats(component):
+    def RunScript(self, SolveStats):
+        if not SolveStats:
+            self.AddRuntimeMessage(Warning, "Input parameter 'SolveStats' failed to collect data")
+            return
+
+        joint_types = sorted(SolveStats.joint_counts)
+        counts = [SolveStats.joint_counts[name] for name in joint_types]
+        mean_times = [SolveStats.joint_times[name] / SolveStats.joint_counts[name] for name in joint_types]
+        slowest = ["{:.6f}s {} {}".format(duration, name, keys) for duration, name, keys in SolveStats.slowest_joints]
+        slowest_keys = [keys for _, _, keys in SolveStats.slowest_joints]
+        feature_types = sorted(SolveStats.feature_counts)
+        failure_rates = [SolveStats.failure_rate(name) for name in feature_types]
+
+        return SolveStats.report(), joint_types, counts, mean_times, slowest, slowest_keys, feature_types, failure_rates
@@ -1,3 +1,7 @@
+import bisect
+import heapq
+from timeit import default_timer
+
 from compas_timber.connections import LMiterJoint
 from compas_timber.connections import TButtJoint
 from compas_timber.utils.compas_extra import intersection_line_line_3D
@@ -333,3 +337,203 @@ class DebugInfomation(object):
 
     def add_joint_error(self, error):
         self.joint_errors.append(error)
+
+
+class _JointTimer(object):
+    def __init__(self, stats, joint_type, beams):
+        self.stats = stats
+        self.joint_type = joint_type
+        self.beams = beams
+
+    def __enter__(self):
+        self._start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = default_timer() - self._start
+        self.stats.add_joint(self.joint_type, self.beams, duration, failed=exc_type is not None)
+        return False
+
+
+class SolveStats(object):
+    """Container for statistics of the joints and features of a solve, allowing to find joints which take long.
+
+    Parameters
+    ----------
+    slowest_count : int, optional
+        The number of slowest joints to keep.
+    bins : list(float), optional
+        The upper bounds of the wall time histogram bins in seconds, in increasing order.
+        Joints slower than the last bound are counted in an additional bin.
+
+    Attributes
+    ----------
+    joint_counts : dict(str, int)
+        The number of joints of each joint type.
+    joint_failures : dict(str, int)
+        The number of joints of each joint type which failed.
+    joint_times : dict(str, float)
+        The total wall time in seconds of the joints of each joint type.
+    histograms : dict(str, list(int))
+        The number of joints of each joint type per wall time bin.
+    slowest_joints : list(tuple(float, str, list))
+        The wall time, joint type and beam keys of the slowest joints, slowest first.
+    feature_counts : dict(str, dict(str, int))
+        The number of applied, culled and failed features of each feature type.
+
+    See Also
+    --------
+    :class:`~compas_timber.ghpython.DebugInfomation`
+    :class:`~compas_timber.consumers.FeatureApplicationStats`
+
+    """
+
+    BINS = [0.001, 0.01, 0.1, 1.0]
+
+    def __init__(self, slowest_count=10, bins=None):
+        self.slowest_count = slowest_count
+        self.bins = bins or self.BINS
+        self.joint_counts = {}
+        self.joint_failures = {}
+        self.joint_times = {}
+        self.histograms = {}
+        self.feature_counts = {}
+        self._slowest = []  # min-heap of the slowest joints
+        self._index = 0
+
+    def __repr__(self):
+        return "{}({} joints, {} joint types, {:.3f}s)".format(
+            SolveStats.__name__, sum(self.joint_counts.values()), len(self.joint_counts), sum(self.joint_times.values())
+        )
+
+    def ToString(self):
+        return repr(self)
+
+    @property
+    def slowest_joints(self):
+        return [(duration, joint_type, keys) for duration, _, joint_type, keys in sorted(self._slowest, reverse=True)]
+
+    def measure_joint(self, joint_type, beams):
+        """Returns a context manager which adds the wall time of its block as a joint of `joint_type`.
+
+        The joint is counted as failed if the block raises.
+
+        Parameters
+        ----------
+        joint_type : cls(:class:`~compas_timber.connections.Joint`)
+        beams : list(:class:`~compas_timber.parts.Beam`)
+
+        Returns
+        -------
+        context manager
+
+        """
+        return _JointTimer(self, joint_type, beams)
+
+    def add_joint(self, joint_type, beams, duration, failed=False):
+        """Adds the wall time of a joint.
+
+        Parameters
+        ----------
+        joint_type : cls(:class:`~compas_timber.connections.Joint`)
+        beams : list(:class:`~compas_timber.parts.Beam`)
+        duration : float
+            The wall time in seconds.
+        failed : bool, optional
+            Whether the joint failed.
+
+        """
+        name = joint_type.__name__
+        self.joint_counts[name] = self.joint_counts.get(name, 0) + 1
+        self.joint_times[name] = self.joint_times.get(name, 0.0) + duration
+        if failed:
+            self.joint_failures[name] = self.joint_failures.get(name, 0) + 1
+        if name not in self.histograms:
+            self.histograms[name] = [0] * (len(self.bins) + 1)
+        self.histograms[name][bisect.bisect_left(self.bins, duration)] += 1
+
+        # the index keeps joints of equal duration from being compared by their keys
+        self._index += 1
+        entry = (duration, -self._index, name, [beam.key for beam in beams])
+        if len(self._slowest) < self.slowest_count:
+            heapq.heappush(self._slowest, entry)
+        elif self._slowest and entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def add_feature_stats(self, stats):
+        """Adds the feature counts of a geometry consumer.
+
+        Parameters
+        ----------
+        stats : :class:`~compas_timber.consumers.FeatureApplicationStats`
+
+        """
+        for name, counts in stats.by_feature_type.items():
+            totals = self.feature_counts.setdefault(name, {"applied": 0, "culled": 0, "failed": 0})
+            for outcome, count in counts.items():
+                totals[outcome] = totals.get(outcome, 0) + count
+
+    def failure_rate(self, feature_type):
+        """Returns the fraction of the attempted booleans of a feature type which failed.
+
+        Parameters
+        ----------
+        feature_type : str
+            The name of the feature type, e.g. "DrillFeature".
+
+        Returns
+        -------
+        float
+
+        """
+        counts = self.feature_counts.get(feature_type, {})
+        attempted = counts.get("applied", 0) + counts.get("failed", 0)
+        return float(counts.get("failed", 0)) / attempted if attempted else 0.0
+
+    def histogram_labels(self):
+        """Returns the labels of the wall time histogram bins.
+
+        Returns
+        -------
+        list(str)
+
+        """
+        labels = ["<{}s".format(bound) for bound in self.bins]
+        labels.append(">={}s".format(self.bins[-1]))
+        return labels
+
+    def report(self):
+        """Returns a human readable report of the statistics.
+
+        Returns
+        -------
+        str
+
+        """
+        labels = self.histogram_labels()
+        lines = ["Joints:"]
+        for name in sorted(self.joint_counts):
+            count = self.joint_counts[name]
+            lines.append(
+                "  {}: {} joints, {} failed, {:.3f}s total, {:.6f}s mean".format(
+                    name,
+                    count,
+                    self.joint_failures.get(name, 0),
+                    self.joint_times[name],
+                    self.joint_times[name] / count,
+                )
+            )
+            histogram = ", ".join("{} {}".format(label, n) for label, n in zip(labels, self.histograms[name]))
+            lines.append("    {}".format(histogram))
+        lines.append("Slowest joints:")
+        for duration, name, keys in self.slowest_joints:
+            lines.append("  {:.6f}s {} beams: {}".format(duration, name, keys))
+        lines.append("Features:")
+        for name in sorted(self.feature_counts):
+            counts = self.feature_counts[name]
+            lines.append(
+                "  {}: {} applied, {} culled, {} failed, {:.1%} failure rate".format(
+                    name, counts["applied"], counts["culled"], counts["failed"], self.failure_rate(name)
+                )
+            )
+        return "\n".join(lines)
@@ -10,6 +10,7 @@ from compas.geometry import Vector
 from compas.geometry import add_vectors
 from compas.geometry import angle_vectors
 from compas.geometry import cross_vectors
+from compas.geometry import scale_vector
 
 from compas_timber.utils.compas_extra import intersection_line_plane
 
@@ -79,6 +80,12 @@ class Beam(Part):
         A list containing the 4 lines along the long axis of this beam.
     midpoint : :class:`~compas.geometry.Point`
         The point at the middle of the centerline of this beam.
+    geometry_signature : tuple(float)
+        A flat tuple of the frame and dimensions of this beam. Changes whenever the beam's geometry changes.
+    face_origins : list(tuple(float, float, float))
+        The origins of the 6 faces of this beam, in the same order as `faces`.
+    face_normals : list(tuple(float, float, float))
+        The unit normals of the 6 faces of this beam, in the same order as `faces`.
 
     """
 
@@ -89,6 +96,7 @@ class Beam(Part):
         self.length = length
         self.features = []
         self._blank_extensions = {}
+        self._face_table = None
 
     @property
     def __data__(self):
@@ -129,34 +137,92 @@ class Beam(Part):
 
     @property
     def faces(self):
-        return [
-            Frame(
-                Point(*add_vectors(self.midpoint, self.frame.yaxis * self.width * 0.5)),
-                self.frame.xaxis,
-                -self.frame.zaxis,
-            ),
-            Frame(
-                Point(*add_vectors(self.midpoint, -self.frame.zaxis * self.height * 0.5)),
-                self.frame.xaxis,
-                -self.frame.yaxis,
-            ),
-            Frame(
-                Point(*add_vectors(self.midpoint, -self.frame.yaxis * self.width * 0.5)),
-                self.frame.xaxis,
-                self.frame.zaxis,
-            ),
-            Frame(
-                Point(*add_vectors(self.midpoint, self.frame.zaxis * self.height * 0.5)),
-                self.frame.xaxis,
-                self.frame.yaxis,
-            ),
-            Frame(self.frame.point, -self.frame.yaxis, self.frame.zaxis),  # small face at start point
-            Frame(
-                Point(*add_vectors(self.frame.point, self.frame.xaxis * self.length)),
-                self.frame.yaxis,
-                self.frame.zaxis,
-            ),  # small face at end point
+        return [self.face_frame(index) for index in range(6)]
+
+    @property
+    def geometry_signature(self):
+        point = self.frame.point
+        xaxis = self.frame.xaxis
+        yaxis = self.frame.yaxis
+        return (
+            point[0],
+            point[1],
+            point[2],
+            xaxis[0],
+            xaxis[1],
+            xaxis[2],
+            yaxis[0],
+            yaxis[1],
+            yaxis[2],
+            self.length,
+            self.width,
+            self.height,
+        )
+
+    @property
+    def face_origins(self):
+        return self._get_face_table()[0]
+
+    @property
+    def face_normals(self):
+        return self._get_face_table()[3]
+
+    def face_frame(self, index):
+        """Returns the frame of a single face of this beam.
+
+        Cheaper than indexing into `faces`, which creates the frames of all 6 faces.
+
+        Parameters
+        ----------
+        index : int
+            The index of the face, see `faces` for the convention.
+
+        Returns
+        -------
+        :class:`~compas.geometry.Frame`
+
+        """
+        origins, xaxes, yaxes, _ = self._get_face_table()
+        return Frame(origins[index], xaxes[index], yaxes[index])
+
+    def _get_face_table(self):
+        """Returns the origins, x-axes, y-axes and normals of the 6 faces of this beam as lists of tuples.
+
+        The table is cached and only recalculated when the beam's frame or dimensions change.
+
+        """
+        signature = self.geometry_signature
+        if self._face_table and self._face_table[0] == signature:
+            return self._face_table[1]
+
+        ox, oy, oz, xx, xy, xz, yx, yy, yz, length, width, height = signature
+        x = (xx, xy, xz)
+        y = (yx, yy, yz)
+        z = tuple(cross_vectors(x, y))
+        nx = (-xx, -xy, -xz)
+        ny = (-yx, -yy, -yz)
+        nz = (-z[0], -z[1], -z[2])
+        start = (ox, oy, oz)
+        end = tuple(add_vectors(start, scale_vector(x, length)))
+        mid = tuple(add_vectors(start, scale_vector(x, length * 0.5)))
+        w = width * 0.5
+        h = height * 0.5
+
+        origins = [
+            tuple(add_vectors(mid, scale_vector(y, w))),
+            tuple(add_vectors(mid, scale_vector(z, -h))),
+            tuple(add_vectors(mid, scale_vector(y, -w))),
+            tuple(add_vectors(mid, scale_vector(z, h))),
+            start,  # small face at start point
+            end,  # small face at end point
         ]
+        xaxes = [x, x, x, x, ny, y]
+        yaxes = [nz, ny, z, y, z, z]
+        normals = [y, nz, ny, z, nx, x]
+
+        table = (origins, xaxes, yaxes, normals)
+        self._face_table = (signature, table)
+        return table
 
     @property
     def centerline(self):
@@ -1,11 +1,49 @@
+import compas
+
 from .sequencer import Actor
 from .sequencer import BuildingPlan
+from .sequencer import Instruction
+from .sequencer import LinearDimension
+from .sequencer import Model3d
+from .sequencer import Removal
 from .sequencer import SimpleSequenceGenerator
 from .sequencer import Step
+from .sequencer import Text3d
+from .sequencer import iter_chunks
+from .dependency import DependencySequenceGenerator
+from .dependency import cross_beam_first
+from .dependency import no_precedence
+from .plan_stream import BuildingPlanReader
+from .plan_stream import BuildingPlanWriter
+from .scheduler import Schedule
+from .scheduler import ScheduledStep
+from .scheduler import StepScheduler
+
+if not compas.IPY:
+    from .plan_numpy import BuildingPlanArrays
 
 __all__ = [
     "Actor",
     "BuildingPlan",
+    "Instruction",
+    "LinearDimension",
+    "Model3d",
+    "Removal",
     "Step",
+    "Text3d",
     "SimpleSequenceGenerator",
+    "iter_chunks",
+    "BuildingPlanReader",
+    "BuildingPlanWriter",
+    "DependencySequenceGenerator",
+    "cross_beam_first",
+    "no_precedence",
+    "Schedule",
+    "ScheduledStep",
+    "StepScheduler",
 ]
+
+if not compas.IPY:
+    __all__ += [
+        "BuildingPlanArrays",
+    ]
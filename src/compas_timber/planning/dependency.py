@@ -0,0 +1,292 @@
+from compas_timber.connections import FrenchRidgeLapJoint
+from compas_timber.connections import LButtJoint
+from compas_timber.connections import LHalfLapJoint
+from compas_timber.connections import LMiterJoint
+from compas_timber.connections import TButtJoint
+from compas_timber.connections import THalfLapJoint
+from compas_timber.connections import XHalfLapJoint
+
+from .sequencer import Actor
+from .sequencer import BuildingPlan
+from .sequencer import Step
+from .sequencer import iter_chunks
+
+
+def cross_beam_first(joint):
+    """Precedence rule of joints whose main beam is placed against, or into, an already placed cross beam.
+
+    Parameters
+    ----------
+    joint : :class:`~compas_timber.connections.Joint`
+
+    Returns
+    -------
+    list(tuple(:class:`~compas_timber.parts.Beam`, :class:`~compas_timber.parts.Beam`))
+        The pairs of beams where the first has to be placed before the second.
+
+    """
+    return [(joint.cross_beam, joint.main_beam)]
+
+
+def no_precedence(joint):
+    """Precedence rule of joints whose beams can be placed in any order.
+
+    Parameters
+    ----------
+    joint : :class:`~compas_timber.connections.Joint`
+
+    Returns
+    -------
+    list
+
+    """
+    return []
+
+
+def _strongly_connected_components(nodes, successors, is_included):
+    """Returns the index of the strongly connected component of each node, with Tarjan's algorithm.
+
+    Only edges between nodes for which `is_included` is True are considered.
+
+    """
+    components = {}
+    indices = {}
+    lowlinks = {}
+    on_stack = set()
+    stack = []
+    component_count = 0
+    for root in nodes:
+        if root in indices:
+            continue
+        indices[root] = lowlinks[root] = len(indices)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if not is_included(child):
+                    continue
+                if child not in indices:
+                    indices[child] = lowlinks[child] = len(indices)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors[child])))
+                    break
+                if child in on_stack:
+                    lowlinks[node] = min(lowlinks[node], indices[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+                if lowlinks[node] == indices[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        components[member] = component_count
+                        if member == node:
+                            break
+                    component_count += 1
+    return components
+
+
+class DependencySequenceGenerator(object):
+    """Generates a sequence of steps in which each beam is placed after the beams it depends on.
+
+    The dependencies are derived from the joints of the assembly by the precedence rule of their type,
+    e.g. the main beam of a T-butt joint is placed after its cross beam.
+    Beams are grouped into levels with a topological sort, which takes O(V+E) time for V beams and E joints.
+    The steps of beams in the same level have the same priority and can be executed in parallel.
+
+    Dependency cycles are broken by placing a beam of each cycle which does not wait for other beams, the one with
+    the fewest remaining dependencies and first in the assembly. Their keys are listed in `cycle_breaks`.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_timber.assembly.TimberAssembly`
+        Assembly to be sequenced.
+
+    Attributes
+    ----------
+    PRECEDENCE_RULES : dict(type, callable)
+        The precedence rule of each joint type. Subclasses of the joint types use the rule of their closest base,
+        joints without a rule add no dependencies.
+    result : :class:`BuildingPlan`
+        Resulting building plan.
+    cycle_breaks : list(int)
+        The keys of the beams which were placed to break a dependency cycle by the last sequencing.
+
+    """
+
+    PRECEDENCE_RULES = {
+        TButtJoint: cross_beam_first,
+        LButtJoint: cross_beam_first,
+        THalfLapJoint: cross_beam_first,
+        LHalfLapJoint: no_precedence,
+        XHalfLapJoint: no_precedence,
+        LMiterJoint: no_precedence,
+        FrenchRidgeLapJoint: no_precedence,
+    }
+
+    def __init__(self, assembly):
+        self.assembly = assembly
+        self.cycle_breaks = []
+
+    @property
+    def result(self):
+        return BuildingPlan(list(self.iter_steps()))
+
+    def get_precedence(self, joint):
+        """Returns the pairs of beams of a joint where the first has to be placed before the second.
+
+        Parameters
+        ----------
+        joint : :class:`~compas_timber.connections.Joint`
+
+        Returns
+        -------
+        list(tuple(:class:`~compas_timber.parts.Beam`, :class:`~compas_timber.parts.Beam`))
+
+        """
+        for joint_type in type(joint).__mro__:
+            rule = self.PRECEDENCE_RULES.get(joint_type)
+            if rule:
+                return rule(joint)
+        return []
+
+    def iter_precedence(self):
+        """Yields the dependencies between the beams of the assembly.
+
+        Returns
+        -------
+        generator(tuple(int, int))
+            The keys of pairs of beams where the first has to be placed before the second.
+
+        """
+        for joint in self.assembly.joints:
+            for before, after in self.get_precedence(joint):
+                yield before.key, after.key
+
+    def iter_groups(self):
+        """Yields the levels of the sequence, each level can be placed once all previous levels are placed.
+
+        Within a level, beams are in the order in which they became free of dependencies.
+
+        Returns
+        -------
+        generator(list(:class:`~compas_timber.parts.Beam`))
+
+        """
+        beams = self.assembly.beams
+        indices = {beam.key: index for index, beam in enumerate(beams)}
+        successors = [[] for _ in beams]
+        in_degrees = [0] * len(beams)
+        for before, after in self.iter_precedence():
+            successors[indices[before]].append(indices[after])
+            in_degrees[indices[after]] += 1
+
+        self.cycle_breaks = []
+        placed = [False] * len(beams)
+        # the strongly connected components of the unplaced beams, only computed once a cycle stops the sequencing
+        components = None
+        level = [index for index, in_degree in enumerate(in_degrees) if in_degree == 0]
+        remaining = len(beams)
+        while remaining:
+            if not level:
+                # every remaining beam waits for another one, the cycles which don't wait for other beams are in the
+                # components without dependencies on other components, a beam of each of them is placed
+                if components is None:
+                    components, members, component_in_degrees = self._create_components(successors, placed)
+                    unplaced_counts = [len(component_members) for component_members in members]
+                    free_components = set(c for c, in_degree in enumerate(component_in_degrees) if not in_degree)
+                for component in sorted(free_components):
+                    level.extend(self._find_cycle_breaks(members[component], successors, in_degrees, placed))
+                self.cycle_breaks.extend(beams[index].key for index in level)
+            for index in level:
+                placed[index] = True
+                if components is not None:
+                    component = components[index]
+                    unplaced_counts[component] -= 1
+                    if not unplaced_counts[component]:
+                        free_components.discard(component)
+            remaining -= len(level)
+            yield [beams[index] for index in level]
+
+            next_level = []
+            for index in level:
+                for successor in successors[index]:
+                    in_degrees[successor] -= 1
+                    if in_degrees[successor] == 0 and not placed[successor]:
+                        next_level.append(successor)
+                    if components is None:
+                        continue
+                    component = components[successor]
+                    if component != components[index]:
+                        component_in_degrees[component] -= 1
+                        if not component_in_degrees[component] and unplaced_counts[component]:
+                            free_components.add(component)
+            level = next_level
+
+    @staticmethod
+    def _create_components(successors, placed):
+        nodes = [node for node in range(len(successors)) if not placed[node]]
+        components = _strongly_connected_components(nodes, successors, lambda node: not placed[node])
+        component_count = max(components.values()) + 1
+        members = [[] for _ in range(component_count)]
+        for node in nodes:
+            members[components[node]].append(node)
+        component_in_degrees = [0] * component_count
+        for node in nodes:
+            for successor in successors[node]:
+                if not placed[successor] and components[successor] != components[node]:
+                    component_in_degrees[components[successor]] += 1
+        return components, members, component_in_degrees
+
+    @staticmethod
+    def _find_cycle_breaks(members, successors, in_degrees, placed):
+        # the unplaced members of a component can contain several cycles, and beams which wait for them
+        nodes = [node for node in members if not placed[node]]
+        included = set(nodes)
+        components = _strongly_connected_components(nodes, successors, included.__contains__)
+        waiting = set()
+        for node in nodes:
+            for successor in successors[node]:
+                if successor in included and components[successor] != components[node]:
+                    waiting.add(components[successor])
+        cycle_breaks = {}
+        for node in nodes:
+            component = components[node]
+            if component in waiting:
+                continue
+            best = cycle_breaks.get(component)
+            if best is None or in_degrees[node] < in_degrees[best]:
+                cycle_breaks[component] = node
+        return sorted(cycle_breaks.values())
+
+    def iter_steps(self):
+        """Yields the steps of the sequence one at a time, with the index of their level as priority.
+
+        Returns
+        -------
+        generator(:class:`Step`)
+
+        """
+        for priority, beams in enumerate(self.iter_groups()):
+            for beam in beams:
+                yield Step(element_ids=[beam.key], actor=Actor.HUMAN, location=beam.frame.copy(), priority=priority)
+
+    def iter_chunks(self, chunk_size):
+        """Yields the steps of the sequence in chunks, each chunk is generated when it is requested.
+
+        Parameters
+        ----------
+        chunk_size : int
+            The maximum number of steps per chunk.
+
+        Returns
+        -------
+        generator(list(:class:`Step`))
+
+        """
+        return iter_chunks(self.iter_steps(), chunk_size)
@@ -0,0 +1,111 @@
+import numpy as np
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+
+
+class BuildingPlanArrays(object):
+    """Stores the frames, points and vectors of the steps and instructions of a building plan in contiguous arrays.
+
+    A transformation is applied to all locations of the plan at once, instead of transforming each instruction.
+    The arrays are written back to the steps and instructions of the plan with :meth:`update_plan`, which is also
+    done when the data of the plan is requested.
+
+    Other geometry of the instructions, e.g. the geometry of a :class:`Model3d`, is transformed one at a time.
+    Only affine transformations are supported, the axes of frames are unitized and orthogonalized when written back.
+
+    Parameters
+    ----------
+    plan : :class:`BuildingPlan`
+        The building plan.
+
+    Attributes
+    ----------
+    points : :class:`numpy.ndarray`
+        The origins of the frames followed by the points of the plan, shape (n, 3).
+    vectors : :class:`numpy.ndarray`
+        The x-axes and y-axes of the frames followed by the vectors of the plan, shape (m, 3).
+
+    """
+
+    def __init__(self, plan):
+        self.plan = plan
+        self._frames = []
+        self._points = []
+        self._vectors = []
+        self._geometries = []
+        visited = set()
+        for step in plan:
+            self._collect(step.location, visited)
+            for instruction in step.instructions:
+                for value in vars(instruction).values():
+                    self._collect(value, visited)
+
+        points = [frame.point for frame in self._frames] + self._points
+        vectors = [frame.xaxis for frame in self._frames] + [frame.yaxis for frame in self._frames] + self._vectors
+        self.points = np.array(points, dtype=float).reshape(-1, 3)
+        self.vectors = np.array(vectors, dtype=float).reshape(-1, 3)
+        self._is_modified = False
+
+    def __len__(self):
+        return len(self.plan)
+
+    @property
+    def __data__(self):
+        self.update_plan()
+        return self.plan.__data__
+
+    def _collect(self, value, visited):
+        if value is None or id(value) in visited:
+            return
+        visited.add(id(value))
+        if isinstance(value, Frame):
+            self._frames.append(value)
+        elif isinstance(value, Point):
+            self._points.append(value)
+        elif isinstance(value, Vector):
+            self._vectors.append(value)
+        elif hasattr(value, "transform"):
+            self._geometries.append(value)
+
+    def transform(self, transformation):
+        """Transforms all locations of the plan.
+
+        Parameters
+        ----------
+        transformation : :class:`compas.geometry.Transformation`
+
+        """
+        matrix = np.asarray(transformation.matrix, dtype=float)
+        rotation = matrix[:3, :3].T
+        self.points = self.points.dot(rotation) + matrix[:3, 3]
+        self.vectors = self.vectors.dot(rotation)
+        for geometry in self._geometries:
+            geometry.transform(transformation)
+        self._is_modified = True
+
+    def update_plan(self):
+        """Writes the arrays back to the frames, points and vectors of the plan.
+
+        Returns
+        -------
+        :class:`BuildingPlan`
+
+        """
+        if not self._is_modified:
+            return self.plan
+        frame_count = len(self._frames)
+        points = self.points.tolist()
+        vectors = self.vectors.tolist()
+        for frame, point, xaxis, yaxis in zip(
+            self._frames, points, vectors[:frame_count], vectors[frame_count : 2 * frame_count]
+        ):
+            frame.point = point
+            frame.xaxis = xaxis
+            frame.yaxis = yaxis
+        for point, (x, y, z) in zip(self._points, points[frame_count:]):
+            point.x, point.y, point.z = x, y, z
+        for vector, (x, y, z) in zip(self._vectors, vectors[2 * frame_count :]):
+            vector.x, vector.y, vector.z = x, y, z
+        self._is_modified = False
+        return self.plan
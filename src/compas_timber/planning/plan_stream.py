@@ -0,0 +1,137 @@
+from compas.data import json_dumps
+from compas.data import json_loads
+
+from .sequencer import BuildingPlan
+from .sequencer import iter_chunks
+
+
+class BuildingPlanWriter(object):
+    """Writes the steps of a building plan to a JSON Lines file, one step per line.
+
+    Steps can be written while they are generated, a reader of the file sees each chunk once it was written.
+
+    Parameters
+    ----------
+    target : str | file
+        The path of the file or a file object opened in text mode.
+
+    Examples
+    --------
+    >>> with BuildingPlanWriter("plan.jsonl") as writer:  # doctest: +SKIP
+    ...     for chunk in generator.iter_chunks(100):
+    ...         writer.write_steps(chunk)
+
+    """
+
+    def __init__(self, target):
+        self._owns_file = not hasattr(target, "write")
+        self._file = open(target, "w") if self._owns_file else target
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write_step(self, step):
+        """Writes a step to the file.
+
+        Parameters
+        ----------
+        step : :class:`Step`
+
+        """
+        self._file.write(json_dumps(step))
+        self._file.write("\n")
+        self.count += 1
+
+    def write_steps(self, steps):
+        """Writes steps to the file and flushes it.
+
+        Parameters
+        ----------
+        steps : iterable(:class:`Step`)
+
+        """
+        for step in steps:
+            self.write_step(step)
+        self._file.flush()
+
+    def write_plan(self, plan):
+        """Writes the steps of a building plan to the file.
+
+        Parameters
+        ----------
+        plan : :class:`BuildingPlan`
+
+        """
+        self.write_steps(plan)
+
+    def close(self):
+        """Closes the file if it was opened by this writer."""
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class BuildingPlanReader(object):
+    """Reads the steps of a building plan from a JSON Lines file one at a time.
+
+    Parameters
+    ----------
+    source : str | file
+        The path of the file or a file object opened in text mode.
+
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    def iter_steps(self):
+        """Yields the steps of the file in the order of the file.
+
+        Returns
+        -------
+        generator(:class:`Step`)
+
+        """
+        if hasattr(self.source, "read"):
+            for step in self._iter_lines(self.source):
+                yield step
+            return
+        with open(self.source, "r") as f:
+            for step in self._iter_lines(f):
+                yield step
+
+    def iter_chunks(self, chunk_size):
+        """Yields the steps of the file in chunks.
+
+        Parameters
+        ----------
+        chunk_size : int
+            The maximum number of steps per chunk.
+
+        Returns
+        -------
+        generator(list(:class:`Step`))
+
+        """
+        return iter_chunks(self.iter_steps(), chunk_size)
+
+    def to_plan(self):
+        """Reads all steps of the file into a building plan.
+
+        Returns
+        -------
+        :class:`BuildingPlan`
+
+        """
+        return BuildingPlan(list(self.iter_steps()))
+
+    @staticmethod
+    def _iter_lines(f):
+        for line in f:
+            if line.strip():
+                yield json_loads(line)
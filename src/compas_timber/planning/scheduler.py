@@ -0,0 +1,297 @@
+import heapq
+
+from .sequencer import Actor
+
+
+class ScheduledStep(object):
+    """A step of a building plan assigned to an actor for a time interval.
+
+    Parameters
+    ----------
+    step : :class:`Step`
+        The scheduled step.
+    actor : int
+        The type of the actor which executes the step. One of [Actor.HUMAN, Actor.ROBOT].
+    actor_index : int
+        The index of the actor among the actors of its type.
+    start : float
+        The time at which the step starts.
+    end : float
+        The time at which the step ends.
+
+    Attributes
+    ----------
+    duration : float
+        The time it takes to execute the step.
+
+    """
+
+    def __init__(self, step, actor, actor_index, start, end):
+        self.step = step
+        self.actor = actor
+        self.actor_index = actor_index
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return "ScheduledStep({}, {}_{}, {}, {})".format(
+            self.step.element_ids, Actor.get_name(self.actor), self.actor_index, self.start, self.end
+        )
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+class Schedule(object):
+    """The steps of a building plan with the actor executing them and their start times.
+
+    Parameters
+    ----------
+    scheduled_steps : list(:class:`ScheduledStep`)
+        The scheduled steps in the order in which they were scheduled.
+
+    Attributes
+    ----------
+    makespan : float
+        The time at which the last step ends.
+    actors : list(tuple(int, int))
+        The type and index of each actor with at least one step.
+
+    """
+
+    def __init__(self, scheduled_steps=None):
+        self.scheduled_steps = scheduled_steps or []
+
+    def __repr__(self):
+        return "Schedule with {} steps, makespan: {}".format(len(self.scheduled_steps), self.makespan)
+
+    def __iter__(self):
+        return iter(self.scheduled_steps)
+
+    def __len__(self):
+        return len(self.scheduled_steps)
+
+    @property
+    def makespan(self):
+        return max([scheduled.end for scheduled in self.scheduled_steps] or [0.0])
+
+    @property
+    def actors(self):
+        return sorted(set((scheduled.actor, scheduled.actor_index) for scheduled in self.scheduled_steps))
+
+    def get_actor_steps(self, actor, actor_index=0):
+        """Returns the steps executed by an actor, ordered by their start time.
+
+        Parameters
+        ----------
+        actor : int
+            The type of the actor. One of [Actor.HUMAN, Actor.ROBOT].
+        actor_index : int
+            The index of the actor among the actors of its type.
+
+        Returns
+        -------
+        list(:class:`ScheduledStep`)
+
+        """
+        steps = [s for s in self.scheduled_steps if s.actor == actor and s.actor_index == actor_index]
+        return sorted(steps, key=lambda scheduled: scheduled.start)
+
+
+class StepScheduler(object):
+    """Assigns the steps of a building plan to several human crews and robots to minimize the makespan.
+
+    Steps are scheduled with critical path list scheduling: whenever an actor is idle, it starts the ready step
+    with the longest remaining path to the end of the plan which it can execute.
+    This takes O((V+E) log V) time for V steps and E precedence constraints.
+
+    Steps without an actor can be executed by any actor type.
+    Without precedence constraints, the priorities of the steps are used, i.e. each step starts once all steps
+    of a lower priority are done.
+
+    Parameters
+    ----------
+    plan : :class:`BuildingPlan`
+        The building plan to schedule.
+    actors : dict(int, int), optional
+        The number of actors of each type, e.g. ``{Actor.HUMAN: 2, Actor.ROBOT: 1}``. Defaults to one of each.
+    durations : callable | list(float), optional
+        The estimated duration of each step, either as a function of the step or in the order of the steps.
+        Defaults to 1.0 per step.
+    precedence : iterable(tuple(int, int)), optional
+        Pairs of element ids where the step of the first has to be done before the step of the second,
+        e.g. :meth:`DependencySequenceGenerator.iter_precedence`.
+
+    Attributes
+    ----------
+    result : :class:`Schedule`
+        The resulting schedule.
+
+    """
+
+    def __init__(self, plan, actors=None, durations=None, precedence=None):
+        self.plan = plan
+        self.actors = actors or {Actor.HUMAN: 1, Actor.ROBOT: 1}
+        self.durations = durations
+        self.precedence = precedence
+
+    @property
+    def result(self):
+        return self.create_schedule()
+
+    def get_durations(self, steps):
+        """Returns the estimated duration of each step.
+
+        Parameters
+        ----------
+        steps : list(:class:`Step`)
+
+        Returns
+        -------
+        list(float)
+
+        """
+        if self.durations is None:
+            return [1.0] * len(steps)
+        if callable(self.durations):
+            return [float(self.durations(step)) for step in steps]
+        durations = [float(duration) for duration in self.durations]
+        if len(durations) != len(steps):
+            raise ValueError("Expected {} durations, got: {}".format(len(steps), len(durations)))
+        return durations
+
+    def create_schedule(self):
+        """Schedules the steps of the plan.
+
+        Returns
+        -------
+        :class:`Schedule`
+
+        Raises
+        ------
+        ValueError
+            If the precedence constraints contain a cycle or a step requires an actor type without actors.
+
+        """
+        steps = list(self.plan)
+        durations = self.get_durations(steps)
+        successors, in_degrees = self._create_graph(steps)
+        # nodes after the steps are zero duration barriers between priorities, they don't need an actor
+        durations.extend([0.0] * (len(successors) - len(steps)))
+
+        order = self._topological_order(successors, in_degrees)
+        bottom_levels = [0.0] * len(successors)
+        for node in reversed(order):
+            bottom_levels[node] = durations[node] + max([bottom_levels[s] for s in successors[node]] or [0.0])
+
+        idle = {actor: list(range(count)) for actor, count in self.actors.items() if count > 0}
+        busy = {actor: [] for actor in idle}
+        for step in steps:
+            if step.actor is None and not idle:
+                raise ValueError("No actor to execute step: {}".format(step))
+            if step.actor is not None and step.actor not in idle:
+                raise ValueError("No actor of type {} to execute step: {}".format(Actor.get_name(step.actor), step))
+
+        # steps are released once their predecessors are started, and become ready at the end of the predecessors
+        ready_times = [0.0] * len(successors)
+        in_degrees = in_degrees[:]
+        released = [(0.0, node) for node, in_degree in enumerate(in_degrees) if in_degree == 0]
+        ready = {actor: [] for actor in idle}
+        ready[None] = []
+
+        def release(node, end):
+            for successor in successors[node]:
+                ready_times[successor] = max(ready_times[successor], end)
+                in_degrees[successor] -= 1
+                if in_degrees[successor] == 0:
+                    heapq.heappush(released, (ready_times[successor], successor))
+
+        scheduled_steps = []
+        time = 0.0
+        while True:
+            while released and released[0][0] <= time:
+                _, node = heapq.heappop(released)
+                if node >= len(steps):
+                    release(node, ready_times[node])
+                else:
+                    heapq.heappush(ready[steps[node].actor], (-bottom_levels[node], node))
+            for actor, actor_busy in busy.items():
+                while actor_busy and actor_busy[0][0] <= time:
+                    heapq.heappush(idle[actor], heapq.heappop(actor_busy)[1])
+
+            started = False
+            while True:
+                # the ready step with the longest path to the end of the plan among those with an idle actor
+                best = None
+                for actor in sorted(idle):
+                    if not idle[actor]:
+                        continue
+                    for queue in (ready[actor], ready[None]):
+                        if queue and (best is None or queue[0] < best[0][0]):
+                            best = (queue, actor)
+                if best is None:
+                    break
+                queue, actor = best
+                _, node = heapq.heappop(queue)
+                actor_index = heapq.heappop(idle[actor])
+                end = time + durations[node]
+                heapq.heappush(busy[actor], (end, actor_index))
+                scheduled_steps.append(ScheduledStep(steps[node], actor, actor_index, time, end))
+                release(node, end)
+                started = True
+            if started:
+                # steps without duration can release further steps at the same time
+                continue
+
+            next_times = [actor_busy[0][0] for actor_busy in busy.values() if actor_busy]
+            if released:
+                next_times.append(released[0][0])
+            if not next_times:
+                break
+            time = min(next_times)
+        return Schedule(scheduled_steps)
+
+    def _create_graph(self, steps):
+        successors = [[] for _ in steps]
+        if self.precedence is None:
+            priorities = sorted(set(step.priority for step in steps))
+            # one barrier after each priority but the last, steps wait for the barrier of the previous priority
+            barriers_after = {}
+            barriers_before = {}
+            for priority, next_priority in zip(priorities[:-1], priorities[1:]):
+                barriers_after[priority] = barriers_before[next_priority] = len(successors)
+                successors.append([])
+            for index, step in enumerate(steps):
+                if step.priority in barriers_after:
+                    successors[index].append(barriers_after[step.priority])
+                if step.priority in barriers_before:
+                    successors[barriers_before[step.priority]].append(index)
+        else:
+            step_indices = {}
+            for index, step in enumerate(steps):
+                for element_id in step.element_ids:
+                    step_indices.setdefault(element_id, index)
+            for before, after in self.precedence:
+                before, after = step_indices.get(before), step_indices.get(after)
+                if before is not None and after is not None and before != after:
+                    successors[before].append(after)
+
+        in_degrees = [0] * len(successors)
+        for node_successors in successors:
+            for successor in node_successors:
+                in_degrees[successor] += 1
+        return successors, in_degrees
+
+    @staticmethod
+    def _topological_order(successors, in_degrees):
+        in_degrees = in_degrees[:]
+        order = [node for node, in_degree in enumerate(in_degrees) if in_degree == 0]
+        for node in order:
+            for successor in successors[node]:
+                in_degrees[successor] -= 1
+                if in_degrees[successor] == 0:
+                    order.append(successor)
+        if len(order) != len(successors):
+            raise ValueError("The precedence constraints of the steps contain a cycle.")
+        return order
@@ -2,6 +2,7 @@ from compas.data import Data
 from compas.data import json_dump
 from compas.data import json_load
 from compas.geometry import Frame
+from compas.geometry import Vector
 
 
 class Actor(object):
@@ -48,6 +49,12 @@ class Instruction(Data):
             "location": self.location.__data__,
         }
 
+    @classmethod
+    def __from_data__(cls, data):
+        data = dict(data)
+        data["location"] = Frame.__from_data__(data["location"])
+        return cls(**data)
+
     def transform(self, tranformation):
         self.location.transform(tranformation)
 
@@ -121,6 +128,34 @@ class LinearDimension(Instruction):
         self.end.transform(tranformation)
 
 
+class Removal(Instruction):
+    """Removal of an element along a linear direction"""
+
+    def __init__(self, id, location, element_id, direction):
+        super(Removal, self).__init__(id, location)
+        self.element_id = element_id
+        self.direction = direction
+
+    @property
+    def __data__(self):
+        data_dict = {
+            "element_id": self.element_id,
+            "direction": self.direction.__data__,
+        }
+        data_dict.update(super(Removal, self).__data__)
+        return data_dict
+
+    @classmethod
+    def __from_data__(cls, data):
+        data = dict(data)
+        data["direction"] = Vector.__from_data__(data["direction"])
+        return super(Removal, cls).__from_data__(data)
+
+    def transform(self, tranformation):
+        super(Removal, self).transform(tranformation)
+        self.direction.transform(tranformation)
+
+
 class Step(Data):
     """Container for building instructions which assemble a single element
 
@@ -195,6 +230,23 @@ class Step(Data):
             "actor": Actor.get_name(self.actor),
         }
 
+    @classmethod
+    def __from_data__(cls, data):
+        step = cls(
+            element_ids=data["element_ids"],
+            location=Frame.__from_data__(data["location"]),
+            geometry=data.get("geometry"),
+            instructions=data.get("instructions"),
+            is_built=data.get("is_built", False),
+            is_planned=data.get("is_planned", False),
+            elements_held=data.get("elements_held"),
+            priority=data.get("priority", 0),
+        )
+        actor = data.get("actor")
+        if actor is not None and actor != "UNKNOWN_ACTOR":
+            step.actor = actor
+        return step
+
     def transform(self, transformation):
         self.location.transform(transformation)
 
@@ -261,6 +313,48 @@ class BuildingPlan(Data):
     def add_step(self, step):
         self.steps.append(step)
 
+    def transform(self, transformation):
+        """Transforms the steps of the plan and their instructions one at a time.
+
+        Use :class:`BuildingPlanArrays` to transform large plans at once.
+
+        Parameters
+        ----------
+        transformation : :class:`compas.geometry.Transformation`
+
+        """
+        for step in self.steps:
+            step.transform(transformation)
+            for instruction in step.instructions:
+                instruction.transform(transformation)
+
+
+def iter_chunks(steps, chunk_size):
+    """Groups steps into chunks, without consuming more steps than needed for the current chunk.
+
+    Parameters
+    ----------
+    steps : iterable(:class:`Step`)
+        The steps to group.
+    chunk_size : int
+        The maximum number of steps per chunk.
+
+    Returns
+    -------
+    generator(list(:class:`Step`))
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1, got: {}".format(chunk_size))
+    chunk = []
+    for step in steps:
+        chunk.append(step)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
 
 class SimpleSequenceGenerator(object):
     """Generates a simple sequence of steps, one step per element.
@@ -283,7 +377,30 @@ class SimpleSequenceGenerator(object):
 
     @property
     def result(self):
-        plan = BuildingPlan()
+        return BuildingPlan(list(self.iter_steps()))
+
+    def iter_steps(self):
+        """Yields the steps of the sequence one at a time.
+
+        Returns
+        -------
+        generator(:class:`Step`)
+
+        """
         for beam in self.assembly.beams:
-            plan.add_step(Step(element_ids=[beam.key], actor=Actor.HUMAN, location=beam.frame))
-        return plan
+            yield Step(element_ids=[beam.key], actor=Actor.HUMAN, location=beam.frame.copy())
+
+    def iter_chunks(self, chunk_size):
+        """Yields the steps of the sequence in chunks, each chunk is generated when it is requested.
+
+        Parameters
+        ----------
+        chunk_size : int
+            The maximum number of steps per chunk.
+
+        Returns
+        -------
+        generator(list(:class:`Step`))
+
+        """
+        return iter_chunks(self.iter_steps(), chunk_size)
@@ -18,8 +18,17 @@ Pluggables
     next_removable_part
     create_dissassembly_sequence
 
+Classes
+=======
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    DisassemblyPlanner
+
 """
 
+import compas
 from compas.plugins import pluggable
 from compas.plugins import PluginNotInstalledError
 
@@ -76,3 +85,17 @@ def create_dissassembly_sequence(assembly, **kwargs):
 
     """
     raise PluginNotInstalledError
+
+
+if not compas.IPY:
+    from .disassembly_numpy import DisassemblyPlanner
+
+__all__ = [
+    "next_removable_part",
+    "create_dissassembly_sequence",
+]
+
+if not compas.IPY:
+    __all__ += [
+        "DisassemblyPlanner",
+    ]
@@ -0,0 +1,388 @@
+import itertools
+import weakref
+
+import numpy as np
+from compas.geometry import Vector
+from compas.plugins import PluginNotInstalledError
+from compas.plugins import plugin
+
+from compas_timber.connections import find_neighboring_beams
+from compas_timber.consumers import LOD
+from compas_timber.consumers import ConvexGeometryConsumer
+from compas_timber.planning import Actor
+from compas_timber.planning import BuildingPlan
+from compas_timber.planning import Removal
+from compas_timber.planning import Step
+
+WORLD_DIRECTIONS = np.array([[0, 0, 1], [1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, -1]], dtype=float)
+
+
+def _unique_directions(vectors, precision=6):
+    # unit vectors without duplicates, opposite vectors are kept, the first occurrence keeps its place
+    vectors = np.asarray(vectors, dtype=float)
+    lengths = np.linalg.norm(vectors, axis=1)
+    vectors = vectors[lengths > 1e-12] / lengths[lengths > 1e-12][:, np.newaxis]
+    _, first = np.unique(np.round(vectors, precision) + 0.0, axis=0, return_index=True)
+    return vectors[np.sort(first)]
+
+
+def _unique_axes(vectors, precision=6):
+    # unit vectors without duplicates up to their sign
+    vectors = _unique_directions(vectors, precision)
+    signs = np.sign(vectors[np.arange(len(vectors)), np.argmax(np.abs(vectors) > 1e-9, axis=1)])
+    return _unique_directions(vectors * signs[:, np.newaxis], precision)
+
+
+class _ConvexShape(object):
+    # the vertices, face normals and edge directions of a convex polyhedron, as used by the separating axis test
+
+    def __init__(self, polyhedron):
+        self.vertices = np.concatenate(polyhedron.faces)
+        normals = []
+        edges = []
+        for face in polyhedron.faces:
+            following = np.roll(face, -1, axis=0)
+            normals.append(np.sum(np.cross(face, following), axis=0))
+            edges.extend(following - face)
+        self.normals = _unique_axes(normals)
+        self.edges = _unique_axes(edges)
+
+
+def _sweep_collisions(moving, other, directions, distance, tol=1e-6):
+    """Checks for each direction if moving a convex shape along it collides with another convex shape.
+
+    The shapes are tested with the separating axis theorem, for all directions at once. The candidate axes are
+    the face normals of both shapes, the cross products of their edges and the cross products of the direction
+    with the edges of both shapes. Shapes which only touch do not collide.
+
+    Parameters
+    ----------
+    moving : :class:`_ConvexShape`
+        The shape which is moved.
+    other : :class:`_ConvexShape`
+        The shape which stays in place.
+    directions : :class:`numpy.ndarray`
+        The unit directions to test, shape (k, 3).
+    distance : float
+        The distance the shape is moved along each direction.
+    tol : float, optional
+        The depth up to which shapes are considered touching.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        True for each direction along which the shapes collide, shape (k,).
+
+    """
+    static = np.concatenate(
+        [moving.normals, other.normals, np.cross(moving.edges[:, np.newaxis], other.edges[np.newaxis]).reshape(-1, 3)]
+    )
+    edges = np.concatenate([moving.edges, other.edges])
+    swept = np.cross(directions[:, np.newaxis], edges[np.newaxis])  # (k, e, 3)
+    axes = np.concatenate([np.broadcast_to(static, (len(directions),) + static.shape), swept], axis=1)  # (k, m, 3)
+    lengths = np.linalg.norm(axes, axis=2)
+    valid = lengths > 1e-9
+    axes = axes / np.where(valid, lengths, 1.0)[:, :, np.newaxis]
+
+    moving_projections = np.einsum("kmj,nj->kmn", axes, moving.vertices)
+    other_projections = np.einsum("kmj,nj->kmn", axes, other.vertices)
+    offsets = distance * np.einsum("kmj,kj->km", axes, directions)
+    moving_min = moving_projections.min(axis=2) + np.minimum(offsets, 0.0)
+    moving_max = moving_projections.max(axis=2) + np.maximum(offsets, 0.0)
+    other_min = other_projections.min(axis=2)
+    other_max = other_projections.max(axis=2)
+
+    separated = valid & ((moving_max <= other_min + tol) | (other_max <= moving_min + tol))
+    return ~np.any(separated, axis=1)
+
+
+class DisassemblyPlanner(object):
+    """Finds parts which can be removed from an assembly by moving them along a straight line.
+
+    Neighboring beams are found with :func:`~compas_timber.connections.find_neighboring_beams`, or by checking
+    all pairs if no plugin for it is available. Each beam is swept along candidate directions, the world axes and
+    the axes of the beam, and the directions along which it collides with a remaining neighbor are blocked.
+    The beams are approximated by their blanks trimmed by their cuts, other features like laps are not modelled.
+    Pairs of beams which already overlap before moving are reported in `overlapping_pairs` and do not block
+    each other.
+
+    The collisions of each pair of neighbors are computed once. When a beam is removed, only the blocked
+    directions of its neighbors are updated.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_timber.assembly.TimberAssembly`
+        The assembly to disassemble.
+    distance : float, optional
+        The distance by which the beams are swept, defaults to half of the smallest cross section dimension.
+    directions : list(:class:`~compas.geometry.Vector`), optional
+        The removal directions to test. By default the world axes and the axes of each beam are tested.
+    tol : float, optional
+        The depth up to which beams are considered touching.
+
+    Attributes
+    ----------
+    removed : list(int)
+        The keys of the removed beams, in the order of their removal.
+    overlapping_pairs : list(tuple(int, int))
+        The keys of the pairs of beams which overlap before moving.
+
+    """
+
+    def __init__(self, assembly, distance=None, directions=None, tol=1e-6):
+        self.assembly = assembly
+        self.tol = tol
+        self.directions = directions
+        beams = assembly.beams
+        self._beams = {beam.key: beam for beam in beams}
+        if distance is None and beams:
+            distance = 0.5 * min(min(beam.width, beam.height) for beam in beams)
+        self.distance = distance or 0.0
+        self.removed = []
+        self.overlapping_pairs = []
+
+        self._shapes = {}
+        for result in ConvexGeometryConsumer(assembly, lod=LOD.TRIMS).result:
+            self._shapes[result.beam.key] = _ConvexShape(result.geometry)
+        self._directions = {beam.key: self._candidate_directions(beam) for beam in beams}
+
+        # the number of remaining neighbors which block each direction of each beam
+        self._blocked_counts = {beam.key: np.zeros(len(self._directions[beam.key]), dtype=int) for beam in beams}
+        self._blocked_by = {beam.key: {} for beam in beams}
+        for beam_a, beam_b in self._neighbor_pairs(beams):
+            self._add_pair(beam_a.key, beam_b.key)
+
+    def _candidate_directions(self, beam):
+        if self.directions is not None:
+            return _unique_directions([list(direction) for direction in self.directions])
+        frame = beam.frame
+        axes = [frame.xaxis, frame.yaxis, frame.zaxis]
+        local = [list(axis) for axis in axes] + [list(-axis) for axis in axes]
+        return _unique_directions(np.concatenate([WORLD_DIRECTIONS, local]))
+
+    def _neighbor_pairs(self, beams):
+        try:
+            pairs = find_neighboring_beams(beams, inflate_by=self.distance)
+        except (PluginNotInstalledError, NotImplementedError):
+            return itertools.combinations(beams, 2)
+        return [tuple(pair) for pair in pairs]
+
+    def _add_pair(self, key_a, key_b):
+        shape_a, shape_b = self._shapes[key_a], self._shapes[key_b]
+        at_rest = _sweep_collisions(shape_a, shape_b, np.array([[0.0, 0.0, 1.0]]), 0.0, self.tol)
+        if at_rest[0]:
+            self.overlapping_pairs.append((key_a, key_b))
+            return
+        blocked_a = _sweep_collisions(shape_a, shape_b, self._directions[key_a], self.distance, self.tol)
+        blocked_b = _sweep_collisions(shape_b, shape_a, self._directions[key_b], self.distance, self.tol)
+        self._blocked_by[key_a][key_b] = blocked_a
+        self._blocked_by[key_b][key_a] = blocked_b
+        self._blocked_counts[key_a] += blocked_a
+        self._blocked_counts[key_b] += blocked_b
+
+    def removal_direction(self, key):
+        """Returns the first direction along which a remaining beam can be removed.
+
+        Parameters
+        ----------
+        key : int
+            The key of the beam.
+
+        Returns
+        -------
+        :class:`~compas.geometry.Vector` | None
+            The direction, None if the beam is blocked in all directions.
+
+        """
+        free = np.flatnonzero(self._blocked_counts[key] == 0)
+        if not len(free):
+            return None
+        return Vector(*self._directions[key][free[0]].tolist())
+
+    def removable_parts(self, keys=None):
+        """Returns the remaining beams which can be removed.
+
+        Parameters
+        ----------
+        keys : list(int), optional
+            The keys of the beams to consider, all remaining beams by default.
+
+        Returns
+        -------
+        list(int)
+
+        """
+        keys = self._blocked_counts.keys() if keys is None else keys
+        return [key for key in keys if key in self._blocked_counts and np.any(self._blocked_counts[key] == 0)]
+
+    def remove(self, key):
+        """Removes a beam, which frees the directions of its neighbors it blocked.
+
+        Keys of beams which are not part of the assembly or were already removed are ignored.
+
+        Parameters
+        ----------
+        key : int
+            The key of the beam.
+
+        """
+        blocked_by = self._blocked_by.pop(key, None)
+        if blocked_by is None:
+            return
+        for neighbor in blocked_by:
+            self._blocked_counts[neighbor] -= self._blocked_by[neighbor].pop(key)
+        del self._blocked_counts[key]
+        self.removed.append(key)
+
+    def create_step(self, key, priority=0):
+        """Returns the step which removes a beam.
+
+        Parameters
+        ----------
+        key : int
+            The key of the beam.
+        priority : int, optional
+            The priority of the step.
+
+        Returns
+        -------
+        :class:`~compas_timber.planning.Step`
+
+        """
+        beam = self._beams[key]
+        removal = Removal(key, beam.frame.copy(), key, self.removal_direction(key))
+        return Step(
+            element_ids=[key],
+            actor=Actor.HUMAN,
+            location=beam.frame.copy(),
+            instructions=[removal],
+            priority=priority,
+        )
+
+    def create_sequence(self):
+        """Removes all beams which can be removed, in rounds.
+
+        The beams which are removable at the start of a round are removed in this round, their steps have the
+        index of the round as priority and can be executed in parallel.
+
+        Returns
+        -------
+        :class:`~compas_timber.planning.BuildingPlan`
+            The steps of the removed beams. Beams which remain blocked are not part of the plan.
+
+        """
+        plan = BuildingPlan()
+        order = {beam.key: index for index, beam in enumerate(self.assembly.beams)}
+        candidates = [key for key in order if key in self._blocked_counts]
+        priority = 0
+        while candidates:
+            removable = self.removable_parts(candidates)
+            if not removable:
+                break
+            for key in removable:
+                plan.add_step(self.create_step(key, priority))
+            touched = set()
+            for key in removable:
+                touched.update(self._blocked_by[key])
+                self.remove(key)
+            # only the neighbors of removed beams can have become removable
+            candidates = sorted((key for key in touched if key in self._blocked_counts), key=order.get)
+            priority += 1
+        return plan
+
+
+_PLANNERS = weakref.WeakKeyDictionary()
+
+
+def _geometry_signature(assembly):
+    # changes when beams are added, removed, moved, resized or receive features
+    signature = []
+    for beam in assembly.beams:
+        frame = beam.frame
+        signature.append(
+            (
+                beam.key,
+                tuple(frame.point),
+                tuple(frame.xaxis),
+                tuple(frame.yaxis),
+                beam.length,
+                beam.width,
+                beam.height,
+                len(beam.features),
+            )
+        )
+    return signature
+
+
+def _get_planner(assembly, removed_part_ids, **kwargs):
+    # the planner of an assembly is reused as long as the options and the geometry of the beams are unchanged
+    cached = _PLANNERS.get(assembly)
+    removed = set(removed_part_ids or [])
+    planner = None
+    if cached is not None:
+        planner, cached_kwargs, signature = cached
+        if cached_kwargs != kwargs or signature != _geometry_signature(assembly) or not set(planner.removed) <= removed:
+            planner = None
+    if planner is None:
+        planner = DisassemblyPlanner(assembly, **kwargs)
+        _PLANNERS[assembly] = (planner, dict(kwargs), _geometry_signature(assembly))
+    for key in removed_part_ids or []:
+        if key not in planner.removed:
+            planner.remove(key)
+    return planner
+
+
+@plugin(category="solvers", requires=["numpy"])
+def next_removable_part(assembly, removed_part_ids, part_ids_to_remove, number_of_parts_to_remove, **kwargs):
+    """Returns a step which removes the next parts which can be removed from the assembly.
+
+    The :class:`~compas_timber.solvers.DisassemblyPlanner` of the assembly is kept between calls, so that only
+    the neighbors of newly removed parts are updated. It is created again when the keyword arguments or the
+    frames, dimensions or number of features of the beams change.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_timber.assembly.TimberAssembly`
+        The assembly to remove parts from.
+    removed_part_ids : list(int)
+        The keys of the beams which have already been removed.
+    part_ids_to_remove : list(int)
+        The keys of the beams which may be removed, all remaining beams if None.
+    number_of_parts_to_remove : int
+        The maximum number of beams to remove.
+
+    Returns
+    -------
+    :class:`~compas_timber.planning.Step` | None
+        A step with a :class:`~compas_timber.planning.Removal` instruction for each removed beam,
+        None if no beam can be removed.
+
+    """
+    planner = _get_planner(assembly, removed_part_ids, **kwargs)
+    removable = planner.removable_parts(part_ids_to_remove)[: number_of_parts_to_remove or None]
+    if not removable:
+        return None
+    steps = [planner.create_step(key) for key in removable]
+    step = steps[0]
+    for other in steps[1:]:
+        step.element_ids.extend(other.element_ids)
+        step.instructions.extend(other.instructions)
+    return step
+
+
+@plugin(category="solvers", requires=["numpy"])
+def create_dissassembly_sequence(assembly, **kwargs):
+    """Returns a sequence of steps which disassembles the assembly, created by a
+    :class:`~compas_timber.solvers.DisassemblyPlanner`.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_timber.assembly.TimberAssembly`
+        The assembly to disassemble.
+
+    Returns
+    -------
+    :class:`~compas_timber.planning.BuildingPlan`
+
+    """
+    return DisassemblyPlanner(assembly, **kwargs).create_sequence()
@@ -2,5 +2,22 @@ from .compas_extra import intersection_line_line_3D
 from .compas_extra import intersection_line_plane
 from .helpers import are_objects_identical
 from .helpers import close
+from .profiling import Profiler
+from .profiling import ProfilingSpan
+from .profiling import get_profiler
+from .profiling import profile_count
+from .profiling import profile_span
+from .profiling import profiled
 
-__all__ = ["intersection_line_line_3D", "intersection_line_plane", "close", "are_objects_identical"]
+__all__ = [
+    "intersection_line_line_3D",
+    "intersection_line_plane",
+    "close",
+    "are_objects_identical",
+    "Profiler",
+    "ProfilingSpan",
+    "get_profiler",
+    "profile_count",
+    "profile_span",
+    "profiled",
+]
@@ -0,0 +1,352 @@
+import functools
+import json
+import threading
+import time
+
+try:
+    _clock = time.perf_counter
+except AttributeError:
+    _clock = time.time  # IronPython
+
+
+class ProfilingSpan(object):
+    """A timed section of code recorded by a :class:`Profiler`.
+
+    Parameters
+    ----------
+    name : str
+        The name of the span, e.g. ``"TButtJoint.add_features"``.
+    category : str
+        The category of the span, e.g. ``"joints"``.
+    start : float
+        The start of the span in seconds since the profiler was created or cleared.
+    duration : float
+        The duration of the span in seconds.
+    thread_id : int
+        The identifier of the thread which executed the span.
+    args : dict
+        Additional information about the span.
+
+    """
+
+    __slots__ = ("name", "category", "start", "duration", "thread_id", "args")
+
+    def __init__(self, name, category, start, duration, thread_id, args):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.duration = duration
+        self.thread_id = thread_id
+        self.args = args
+
+    def __repr__(self):
+        return "ProfilingSpan({}, {:.6f}s)".format(self.name, self.duration)
+
+
+class _NullSpan(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan(object):
+    __slots__ = ("profiler", "name", "category", "args", "_start")
+
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self._start = _clock()
+        return self
+
+    def __exit__(self, *args):
+        end = _clock()
+        self.profiler.add_span(self.name, self.category, self._start, end - self._start, self.args)
+        return False
+
+
+class Profiler(object):
+    """Collects the durations of spans of code and counters while it is enabled.
+
+    When disabled, spans and counters are no-ops.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether spans and counters are recorded.
+    spans : list(:class:`ProfilingSpan`)
+        The recorded spans in the order in which they ended.
+    counters : dict(str, float)
+        The value of each counter.
+
+    Examples
+    --------
+    >>> profiler = Profiler()
+    >>> profiler.enable()
+    >>> with profiler.span("solve", "joints"):
+    ...     profiler.count("joints")
+    >>> profiler.summary()["solve"]["count"]
+    1
+
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans = []
+        self.counters = {}
+        self._origin = _clock()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Starts recording spans and counters."""
+        self.enabled = True
+
+    def disable(self):
+        """Stops recording spans and counters, the recorded ones are kept."""
+        self.enabled = False
+
+    def clear(self):
+        """Removes all recorded spans and counters."""
+        with self._lock:
+            self.spans = []
+            self.counters = {}
+            self._origin = _clock()
+
+    def span(self, name, category="compas_timber", **args):
+        """Returns a context manager which records the duration of its block as a span.
+
+        Parameters
+        ----------
+        name : str
+            The name of the span.
+        category : str, optional
+            The category of the span.
+        args : dict, optional
+            Additional information about the span, e.g. the keys of the joined beams.
+
+        Returns
+        -------
+        context manager
+
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, name, category, args)
+
+    def add_span(self, name, category, start, duration, args=None):
+        """Records a span which was timed with the clock of the profiler, :func:`time.perf_counter` where available.
+
+        Parameters
+        ----------
+        name : str
+        category : str
+        start : float
+            The value of the clock at the start of the span.
+        duration : float
+            The duration in seconds.
+        args : dict, optional
+
+        """
+        span = ProfilingSpan(name, category, start - self._origin, duration, threading.current_thread().ident, args)
+        with self._lock:
+            self.spans.append(span)
+
+    def count(self, name, value=1):
+        """Adds to a counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter.
+        value : float, optional
+            The value to add.
+
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        """Returns the number, total, minimum and maximum duration of the spans of each name.
+
+        Returns
+        -------
+        dict(str, dict(str, float))
+
+        """
+        summary = {}
+        for span in self.spans:
+            stats = summary.get(span.name)
+            if stats is None:
+                summary[span.name] = {"count": 1, "total": span.duration, "min": span.duration, "max": span.duration}
+                continue
+            stats["count"] += 1
+            stats["total"] += span.duration
+            stats["min"] = min(stats["min"], span.duration)
+            stats["max"] = max(stats["max"], span.duration)
+        return summary
+
+    def to_json(self):
+        """Returns the summary, counters and spans as a JSON serializable dictionary.
+
+        Returns
+        -------
+        dict
+
+        """
+        spans = []
+        for span in self.spans:
+            spans.append(
+                {
+                    "name": span.name,
+                    "category": span.category,
+                    "start": span.start,
+                    "duration": span.duration,
+                    "thread_id": span.thread_id,
+                    "args": span.args or {},
+                }
+            )
+        return {"summary": self.summary(), "counters": dict(self.counters), "spans": spans}
+
+    def to_chrome_trace(self):
+        """Returns the spans and counters in the Chrome trace event format.
+
+        The result can be written to a file and opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        Returns
+        -------
+        dict
+
+        """
+        events = []
+        end = 0
+        for span in self.spans:
+            start = int(span.start * 1e6)
+            duration = int(span.duration * 1e6)
+            end = max(end, start + duration)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": start,
+                    "dur": duration,
+                    "pid": 1,
+                    "tid": span.thread_id,
+                    "args": span.args or {},
+                }
+            )
+        for name, value in sorted(self.counters.items()):
+            events.append({"name": name, "ph": "C", "ts": end, "pid": 1, "args": {name: value}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, filepath):
+        """Writes the report of :meth:`to_json` to a file.
+
+        Parameters
+        ----------
+        filepath : str
+
+        """
+        with open(filepath, "w") as f:
+            json.dump(self.to_json(), f)
+
+    def write_chrome_trace(self, filepath):
+        """Writes the report of :meth:`to_chrome_trace` to a file.
+
+        Parameters
+        ----------
+        filepath : str
+
+        """
+        with open(filepath, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+PROFILER = Profiler()
+
+
+def get_profiler():
+    """Returns the profiler used by the instrumented code of compas_timber.
+
+    Returns
+    -------
+    :class:`Profiler`
+
+    """
+    return PROFILER
+
+
+def profile_span(name, category="compas_timber", **args):
+    """Returns a span of the profiler of compas_timber, which is a no-op when the profiler is disabled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the span.
+    category : str, optional
+        The category of the span.
+    args : dict, optional
+        Additional information about the span.
+
+    Returns
+    -------
+    context manager
+
+    """
+    if not PROFILER.enabled:
+        return _NULL_SPAN
+    return _ActiveSpan(PROFILER, name, category, args)
+
+
+def profile_count(name, value=1):
+    """Adds to a counter of the profiler of compas_timber, which is a no-op when the profiler is disabled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the counter.
+    value : float, optional
+        The value to add.
+
+    """
+    if PROFILER.enabled:
+        PROFILER.count(name, value)
+
+
+def profiled(name, category="compas_timber"):
+    """Decorator which records each call of the decorated function as a span of the profiler of compas_timber.
+
+    Parameters
+    ----------
+    name : str
+        The name of the spans.
+    category : str, optional
+        The category of the spans.
+
+    Returns
+    -------
+    callable
+
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with _ActiveSpan(PROFILER, name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -65,3 +65,26 @@ def test_deepcopy():
 def test_extension_to_plane():
     frame = Frame(Point(3.000, 0.000, 0.000), Vector(-1.000, 0.000, 0.000), Vector(0.000, -1.000, 0.000))
     _ = Beam(frame, length=3.00, width=0.12, height=0.06)
+
+
+def test_face_frame_matches_faces():
+    beam = Beam.from_endpoints(Point(0.1, 0.2, 0.3), Point(1.2, 0.9, 0.5), width=0.1, height=0.2)
+
+    for index, face in enumerate(beam.faces):
+        frame = beam.face_frame(index)
+        assert frame.point == face.point
+        assert frame.xaxis == face.xaxis
+        assert frame.yaxis == face.yaxis
+        assert close(Vector(*beam.face_normals[index]).angle(face.normal), 0.0)
+
+
+def test_face_table_updates_with_beam():
+    beam = Beam(Frame.worldXY(), length=1.0, width=0.1, height=0.2)
+    assert close(beam.face_origins[5][0], 1.0)
+
+    beam.length = 2.0
+    assert close(beam.face_origins[5][0], 2.0)
+
+    beam.frame = Frame([0.0, 0.0, 1.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0])
+    assert close(beam.face_origins[5][1], 2.0)
+    assert close(beam.face_origins[5][2], 1.0)
@@ -0,0 +1,385 @@
+import hashlib
+import json
+import os
+import re
+import xml.dom.minidom as MD
+import xml.etree.ElementTree as ET
+
+import pytest
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+
+from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import LButtJoint
+from compas_timber.connections import LMiterJoint
+from compas_timber.connections import TButtJoint
+from compas_timber.connections import XHalfLapJoint
+from compas_timber.fabrication import BTLx
+from compas_timber.fabrication import BTLxPartCache
+from compas_timber.fabrication import TButtFactory
+from compas_timber.fabrication import partition_beams_by_attribute
+from compas_timber.fabrication import partition_beams_by_count
+from compas_timber.fabrication import partition_beams_by_region
+from compas_timber.fabrication.btlx import BTLxPart
+from compas_timber.fabrication.btlx import _write_pretty_xml
+from compas_timber.parts import Beam
+
+
+def create_frame_assembly(offset=0.0):
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    bottom = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=z)
+    right = Beam.from_endpoints(Point(1, 0, 0), Point(1, 1, 0), 0.1, 0.2, z_vector=z)
+    left = Beam.from_endpoints(Point(0, 0, 0), Point(0, 1, 0), 0.1, 0.2, z_vector=z)
+    stud = Beam.from_endpoints(Point(0.5 + offset, 0, 0), Point(0.5 + offset, 1, 0), 0.1, 0.2, z_vector=z)
+    for beam in (bottom, right, left, stud):
+        assembly.add_beam(beam)
+    LMiterJoint.create(assembly, bottom, right)
+    LButtJoint.create(assembly, left, bottom)
+    TButtJoint.create(assembly, stud, bottom)
+    return assembly
+
+
+@pytest.fixture
+def assembly():
+    return create_frame_assembly()
+
+
+def test_btlx_string(assembly):
+    btlx = BTLx(assembly)
+    result = btlx.btlx_string()
+
+    assert result == MD.parseString(ET.tostring(btlx.ET_element)).toprettyxml(indent="   ")
+    assert result.count("<Part ") == 4
+    assert result.count("<JackRafterCut ") == 5
+
+
+def test_write_pretty_xml_matches_minidom():
+    element = ET.Element("Part", Designation='a "b" & <c>')
+    ET.SubElement(element, "Annotation").text = "x < y & y > z"
+    ET.SubElement(element, "Outline", Name="o")
+    lines = []
+
+    _write_pretty_xml(element, "", "   ", lines)
+
+    document = MD.parseString(ET.tostring(element)).toprettyxml(indent="   ")
+    assert "".join(lines) == document.split("\n", 1)[1]
+    assert ' Designation="a &quot;b&quot; &amp; &lt;c&gt;"' in lines
+
+    quoted = ET.Element("Annotation")
+    quoted.text = 'a "b"'
+    lines = []
+    _write_pretty_xml(quoted, "", "", lines)
+    assert "".join(lines) == '<Annotation>a "b"</Annotation>\n'  # quotes are only escaped in attributes
+
+
+def test_btlx_string_no_parts():
+    btlx = BTLx(TimberAssembly())
+
+    assert "<Parts/>" in btlx.btlx_string()
+
+
+def create_wall_assembly(stud_count):
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    bottom = Beam.from_endpoints(Point(0, 0, 0), Point(stud_count + 1, 0, 0), 0.1, 0.2, z_vector=z)
+    assembly.add_beam(bottom)
+    for i in range(stud_count):
+        stud = Beam.from_endpoints(Point(i + 1, 0, 0), Point(i + 1, 2, 0), 0.1, 0.2, z_vector=z)
+        assembly.add_beam(stud)
+        TButtJoint.create(assembly, stud, bottom)
+    return assembly
+
+
+def test_merge_identical_parts():
+    btlx = BTLx(create_wall_assembly(4), merge_identical_parts=True)
+    result = btlx.btlx_string()
+    parts = btlx.parts_element.findall("Part")
+
+    assert result == MD.parseString(ET.tostring(btlx.ET_element)).toprettyxml(indent="   ")
+    assert [part.get("Count") for part in parts] == ["1", "4"]
+    assert [len(part.find("Transformations")) for part in parts] == [1, 4]
+    assert result.count("<JackRafterCut ") == 1
+    # one transformation per stud, in the order of the beams
+    reference_points = [element.get("X") for element in parts[1].iter("ReferencePoint")]
+    assert reference_points == ["1.050", "2.050", "3.050", "4.050"]
+
+
+def test_merge_identical_parts_off():
+    btlx = BTLx(create_wall_assembly(4))
+    result = btlx.btlx_string()
+
+    assert result.count("<Part ") == 5
+    assert result.count('Count="1"') == 5
+
+
+class CustomTButtJoint(TButtJoint):
+    pass
+
+
+class BatchedTButtFactory(object):
+    batches = []
+
+    @classmethod
+    def apply_processings_many(cls, joints, parts):
+        cls.batches.append(joints)
+        for joint in joints:
+            TButtFactory.apply_processings(joint, parts)
+
+
+@pytest.fixture
+def batched_factory():
+    BTLx.register_joint(CustomTButtJoint, BatchedTButtFactory)
+    yield BatchedTButtFactory
+    del BTLx.REGISTERED_JOINTS[CustomTButtJoint]
+    BTLx.register_joint(TButtJoint, TButtFactory)  # resets the resolved factories
+    BatchedTButtFactory.batches = []
+
+
+def test_get_joint_factory():
+    assert BTLx.get_joint_factory(TButtJoint) is TButtFactory
+    assert BTLx.get_joint_factory(CustomTButtJoint) is TButtFactory  # resolved from the base class
+    assert BTLx.get_joint_factory(XHalfLapJoint) is None
+
+
+def test_unsupported_joints_are_reported(assembly):
+    bottom = assembly.find_by_key(0)
+    cross = Beam.from_endpoints(Point(0.2, -1, 0), Point(0.2, 1, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    assembly.add_beam(cross)
+    lap = XHalfLapJoint.create(assembly, bottom, cross)
+    btlx = BTLx(assembly)
+
+    assert btlx.report
+    assert btlx.report.unsupported_joints == [lap]
+    assert btlx.report.unsupported_joint_types == ["XHalfLapJoint"]
+    assert btlx.btlx_string().count("<JackRafterCut ") == 5
+
+
+def test_batched_joint_factory(batched_factory):
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    bottom = Beam.from_endpoints(Point(0, 0, 0), Point(4, 0, 0), 0.1, 0.2, z_vector=z)
+    assembly.add_beam(bottom)
+    joints = []
+    for i in range(3):
+        stud = Beam.from_endpoints(Point(i + 1, 0, 0), Point(i + 1, 2, 0), 0.1, 0.2, z_vector=z)
+        assembly.add_beam(stud)
+        joints.append(CustomTButtJoint.create(assembly, stud, bottom))
+    btlx = BTLx(assembly)
+
+    assert not btlx.report
+    assert batched_factory.batches == [joints]
+    assert btlx.btlx_string().count("<JackRafterCut ") == 3
+
+
+def test_lazy_btlx(assembly):
+    btlx = BTLx(assembly, lazy=True)
+
+    assert btlx.parts == {}
+    assert _normalized(btlx.btlx_string()) == _normalized(BTLx(assembly).btlx_string())
+    assert btlx.parts == {}
+    assert [part.key for part in btlx.iter_parts()] == [0, 1, 2, 3]
+
+
+def test_lazy_btlx_write(assembly, tmp_path):
+    filepath = str(tmp_path / "frame.btlx")
+    BTLx(assembly, lazy=True).write(filepath)
+
+    with open(filepath) as f:
+        result = f.read()
+    assert result.count("<Part ") == 4
+    assert result.count("<JackRafterCut ") == 5
+    ET.fromstring(result)  # well formed
+
+
+def test_lazy_btlx_no_parts():
+    assert "<Parts/>" in BTLx(TimberAssembly(), lazy=True).btlx_string()
+
+
+def test_lazy_btlx_invalid_arguments(assembly):
+    with pytest.raises(ValueError):
+        BTLx(assembly, cache=BTLxPartCache(), lazy=True)
+    with pytest.raises(ValueError):
+        BTLx(assembly, merge_identical_parts=True, lazy=True)
+
+
+def test_partition_beams_by_count():
+    beams = list(create_wall_assembly(4).beams)
+
+    assert partition_beams_by_count(beams, 2) == [beams[:2], beams[2:4], beams[4:]]
+    assert partition_beams_by_count(beams, 10) == [beams]
+    with pytest.raises(ValueError):
+        partition_beams_by_count(beams, 0)
+
+
+def test_partition_beams_by_attribute():
+    beams = list(create_wall_assembly(4).beams)
+    for index, beam in enumerate(beams[1:]):
+        beam.attributes["storey"] = index % 2
+
+    assert partition_beams_by_attribute(beams, "storey") == [[beams[0]], [beams[1], beams[3]], [beams[2], beams[4]]]
+
+
+def test_partition_beams_by_region():
+    beams = list(create_wall_assembly(4).beams)
+
+    # midpoints of the bottom beam at x=2.5, of the studs at x=1, 2, 3, 4
+    assert partition_beams_by_region(beams, 2.0) == [[beams[0], beams[2], beams[3]], [beams[1]], [beams[4]]]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_write_shards(tmp_path, lazy):
+    assembly = create_wall_assembly(4)
+    btlx = BTLx(assembly, lazy=lazy)
+    manifest = btlx.write_shards(str(tmp_path), partition_beams_by_count(assembly.beams, 2), basename="wall")
+
+    with open(str(tmp_path / "wall_manifest.json")) as f:
+        assert json.load(f) == manifest
+    assert [shard["filename"] for shard in manifest["shards"]] == ["wall_000.btlx", "wall_001.btlx", "wall_002.btlx"]
+    # the graph keys of the beams, the joints are in between
+    assert [shard["part_number_range"] for shard in manifest["shards"]] == [[0, 1], [3, 5], [7, 7]]
+    for shard in manifest["shards"]:
+        with open(os.path.join(str(tmp_path), shard["filename"]), "rb") as f:
+            data = f.read()
+        assert hashlib.sha256(data).hexdigest() == shard["sha256"]
+        assert data.decode("utf-8").count("<Part ") == shard["part_count"]
+        ET.fromstring(data)
+
+
+def test_format_values():
+    assert BTLx.format_values([1, 2.34567, -0.0001]) == ["1.000", "2.346", "-0.000"]
+    assert BTLx.format_values([1, 2.34567, 3], [0, 1, 2]) == ["1", "2.3", "3.00"]
+    assert BTLx.format_values([]) == []
+
+
+def test_cache_reuses_unchanged_parts(assembly):
+    cache = BTLxPartCache()
+    first = BTLx(assembly, cache=cache)
+
+    assert sorted(first.regenerated_part_keys) == ["0", "1", "2", "3"]
+    assert len(cache) == 4
+
+    second = BTLx(create_frame_assembly(), cache=cache)
+
+    assert second.regenerated_part_keys == []
+    assert cache.hits == 4
+    for key, part in second.parts.items():
+        assert part is first.parts[key]
+    assert second.btlx_string().count("<JackRafterCut ") == 5
+
+
+def test_cache_regenerates_changed_parts(assembly):
+    cache = BTLxPartCache()
+    first = BTLx(assembly, cache=cache)
+
+    # moving the stud affects the stud and the bottom beam it is joined to, the side beams are unchanged
+    second = BTLx(create_frame_assembly(offset=0.1), cache=cache)
+
+    assert sorted(second.regenerated_part_keys) == ["0", "3"]
+    assert second.parts["1"] is first.parts["1"]
+    assert second.parts["2"] is first.parts["2"]
+    assert second.parts["3"] is not first.parts["3"]
+    assert len(second.parts["1"].processings) == 1
+    assert len(second.parts["0"].processings) == 2
+    assert len(second.parts["3"].processings) == 1
+    assert _normalized(second.btlx_string()) == _normalized(BTLx(create_frame_assembly(offset=0.1)).btlx_string())
+
+
+def test_cache_regenerates_parts_with_changed_attributes(assembly):
+    cache = BTLxPartCache()
+    BTLx(assembly, cache=cache)
+    assembly.beams[1].attributes["storey"] = "S2"
+
+    second = BTLx(assembly, cache=cache)
+
+    assert second.regenerated_part_keys == ["1"]
+    assert 'Storey="S2"' in second.btlx_string()
+
+
+def test_reference_surfaces():
+    beam = Beam.from_endpoints(Point(0.3, 0.2, 0.1), Point(1, 2, 0.5), 0.1, 0.2, z_vector=Vector(0, 0.2, 1))
+    beam.add_blank_extension(0.1, 0.05)
+    part = BTLxPart(beam)
+    frame = part.frame
+    expected = {
+        "1": (frame.point, frame.xaxis, frame.zaxis),
+        "2": (frame.point + frame.yaxis * part.width, frame.xaxis, -frame.yaxis),
+        "3": (frame.point + frame.yaxis * part.width + frame.zaxis * part.height, frame.xaxis, -frame.zaxis),
+        "4": (frame.point + frame.zaxis * part.height, frame.xaxis, frame.yaxis),
+        "5": (frame.point, frame.zaxis, frame.yaxis),
+        "6": (frame.point + frame.xaxis * part.blank_length + frame.yaxis * part.width, frame.zaxis, -frame.yaxis),
+    }
+
+    assert list(frame.point) == pytest.approx(list(beam.long_edges[2].closest_point(beam.blank_frame.point)))
+    for key, (point, xaxis, yaxis) in expected.items():
+        surface = part.reference_surfaces[key]
+        assert list(surface.point) == pytest.approx(list(point))
+        assert list(surface.xaxis) == pytest.approx(list(xaxis))
+        assert list(surface.yaxis) == pytest.approx(list(yaxis))
+        assert part.reference_surface_planes(int(key)) is surface
+
+
+def test_reference_surface_from_beam_face():
+    beam = Beam.from_endpoints(Point(0, 0, 0), Point(1, 1, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    part = BTLxPart(beam)
+
+    assert [part.reference_surface_from_beam_face(face) for face in beam.faces] == ["3", "2", "1", "4", "5", "6"]
+
+    # tolerates a normal which is off by a rounding error, but not a rotated face
+    assert part.reference_surface_from_beam_face(Frame(beam.frame.point, [1, 0, 1e-9], [0, 1, 0])) == "4"
+    assert part.reference_surface_from_beam_face(Frame(beam.frame.point, [1, 0, 0.1], [0, 1, 0])) is None
+
+
+def test_shape_strings_of_blank():
+    beam = Beam.from_endpoints(Point(0.3, 0.2, 0.1), Point(1, 2, 0.5), 0.1, 0.2, z_vector=Vector(0, 0.2, 1))
+    part = BTLxPart(beam)
+    coord_index, points = part.shape_strings
+
+    faces = coord_index.split(" -1")[:-1]
+    coordinates = [float(value) for value in points.split()]
+    assert len(faces) == 6
+    assert all(len(face.split()) == 4 for face in faces)
+    assert len(coordinates) == 8 * 3
+    assert min(coordinates) == 0.0
+    assert max(coordinates) == pytest.approx(round(beam.blank_length, BTLx.POINT_PRECISION))
+    assert "-0.000" not in points
+
+
+def test_shape_strings_merges_vertices(mocker):
+    beam = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    part = BTLxPart(beam)
+    corner = part.frame.point
+
+    def loop(*points):
+        return mocker.Mock(vertices=[mocker.Mock(point=corner + Vector(*point)) for point in points])
+
+    # vertices of both faces differ below POINT_PRECISION
+    first = mocker.Mock(loops=[loop((0, 0, 0), (1, 0, 0), (1, 1, 0))])
+    second = mocker.Mock(loops=[loop((1.00001, 0, 0), (0, 0, 0.00001), (1, 0, 1))])
+    part.geometry = mocker.Mock(faces=[first, second])
+
+    assert part.shape_strings == [
+        "0 1 2 -1 1 0 3 -1",
+        "0.000 0.000 0.000 1.000 0.000 0.000 1.000 1.000 0.000 1.000 0.000 1.000",
+    ]
+    assert 'coordIndex="0 1 2 -1 1 0 3 -1"' in ET.tostring(part.et_shape).decode()
+
+
+def test_shape_strings_without_face_loops(mocker, capsys):
+    beam = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    part = BTLxPart(beam)
+    expected = part.shape_strings
+    part = BTLxPart(beam)
+    face = mocker.Mock()
+    type(face).loops = mocker.PropertyMock(side_effect=NotImplementedError)
+    part.geometry = mocker.Mock(faces=[face])
+
+    assert part.shape_strings == expected  # the blank
+    assert capsys.readouterr().out == ""
+
+
+def _normalized(btlx_string):
+    # removes the values which differ between exports
+    btlx_string = re.sub(r'GUID="\{[^}]*\}"', "", btlx_string)
+    return re.sub(r'Time="[^"]*"', "", btlx_string)
@@ -0,0 +1,75 @@
+import pytest
+from compas.geometry import Point
+from compas.geometry import Vector
+
+from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import LButtJoint
+from compas_timber.connections import TButtJoint
+from compas_timber.fabrication import BTLx
+from compas_timber.fabrication import BTLxReader
+from compas_timber.parts import Beam
+
+
+@pytest.fixture
+def assembly():
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    bottom = Beam.from_endpoints(Point(0, 0, 0), Point(4, 0, 0), 0.1, 0.2, z_vector=z)
+    left = Beam.from_endpoints(Point(0, 0, 0), Point(0, 2, 0), 0.1, 0.2, z_vector=z)
+    assembly.add_beam(bottom)
+    assembly.add_beam(left)
+    LButtJoint.create(assembly, left, bottom)
+    for x in (1, 2, 3):
+        stud = Beam.from_endpoints(Point(x, 0, 0), Point(x, 2, 0), 0.1, 0.2, z_vector=z)
+        assembly.add_beam(stud)
+        TButtJoint.create(assembly, stud, bottom)
+    return assembly
+
+
+def write_btlx(btlx, tmp_path):
+    filepath = str(tmp_path / "assembly.btlx")
+    btlx.write(filepath)
+    return filepath
+
+
+def test_iter_parts(assembly, tmp_path):
+    btlx = BTLx(assembly)
+    parts = list(BTLxReader(write_btlx(btlx, tmp_path)).iter_parts())
+
+    assert [part.key for part in parts] == [key for key in btlx.parts]
+    for part in parts:
+        written = btlx.parts[part.key]
+        assert part.count == 1
+        assert part.length == pytest.approx(written.blank_length)
+        assert part.width == pytest.approx(written.width)
+        assert part.height == pytest.approx(written.height)
+        assert len(part.transformations) == 1
+        assert [process.process_type for process in part.processings] == [
+            process.process_type for process in written.processings
+        ]
+        assert [process.process_parameters for process in part.processings] == [
+            process.process_parameters for process in written.processings
+        ]
+        assert part.shape_strings == written.shape_strings
+
+
+def test_iter_beams(assembly, tmp_path):
+    beams = list(BTLxReader(write_btlx(BTLx(assembly), tmp_path)).iter_beams())
+
+    assert len(beams) == len(assembly.beams)
+    for beam, original in zip(beams, assembly.beams):
+        assert beam.width == pytest.approx(original.width)
+        assert beam.height == pytest.approx(original.height)
+        assert beam.length == pytest.approx(original.blank_length)
+        assert list(beam.frame.point) == pytest.approx(list(original.blank_frame.point), abs=1e-3)
+        assert list(beam.frame.xaxis) == pytest.approx(list(original.frame.xaxis), abs=1e-3)
+        assert list(beam.frame.yaxis) == pytest.approx(list(original.frame.yaxis), abs=1e-3)
+
+
+def test_merged_parts(assembly, tmp_path):
+    reader = BTLxReader(write_btlx(BTLx(assembly, merge_identical_parts=True), tmp_path))
+    parts = list(reader.iter_parts())
+
+    assert [part.count for part in parts] == [1, 1, 3]
+    assert len(parts[2].transformations) == 3
+    assert len(reader.to_assembly().beams) == 5
@@ -0,0 +1,426 @@
+import compas
+import pytest
+from compas.geometry import Box
+from compas.geometry import Cylinder
+from compas.geometry import Frame
+from compas.geometry import Line
+from compas.geometry import Plane
+from compas.geometry import Point
+from compas.geometry import Polyhedron
+from compas.geometry import Vector
+
+from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import LMiterJoint
+from compas_timber.connections import TButtJoint
+from compas_timber.consumers import BrepGeometryConsumer
+from compas_timber.consumers import DistanceLODPolicy
+from compas_timber.consumers import FeatureApplicationError
+from compas_timber.consumers import LOD
+from compas_timber.consumers import MillVolumeUnion
+from compas_timber.consumers import MillVolumeUnionGeometry
+from compas_timber.consumers import ScreenSizeLODPolicy
+from compas_timber.consumers import optimize_features
+from compas_timber.consumers import volume_intersects_box
+from compas_timber.parts import Beam
+from compas_timber.parts import CutFeature
+from compas_timber.parts import DrillFeature
+from compas_timber.parts import MillVolume
+
+if not compas.IPY:
+    import numpy as np
+
+    from compas_timber.consumers import ConvexGeometryConsumer
+    from compas_timber.consumers import ConvexPolyhedron
+    from compas_timber.consumers import CutFeatureConvexGeometry
+    from compas_timber.consumers import MeshGeometryConsumer
+
+
+@pytest.fixture
+def assembly():
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    bottom = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=z)
+    right = Beam.from_endpoints(Point(1, 0, 0), Point(1, 1, 0), 0.1, 0.2, z_vector=z)
+    stud = Beam.from_endpoints(Point(0.5, 0, 0), Point(0.5, 1, 0), 0.1, 0.2, z_vector=z)
+    for beam in (bottom, right, stud):
+        assembly.add_beam(beam)
+    LMiterJoint.create(assembly, bottom, right)
+    TButtJoint.create(assembly, stud, bottom)
+    return assembly
+
+
+def test_lod_policies(assembly):
+    near, far = assembly.beams[0], assembly.beams[2]
+    distance = DistanceLODPolicy(Point(0.5, -1, 0), [(2.0, LOD.TRIMS), (1.2, LOD.FULL)])
+    screen_size = ScreenSizeLODPolicy(Point(0.5, -1, 0), [(1000, LOD.FULL), (5, LOD.TRIMS)], viewport_height=1000)
+
+    assert distance.get_lod(near) == LOD.FULL
+    assert distance.get_lod(far) == LOD.TRIMS
+    assert DistanceLODPolicy(Point(0, 0, 100), [(1.0, LOD.FULL)]).get_lod(near) == LOD.BOUNDING_BOX
+    assert screen_size.screen_size(near) > screen_size.screen_size(far)
+    assert screen_size.get_lod(near) == LOD.FULL
+    assert screen_size.get_lod(far) == LOD.TRIMS
+    assert LOD.resolve(screen_size, far) == LOD.TRIMS
+    assert LOD.get_name(LOD.TRIMS) == "TRIMS"
+
+
+def cut(x, normal=(1, 0, 0)):
+    return CutFeature(Plane(Point(x, 0, 0), Vector(*normal)))
+
+
+def mill_volume(x):
+    return MillVolume(Box(1, 1, 1, Frame(Point(x, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0))))
+
+
+def test_optimize_features_dominated_cuts():
+    deep, shallow, opposite, tilted = cut(1), cut(2), cut(2, (-1, 0, 0)), cut(2, (1, 1, 0))
+
+    assert optimize_features([shallow, opposite, deep, tilted]) == [deep, opposite, tilted]
+
+
+def test_optimize_features_mill_volumes():
+    a, b, c, d = mill_volume(0), mill_volume(5), mill_volume(0.8), mill_volume(5.5)
+    drill = DrillFeature(None, 0.01, 0.1)
+    trim = cut(10)
+
+    features = optimize_features([a, drill, b, c, d, trim])
+
+    assert features[:2] == [trim, drill]
+    assert [type(feature) for feature in features[2:]] == [MillVolumeUnion, MillVolumeUnion]
+    assert features[2].features == [a, c]
+    assert features[3].features == [b, d]
+
+
+def diamond_pocket(x, y):
+    # a box turned by 45 degrees, its bounding box is larger than the box
+    return MillVolume(Box(1, 1, 1, Frame(Point(x, y, 0), Vector(1, 1, 0), Vector(-1, 1, 0))))
+
+
+def test_optimize_features_separate_pockets():
+    a, b = diamond_pocket(0, 0), diamond_pocket(1.1, 1.1)  # the bounding boxes overlap, the boxes don't
+
+    assert optimize_features([a, b]) == [a, b]
+    assert [type(feature) for feature in optimize_features([a, diamond_pocket(0.6, 0.6)])] == [MillVolumeUnion]
+
+
+def test_mill_volume_union_geometry_separate_bodies(mocker):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    first, second = mocker.Mock(), mocker.Mock()
+    brep.from_mesh.side_effect = [first, second]
+    brep.from_boolean_union.return_value = [first, second]  # the volumes don't touch
+    geometry = mocker.MagicMock()
+    geometry.__sub__.return_value = geometry
+
+    applicator = MillVolumeUnionGeometry(geometry, MillVolumeUnion([diamond_pocket(0, 0), diamond_pocket(1.1, 1.1)]))
+
+    assert applicator.apply() is geometry
+    assert applicator.bodies == [first, second]
+    assert [call[0][0] for call in geometry.__sub__.call_args_list] == [first, second]
+
+
+def test_brep_geometry_consumer_optimize(assembly, mocker):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    geometry = brep.from_box.return_value
+    geometry.trimmed.return_value = [geometry]
+    stud = assembly.beams[2]
+    stud.add_features(CutFeature(Plane(Point(0.5, 0, 0), Vector(0, -1, 0))))  # dominated by the butt cut
+
+    list(BrepGeometryConsumer(assembly, optimize=True).result)
+    optimized = geometry.trimmed.call_count
+    geometry.trimmed.reset_mock()
+    list(BrepGeometryConsumer(assembly).result)
+
+    assert optimized == 3
+    assert geometry.trimmed.call_count == 4
+
+
+def test_brep_geometry_consumer_compound(assembly, mocker):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    geometry = brep.from_box.return_value
+    geometry.trimmed.return_value = [geometry]
+    stud = assembly.beams[2]
+    for y in (0.2, 0.4, 0.6):
+        stud.add_features(DrillFeature(Line(Point(0.5, y, -0.2), Point(0.5, y, 0.2)), 0.01, 0.4))
+    stud.add_features(mill_volume(0.5))
+
+    consumer = BrepGeometryConsumer(assembly, compound=True)
+    result = list(consumer.result)[2]
+
+    brep.from_boolean_difference.assert_called_once()
+    assert len(brep.from_boolean_difference.call_args[0][1]) == 4
+    assert result.geometry is brep.from_boolean_difference.return_value
+    assert not geometry.__sub__.called
+    assert consumer.stats.applied == 7  # two miters, the butt cut, three drills and the mill volume
+    assert consumer.stats.by_feature_type["DrillFeature"] == {"applied": 3, "culled": 0, "failed": 0}
+    assert consumer.stats.by_feature_type["CutFeature"]["applied"] == 3
+
+
+def test_brep_geometry_consumer_compound_fallback(assembly, mocker):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    brep.from_boolean_difference.side_effect = NotImplementedError
+    geometry = brep.from_box.return_value
+    geometry.trimmed.return_value = [geometry]
+    geometry.__sub__.return_value = geometry
+    stud = assembly.beams[2]
+    for y in (0.2, 0.4, 0.6):
+        stud.add_features(DrillFeature(Line(Point(0.5, y, -0.2), Point(0.5, y, 0.2)), 0.01, 0.4))
+
+    consumer = BrepGeometryConsumer(assembly, compound=True)
+    result = list(consumer.result)[2]
+
+    assert geometry.__sub__.call_count == 3
+    assert result.geometry is geometry
+    assert result.debug_info is None
+    assert consumer.stats.compound_fallbacks == 1
+    assert isinstance(consumer.stats.compound_errors[0], NotImplementedError)
+
+
+@pytest.mark.parametrize("error", [TypeError, AttributeError])
+def test_brep_geometry_consumer_compound_single_tool_backend(assembly, mocker, error):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    brep.from_boolean_difference.side_effect = error
+    geometry = brep.from_box.return_value
+    geometry.trimmed.return_value = [geometry]
+    geometry.__sub__.return_value = geometry
+    stud = assembly.beams[2]
+    for y in (0.2, 0.4):
+        stud.add_features(DrillFeature(Line(Point(0.5, y, -0.2), Point(0.5, y, 0.2)), 0.01, 0.4))
+
+    consumer = BrepGeometryConsumer(assembly, compound=True)
+    result = list(consumer.result)[2]
+
+    assert geometry.__sub__.call_count == 2
+    assert result.debug_info is None
+    assert isinstance(consumer.stats.compound_errors[0], error)
+
+
+def test_brep_geometry_consumer_compound_error(assembly, mocker):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    brep.from_boolean_difference.side_effect = RuntimeError
+    stud = assembly.beams[2]
+    for y in (0.2, 0.4):
+        stud.add_features(DrillFeature(Line(Point(0.5, y, -0.2), Point(0.5, y, 0.2)), 0.01, 0.4))
+
+    with pytest.raises(RuntimeError):
+        list(BrepGeometryConsumer(assembly, compound=True).result)
+
+
+def test_brep_geometry_consumer_stats_mill_volume_union(assembly, mocker):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    geometry = brep.from_box.return_value
+    geometry.trimmed.return_value = [geometry]
+    stud = assembly.beams[2]
+    stud.add_features([mill_volume(0.5), mill_volume(0.55), mill_volume(0.6)])
+    assert MillVolumeUnion in [type(feature) for feature in optimize_features(stud.features)]
+
+    consumer = BrepGeometryConsumer(assembly, optimize=True)
+    list(consumer.result)
+
+    assert consumer.stats.by_feature_type["MillVolume"] == {"applied": 3, "culled": 0, "failed": 0}
+    assert "MillVolumeUnion" not in consumer.stats.by_feature_type
+
+
+def test_brep_geometry_consumer_failure_rate(assembly, mocker):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    geometry = brep.from_box.return_value
+    geometry.trimmed.return_value = [geometry]
+    geometry.__sub__.side_effect = IndexError
+    stud = assembly.beams[2]
+    stud.add_features(DrillFeature(Line(Point(0.5, 0.5, -0.2), Point(0.5, 0.5, 0.2)), 0.01, 0.4))
+
+    consumer = BrepGeometryConsumer(assembly)
+    result = list(consumer.result)[2]
+
+    assert isinstance(result.debug_info, FeatureApplicationError)
+    assert consumer.stats.failure_rate("DrillFeature") == 1.0
+    assert consumer.stats.failure_rate("CutFeature") == 0.0
+    assert consumer.stats.failure_rate() == 0.25
+
+
+def test_volume_intersects_box():
+    box = Box(2, 2, 2, Frame(Point(0, 0, 0), Vector(1, 1, 0), Vector(-1, 1, 0)))
+
+    assert volume_intersects_box(Box(1, 1, 1, Frame(Point(1.5, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0))), box)
+    assert not volume_intersects_box(Box(1, 1, 1, Frame(Point(2.5, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0))), box)
+    assert volume_intersects_box(Cylinder(0.1, 1, Frame(Point(0, 0, 1.05), Vector(1, 0, 0), Vector(0, 1, 0))), box)
+    assert not volume_intersects_box(Cylinder(0.1, 1, Frame(Point(0, 0, 1.6), Vector(1, 0, 0), Vector(0, 1, 0))), box)
+    assert volume_intersects_box([mill_volume(5).volume, mill_volume(0).volume], box)
+
+
+def test_brep_geometry_consumer_culling(assembly, mocker):
+    brep = mocker.patch("compas_timber.consumers.geometry.Brep")
+    geometry = brep.from_box.return_value
+    geometry.trimmed.return_value = [geometry]
+    stud = assembly.beams[2]
+    stud.add_features(DrillFeature(Line(Point(2, 0.5, -0.2), Point(2, 0.5, 0.2)), 0.01, 0.4))
+    stud.add_features(mill_volume(0.5))
+
+    consumer = BrepGeometryConsumer(assembly)
+    result = list(consumer.result)[2]
+
+    assert isinstance(result.debug_info, FeatureApplicationError)
+    assert result.geometry is geometry
+    assert not brep.from_cylinder.called
+    assert not brep.from_mesh.called
+    assert not brep.from_boolean_difference.called
+    assert consumer.stats.culled == 1
+    assert consumer.stats.by_feature_type["DrillFeature"]["culled"] == 1
+    assert consumer.stats.culled_errors == [result.debug_info]
+
+
+if not compas.IPY:
+
+    def volume(vertices, faces):
+        # sum of the signed volumes of the tetrahedra of a fan triangulation of each face
+        total = 0.0
+        for face in faces:
+            for i in range(1, len(face) - 1):
+                a, b, c = vertices[face[0]], vertices[face[i]], vertices[face[i + 1]]
+                total += np.dot(a, np.cross(b, c)) / 6.0
+        return total
+
+    def test_trimmed_box():
+        polyhedron = ConvexPolyhedron.from_box(Box(2, 2, 2))
+        plane = Plane(Point(0.5, 0, 0), Vector(1, 0, 0))
+
+        vertices, faces = polyhedron.trimmed(plane).to_vertices_and_faces()
+
+        assert len(vertices) == 8
+        assert len(faces) == 6
+        assert vertices[:, 0].max() == pytest.approx(0.5)  # the part behind the plane is kept
+        assert volume(vertices, faces) == pytest.approx(1.5 * 2 * 2)
+
+    def test_trimmed_corner():
+        polyhedron = ConvexPolyhedron.from_box(Box(2, 2, 2))
+        plane = Plane(Point(0.5, 0.5, 0.5), Vector(1, 1, 1))
+
+        vertices, faces = polyhedron.trimmed(plane).to_vertices_and_faces()
+
+        assert len(vertices) == 7 + 3
+        assert sorted(len(face) for face in faces) == [3, 4, 4, 4, 5, 5, 5]
+        assert volume(vertices, faces) == pytest.approx(8 - 1.5**3 / 6)
+
+    def test_trimmed_through_vertices():
+        polyhedron = ConvexPolyhedron.from_box(Box(2, 2, 2))
+        plane = Plane(Point(0, 0, 0), Vector(1, 1, 0))
+
+        vertices, faces = polyhedron.trimmed(plane).to_vertices_and_faces()
+
+        assert len(vertices) == 6
+        assert len(faces) == 5
+        assert volume(vertices, faces) == pytest.approx(4)
+
+    def test_trimmed_outside():
+        polyhedron = ConvexPolyhedron.from_box(Box(2, 2, 2))
+
+        assert polyhedron.trimmed(Plane(Point(5, 0, 0), Vector(1, 0, 0))).faces == polyhedron.faces
+        assert polyhedron.trimmed(Plane(Point(-5, 0, 0), Vector(1, 0, 0))).is_empty
+
+    def test_cut_feature_convex_geometry_error():
+        polyhedron = ConvexPolyhedron.from_box(Box(2, 2, 2))
+        feature = CutFeature(Frame(Point(-5, 0, 0), Vector(0, 1, 0), Vector(0, 0, 1)))
+
+        with pytest.raises(FeatureApplicationError):
+            CutFeatureConvexGeometry(polyhedron, feature).apply()
+
+    def test_convex_geometry_consumer(assembly):
+        results = list(ConvexGeometryConsumer(assembly).result)
+        bounds = []
+        for result in results:
+            vertices, faces = result.geometry.to_vertices_and_faces()
+            assert result.debug_info is None
+            assert result.geometry.to_mesh().is_closed()
+            bounds.append(vertices.min(axis=0).tolist() + vertices.max(axis=0).tolist())
+
+        assert bounds[0] == pytest.approx([0, -0.05, -0.1, 1.05, 0.05, 0.1])  # mitered at its end
+        assert bounds[1] == pytest.approx([0.95, -0.05, -0.1, 1.05, 1, 0.1])  # mitered at its start
+        assert bounds[2] == pytest.approx([0.45, 0.05, -0.1, 0.55, 1, 0.1])  # butted against the bottom beam
+
+    def test_convex_geometry_consumer_skips_other_features(assembly):
+        stud = assembly.beams[2]
+        stud.add_features(DrillFeature(stud.centerline, 0.01, 0.1))
+
+        result = list(ConvexGeometryConsumer(assembly).result)[2]
+
+        assert isinstance(result.debug_info, FeatureApplicationError)
+        assert result.geometry.to_vertices_and_faces()[0].min(axis=0).tolist() == pytest.approx([0.45, 0.05, -0.1])
+
+    def test_mesh_geometry_consumer_mill_volume(assembly):
+        stud = assembly.beams[2]
+        stud.add_features(MillVolume(Box(0.4, 0.4, 0.4, Frame(Point(0.5, 1, 0), Vector(1, 0, 0), Vector(0, 1, 0)))))
+
+        result = list(MeshGeometryConsumer(assembly).result)[2]
+        vertices, triangles = result.geometry
+
+        assert result.debug_info is None
+        assert triangles.shape == (12, 3)
+        assert vertices.max(axis=0).tolist() == pytest.approx([0.55, 0.8, 0.1])  # the end was milled away convexly
+
+    def test_mesh_geometry_consumer_non_convex_mill_volume(assembly):
+        # a hook around the end of the stud which does not touch it, the plane of the end of its arm would trim the stud
+        outline = [(0.6, 0.6), (0.7, 0.6), (0.7, 1.2), (0.3, 1.2), (0.3, 1.1), (0.6, 1.1)]
+        vertices = [[x, y, z] for z in (-0.2, 0.2) for x, y in outline]
+        faces = [[5, 4, 3, 2, 1, 0], [6, 7, 8, 9, 10, 11]] + [
+            [i, (i + 1) % 6, (i + 1) % 6 + 6, i + 6] for i in range(6)
+        ]
+        stud = assembly.beams[2]
+        stud.add_features(MillVolume(Polyhedron(vertices, faces)))
+
+        result = list(MeshGeometryConsumer(assembly).result)[2]
+
+        assert isinstance(result.debug_info, FeatureApplicationError)  # subtracted with a mesh boolean instead
+        assert result.geometry[0].max(axis=0).tolist() == pytest.approx([0.55, 1.0, 0.1])
+
+    def test_mesh_geometry_consumer_drill(assembly):
+        stud = assembly.beams[2]
+        stud.add_features(DrillFeature(stud.centerline, 0.01, 0.1))
+
+        result = list(MeshGeometryConsumer(assembly).result)[2]
+        assert isinstance(result.debug_info, FeatureApplicationError)  # no mesh boolean plugin is installed
+
+        result = list(MeshGeometryConsumer(assembly, drill_segments=0).result)[2]
+        assert result.debug_info is None
+
+    def test_mesh_geometry_consumer_merged(assembly):
+        vertices, triangles, beam_indices = MeshGeometryConsumer(assembly).merged()
+
+        assert vertices.shape == (24, 3)
+        assert triangles.shape == (36, 3)
+        assert triangles.max() == 23
+        assert beam_indices.tolist() == [0] * 12 + [1] * 12 + [2] * 12
+
+    def bounds(result):
+        vertices = result.geometry.to_vertices_and_faces()[0]
+        return vertices.min(axis=0).tolist() + vertices.max(axis=0).tolist()
+
+    def test_convex_geometry_consumer_lod(assembly):
+        stud = assembly.beams[2]
+        stud.add_features(DrillFeature(stud.centerline, 0.01, 0.1))
+
+        blank = list(ConvexGeometryConsumer(assembly, lod=LOD.BLANK).result)[2]
+        trims = list(ConvexGeometryConsumer(assembly, lod=LOD.TRIMS).result)[2]
+
+        assert blank.debug_info is None
+        assert bounds(blank) == pytest.approx([0.45, 0, -0.1, 0.55, 1, 0.1])
+        assert trims.debug_info is None  # the drill is not applied to trims
+        assert bounds(trims) == pytest.approx([0.45, 0.05, -0.1, 0.55, 1, 0.1])
+
+    def test_convex_geometry_consumer_bounding_box(assembly):
+        stud = assembly.beams[2]
+        stud.frame.rotate(0.5, stud.frame.xaxis, stud.frame.point)
+
+        result = list(ConvexGeometryConsumer(assembly, lod=LOD.BOUNDING_BOX).result)[2]
+        vertices, faces = result.geometry.to_vertices_and_faces()
+        box_vertices = np.array(stud.blank.to_vertices_and_faces()[0])
+
+        assert len(faces) == 6
+        assert vertices.min(axis=0).tolist() == pytest.approx(box_vertices.min(axis=0).tolist())
+        assert vertices.max(axis=0).tolist() == pytest.approx(box_vertices.max(axis=0).tolist())
+
+    def test_mesh_geometry_consumer_lod_policy(assembly):
+        policy = DistanceLODPolicy(Point(0.5, -1, 0), [(1.2, LOD.FULL)], default=LOD.BLANK)
+
+        vertices, triangles, beam_indices = MeshGeometryConsumer(assembly, lod=policy).merged()
+
+        stud_vertices = vertices[np.unique(triangles[beam_indices == 2])]
+        assert stud_vertices.min(axis=0).tolist() == pytest.approx([0.45, 0, -0.1])  # the blank, not trimmed
@@ -0,0 +1,124 @@
+import compas
+import pytest
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.geometry import Point
+from compas.geometry import Translation
+from compas.geometry import Vector
+
+from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import TButtJoint
+from compas_timber.parts import Beam
+from compas_timber.planning import Removal
+from compas_timber.solvers import create_dissassembly_sequence
+from compas_timber.solvers import next_removable_part
+
+if not compas.IPY:
+    from compas_timber.solvers import DisassemblyPlanner
+
+
+@pytest.fixture
+def stack():
+    # two layers of beams resting on each other, the lower layer can only be lifted once the upper one is gone
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    for y in (0, 1):
+        assembly.add_beam(Beam.from_endpoints(Point(-1, y, 0), Point(2, y, 0), 0.1, 0.1, z_vector=z))
+    for x in (0, 1):
+        assembly.add_beam(Beam.from_endpoints(Point(x, -1, 0.1), Point(x, 2, 0.1), 0.1, 0.1, z_vector=z))
+    assembly.add_beam(Beam.from_endpoints(Point(-1, 0.5, 0.2), Point(2, 0.5, 0.2), 0.1, 0.1, z_vector=z))
+    return assembly
+
+
+@pytest.fixture
+def frame():
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    bottom = Beam.from_endpoints(Point(0, 0, 0), Point(2, 0, 0), 0.1, 0.1, z_vector=z)
+    stud = Beam.from_endpoints(Point(1, 0, 0), Point(1, 2, 0), 0.1, 0.1, z_vector=z)
+    assembly.add_beam(bottom)
+    assembly.add_beam(stud)
+    TButtJoint.create(assembly, stud, bottom)
+    return assembly
+
+
+if not compas.IPY:
+
+    def test_disassembly_planner_lifting(stack):
+        planner = DisassemblyPlanner(stack, directions=[Vector(0, 0, 1)])
+        keys = [beam.key for beam in stack.beams]
+
+        assert planner.removable_parts() == [keys[4]]
+
+        plan = planner.create_sequence()
+
+        assert [step.element_ids[0] for step in plan] == [keys[4], keys[2], keys[3], keys[0], keys[1]]
+        assert [step.priority for step in plan] == [0, 1, 1, 2, 2]
+        assert isinstance(plan.steps[0].instructions[0], Removal)
+        assert list(plan.steps[0].instructions[0].direction) == [0, 0, 1]
+        assert planner.overlapping_pairs == []
+
+    def test_disassembly_planner_blocked(stack):
+        keys = [beam.key for beam in stack.beams]
+        planner = DisassemblyPlanner(stack, directions=[Vector(0, 0, 1), Vector(0, 0, -1)])
+
+        assert planner.removable_parts() == [keys[0], keys[1], keys[4]]
+        assert planner.removal_direction(keys[2]) is None  # held between the lower and the upper layer
+        assert list(planner.removal_direction(keys[0])) == [0, 0, -1]
+
+        planner.remove(keys[4])
+
+        assert list(planner.removal_direction(keys[2])) == [0, 0, 1]
+
+    def test_disassembly_planner_repeated_removal(stack):
+        keys = [beam.key for beam in stack.beams]
+        planner = DisassemblyPlanner(stack, directions=[Vector(0, 0, 1)])
+
+        planner.remove(keys[4])
+        planner.remove(keys[4])
+        planner.remove(100)
+
+        assert planner.removed == [keys[4]]
+        assert planner.removable_parts() == [keys[2], keys[3]]
+        step = next_removable_part(stack, [keys[4], keys[4], 100], None, 5, directions=[Vector(0, 0, 1)])
+        assert step.element_ids == [keys[2], keys[3]]
+
+    def test_disassembly_planner_butt_joint(frame):
+        bottom, stud = frame.beams
+        planner = DisassemblyPlanner(frame, directions=[Vector(0, -1, 0), Vector(0, 1, 0)])
+
+        assert planner.overlapping_pairs == []  # the stud is trimmed to touch the bottom beam
+        assert list(planner.removal_direction(stud.key)) == [0, 1, 0]
+        assert list(planner.removal_direction(bottom.key)) == [0, -1, 0]
+
+    def test_disassembly_plugins(stack):
+        keys = [beam.key for beam in stack.beams]
+
+        step = next_removable_part(stack, [], None, 1, directions=[Vector(0, 0, 1)])
+        assert step.element_ids == [keys[4]]
+        step = next_removable_part(stack, [keys[4]], None, 5, directions=[Vector(0, 0, 1)])
+        assert step.element_ids == [keys[2], keys[3]]
+        assert len(step.instructions) == 2
+
+        assert len(create_dissassembly_sequence(stack)) == len(keys)
+
+    def test_next_removable_part_options_and_geometry_changes(stack):
+        keys = [beam.key for beam in stack.beams]
+        up, down = Vector(0, 0, 1), Vector(0, 0, -1)
+
+        assert next_removable_part(stack, [], None, 5, directions=[up]).element_ids == [keys[4]]
+
+        stack.beams[0].frame.point = Point(-1, 0, -5)  # moved below the upper layers
+        assert next_removable_part(stack, [], None, 5, directions=[up]).element_ids == [keys[0], keys[4]]
+        assert next_removable_part(stack, [], None, 5, directions=[up, down]).element_ids == [keys[0], keys[1], keys[4]]
+
+    def test_removal_round_trip(stack):
+        plan = create_dissassembly_sequence(stack, directions=[Vector(0, 0, 1)])
+        beam = stack.beams[4]
+
+        removal = json_loads(json_dumps(plan)).steps[0].instructions[0]
+
+        assert isinstance(removal.direction, Vector)
+        assert removal.direction == Vector(0, 0, 1)
+        plan.transform(Translation.from_vector([0, 0, 1]))
+        assert beam.frame.point == Point(-1, 0.5, 0.2)
@@ -1,3 +1,4 @@
+import math
 import os
 from copy import deepcopy
 
@@ -13,6 +14,8 @@ from compas_timber.connections import TButtJoint
 from compas_timber.connections import LButtJoint
 from compas_timber.connections import LMiterJoint
 from compas_timber.connections import XHalfLapJoint
+from compas_timber.connections import beam_side_incidence
+from compas_timber.connections import beam_side_incidence_angles
 from compas_timber.connections import find_neighboring_beams
 from compas_timber.parts import Beam
 
@@ -165,6 +168,76 @@ def test_joint_create_kwargs_passthrough_xhalflap():
     assert joint.cut_plane_bias == 0.4
 
 
+def test_beam_side_incidence_angles():
+    main = Beam.from_endpoints(Point(0.5, 0, 0), Point(0.5, 1, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    cross = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+
+    angles = beam_side_incidence_angles(main, cross)
+    angles_faces = beam_side_incidence(main, cross)
+
+    assert len(angles) == 4
+    for angle, (expected_angle, face) in zip(angles, angles_faces):
+        assert angle == pytest.approx(expected_angle)
+    # main beam starts at the cross beam, the face of the cross beam pointing along main beam's centerline is +y
+    assert angles.index(min(angles)) == 0
+    assert angles[0] == pytest.approx(0.0)
+    assert angles[2] == pytest.approx(math.pi)
+
+
+def test_beam_side_incidence_angles_parallel():
+    beam_a = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    beam_b = Beam.from_endpoints(Point(0, 1, 0), Point(1, 1, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+
+    with pytest.raises(ValueError):
+        beam_side_incidence_angles(beam_a, beam_b)
+
+
+def test_cutting_plane_is_cached(mocker):
+    main = Beam.from_endpoints(Point(0.5, 0, 0), Point(0.5, 1, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    cross = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    joint = TButtJoint(main, cross)
+    spy = mocker.spy(joint, "_calculate_cutting_plane")
+
+    plane = joint.get_cutting_plane()
+
+    assert joint.cutting_plane is plane
+    assert joint.get_cutting_plane() is plane
+    assert spy.call_count == 1
+
+
+def test_cutting_plane_cache_invalidated_by_beam_change():
+    main = Beam.from_endpoints(Point(0.5, 0, 0), Point(0.5, 1, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    cross = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=Vector(0, 0, 1))
+    joint = TButtJoint(main, cross)
+    plane = joint.cutting_plane
+    assert plane.point.y == pytest.approx(0.05)
+
+    cross.width = 0.3
+    updated_plane = joint.cutting_plane
+
+    assert updated_plane is not plane
+    assert updated_plane.point.y == pytest.approx(0.15)
+
+    cross.frame = Frame(Point(0, 0.2, 0), Vector(1, 0, 0), Vector(0, 1, 0))
+    assert joint.cutting_plane.point.y == pytest.approx(0.35)
+
+
+def test_lap_joint_cache_depends_on_parameters():
+    beam_a = Beam.from_endpoints(Point(0.5, 0, 0), Point(0.5, 1, 0), 0.2, 0.2, z_vector=Vector(0, 0, 1))
+    beam_b = Beam.from_endpoints(Point(0, 0.5, 0), Point(1, 0.5, 0), 0.2, 0.2, z_vector=Vector(0, 0, 1))
+    joint = XHalfLapJoint(beam_a, beam_b)
+    volumes = joint._create_negative_volumes()
+
+    assert joint._create_negative_volumes() is volumes
+
+    joint.cut_plane_bias = 0.3
+    assert joint._create_negative_volumes() is not volumes
+
+    volumes = joint._create_negative_volumes()
+    joint.clear_geometry_cache()
+    assert joint._create_negative_volumes() is not volumes
+
+
 if not compas.IPY:
 
     def test_find_neighbors(example_beams):
@@ -190,3 +263,31 @@ if not compas.IPY:
         assert len(expected_result) == len(result)
         for pair in key_sets:
             assert pair in expected_result
+
+    def test_lap_negative_volumes_numpy():
+        from compas_timber.connections import lap_negative_polyhedrons_numpy
+        from compas_timber.connections import lap_negative_volumes_numpy
+
+        beam_a = Beam.from_endpoints(Point(0.5, 0, 0), Point(0.5, 1, 0), 0.2, 0.2, z_vector=Vector(0, 0, 1))
+        beam_b = Beam.from_endpoints(Point(0, 0.5, 0), Point(1, 0.5, 0.1), 0.1, 0.3, z_vector=Vector(0, 0, 1))
+        beam_c = Beam.from_endpoints(Point(0, 0.3, 0.2), Point(1, 0.2, 0), 0.2, 0.2, z_vector=Vector(0, 0, 1))
+        joints = [
+            XHalfLapJoint(beam_a, beam_b),
+            XHalfLapJoint(beam_a, beam_c, flip_lap_side=True, cut_plane_bias=0.3),
+            XHalfLapJoint(beam_b, beam_c, cut_plane_bias=0.7),
+            XHalfLapJoint(beam_a, beam_a),  # parallel, no volume
+        ]
+
+        main_vertices, cross_vertices, valid = lap_negative_volumes_numpy(joints)
+
+        assert main_vertices.shape == (4, 8, 3)
+        assert cross_vertices.shape == (4, 8, 3)
+        assert valid.tolist() == [True, True, True, False]
+        for joint, main, cross in zip(joints[:3], main_vertices, cross_vertices):
+            expected_main, expected_cross = joint._create_negative_volumes()
+            assert main.flatten().tolist() == pytest.approx([x for v in expected_main.vertices for x in v])
+            assert cross.flatten().tolist() == pytest.approx([x for v in expected_cross.vertices for x in v])
+
+        polyhedrons = lap_negative_polyhedrons_numpy(joints)
+        assert polyhedrons[3] is None
+        assert polyhedrons[0][0].faces == [list(face) for face in XHalfLapJoint.NEGATIVE_VOLUME_FACES]
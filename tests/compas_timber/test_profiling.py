@@ -0,0 +1,121 @@
+import json
+
+import compas
+import pytest
+from compas.geometry import Point
+from compas.geometry import Vector
+
+from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import ConnectionSolver
+from compas_timber.connections import LButtJoint
+from compas_timber.connections import TButtJoint
+from compas_timber.consumers import LOD
+from compas_timber.fabrication import BTLx
+from compas_timber.parts import Beam
+from compas_timber.utils import Profiler
+from compas_timber.utils import get_profiler
+from compas_timber.utils import profile_count
+from compas_timber.utils import profile_span
+
+if not compas.IPY:
+    from compas_timber.consumers import ConvexGeometryConsumer
+
+
+@pytest.fixture
+def profiler():
+    profiler = get_profiler()
+    profiler.clear()
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+    profiler.clear()
+
+
+def create_assembly():
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    bottom = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2, z_vector=z)
+    left = Beam.from_endpoints(Point(0, 0, 0), Point(0, 1, 0), 0.1, 0.2, z_vector=z)
+    stud = Beam.from_endpoints(Point(0.5, 0, 0), Point(0.5, 1, 0), 0.1, 0.2, z_vector=z)
+    for beam in (bottom, left, stud):
+        assembly.add_beam(beam)
+    LButtJoint.create(assembly, left, bottom)
+    TButtJoint.create(assembly, stud, bottom)
+    return assembly
+
+
+def test_profiler_disabled():
+    profiler = Profiler()
+
+    with profiler.span("solve"):
+        profiler.count("joints")
+
+    assert profiler.spans == []
+    assert profiler.counters == {}
+
+    create_assembly()
+    assert get_profiler().spans == []
+
+
+def test_profiler_spans_and_counters(profiler):
+    with profile_span("outer", "test", beams=2):
+        with profile_span("inner", "test"):
+            profile_count("joints", 2)
+        with profile_span("inner", "test"):
+            profile_count("joints")
+
+    summary = profiler.summary()
+    assert summary["inner"]["count"] == 2
+    assert summary["outer"]["total"] >= summary["inner"]["total"]
+    assert profiler.counters == {"joints": 3}
+    assert profiler.spans[-1].args == {"beams": 2}
+
+
+def test_profiler_instrumentation(profiler):
+    assembly = create_assembly()
+    solver = ConnectionSolver()
+    for beam_a, beam_b in solver.find_intersecting_pairs(assembly.beams, rtree=True):
+        solver.find_topology(beam_a, beam_b)
+    BTLx(assembly)  # processes the assembly
+
+    summary = profiler.summary()
+    assert summary["TButtJoint.create"]["count"] == 1
+    assert summary["TButtJoint.add_features"]["count"] == 1
+    assert summary["LButtJoint.add_features"]["count"] == 1
+    assert summary["ConnectionSolver.find_topology"]["count"] == 2  # the left beam and the stud are apart
+    assert summary["BTLx.process_assembly"]["count"] == 1
+    assert summary["TButtFactory.apply_processings"]["count"] == 1
+    assert "ConnectionSolver.find_intersecting_pairs" not in summary
+    assert profiler.counters["joints"] == 2
+    assert profiler.counters["btlx_joints"] == 2
+
+
+def test_profiler_export(profiler, tmp_path):
+    create_assembly()
+    profile_count("beams", 3)
+
+    profiler.write_json(str(tmp_path / "profile.json"))
+    profiler.write_chrome_trace(str(tmp_path / "trace.json"))
+
+    with open(str(tmp_path / "profile.json")) as f:
+        report = json.load(f)
+    with open(str(tmp_path / "trace.json")) as f:
+        trace = json.load(f)
+
+    assert report["counters"] == {"joints": 2, "beams": 3}
+    assert len(report["spans"]) == 4
+    assert set(report["summary"]) == set(span["name"] for span in report["spans"])
+    events = trace["traceEvents"]
+    assert [event["ph"] for event in events] == ["X"] * 4 + ["C"] * 2
+    assert all(event["dur"] >= 0 and event["ts"] >= 0 for event in events[:4])
+    assert [event["args"] for event in events[4:]] == [{"beams": 3}, {"joints": 2}]
+
+
+if not compas.IPY:
+
+    def test_profiler_feature_counters(profiler):
+        assembly = create_assembly()
+
+        list(ConvexGeometryConsumer(assembly, lod=LOD.TRIMS).result)
+
+        assert profiler.counters["features"] == sum(len(beam.features) for beam in assembly.beams)
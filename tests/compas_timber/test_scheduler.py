@@ -0,0 +1,80 @@
+import random
+import time
+
+import pytest
+
+from compas_timber.planning import Actor
+from compas_timber.planning import BuildingPlan
+from compas_timber.planning import StepScheduler
+from compas_timber.planning import Step
+
+
+def test_schedule_precedence_critical_path():
+    steps = [Step([index], actor=Actor.HUMAN) for index in range(4)]
+    # 0 -> 1 -> 2 is the critical path, 3 is independent
+    precedence = [(0, 1), (1, 2)]
+    durations = [2.0, 2.0, 2.0, 3.0]
+    scheduler = StepScheduler(BuildingPlan(steps), {Actor.HUMAN: 1}, durations, precedence)
+
+    schedule = scheduler.result
+
+    assert [s.step.element_ids[0] for s in schedule] == [0, 1, 3, 2]
+    assert schedule.makespan == 9.0
+
+    schedule = StepScheduler(BuildingPlan(steps), {Actor.HUMAN: 2}, durations, precedence).result
+
+    assert schedule.makespan == 6.0
+    assert {s.step.element_ids[0]: s.start for s in schedule} == {0: 0.0, 1: 2.0, 2: 4.0, 3: 0.0}
+    assert [s.step.element_ids for s in schedule.get_actor_steps(Actor.HUMAN, 1)] == [[3]]
+
+
+def test_schedule_actor_types():
+    steps = [Step([0], actor=Actor.ROBOT), Step([1], actor=Actor.ROBOT), Step([2]), Step([3], actor=Actor.HUMAN)]
+    schedule = StepScheduler(BuildingPlan(steps), {Actor.HUMAN: 1, Actor.ROBOT: 1}).result
+
+    by_element = {s.step.element_ids[0]: s for s in schedule}
+    assert by_element[0].actor == Actor.ROBOT
+    assert by_element[1].actor == Actor.ROBOT
+    assert by_element[3].actor == Actor.HUMAN
+    assert schedule.makespan == 2.0
+    assert schedule.actors == [(Actor.HUMAN, 0), (Actor.ROBOT, 0)]
+
+
+def test_schedule_priorities():
+    steps = [Step([0], priority=0), Step([1], priority=1), Step([2], priority=1), Step([3], priority=3)]
+    durations = lambda step: 2.0 if step.element_ids[0] == 0 else 1.0  # noqa: E731
+    schedule = StepScheduler(BuildingPlan(steps), {Actor.HUMAN: 2}, durations).result
+
+    starts = {s.step.element_ids[0]: s.start for s in schedule}
+    assert starts == {0: 0.0, 1: 2.0, 2: 2.0, 3: 3.0}
+
+
+def test_schedule_errors():
+    steps = [Step([0]), Step([1], actor=Actor.ROBOT)]
+
+    with pytest.raises(ValueError):
+        StepScheduler(BuildingPlan(steps), precedence=[(0, 1), (1, 0)]).result
+    with pytest.raises(ValueError):
+        StepScheduler(BuildingPlan(steps), {Actor.HUMAN: 1}).result
+    with pytest.raises(ValueError):
+        StepScheduler(BuildingPlan(steps), durations=[1.0]).result
+
+
+def test_schedule_many_steps():
+    generator = random.Random(0)
+    count = 5000
+    steps = [Step([index], actor=generator.choice([Actor.HUMAN, Actor.ROBOT, None])) for index in range(count)]
+    precedence = [(generator.randrange(index), index) for index in range(1, count) for _ in range(2)]
+    durations = [generator.uniform(1.0, 10.0) for _ in steps]
+
+    start = time.time()
+    schedule = StepScheduler(BuildingPlan(steps), {Actor.HUMAN: 3, Actor.ROBOT: 2}, durations, precedence).result
+    assert time.time() - start < 1.0
+
+    ends = {s.step.element_ids[0]: s.end for s in schedule}
+    starts = {s.step.element_ids[0]: s.start for s in schedule}
+    assert len(schedule) == count
+    assert all(ends[before] <= starts[after] for before, after in precedence)
+    for actor in schedule.actors:
+        actor_steps = schedule.get_actor_steps(*actor)
+        assert all(a.end <= b.start for a, b in zip(actor_steps, actor_steps[1:]))
@@ -1,11 +1,32 @@
+import json
+
+import compas
 import pytest
 from compas.data import json_dumps
 from compas.data import json_loads
 from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Transformation
+from compas.geometry import Translation
+from compas.geometry import Vector
 
 from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import LMiterJoint
+from compas_timber.connections import TButtJoint
 from compas_timber.parts import Beam
+from compas_timber.planning import Actor
+from compas_timber.planning import BuildingPlan
+from compas_timber.planning import BuildingPlanReader
+from compas_timber.planning import BuildingPlanWriter
+from compas_timber.planning import DependencySequenceGenerator
+from compas_timber.planning import LinearDimension
+from compas_timber.planning import Removal
 from compas_timber.planning import SimpleSequenceGenerator
+from compas_timber.planning import Step
+from compas_timber.planning import Text3d
+
+if not compas.IPY:
+    from compas_timber.planning import BuildingPlanArrays
 
 
 @pytest.fixture
@@ -50,3 +71,201 @@ def test_serialize_plan(mock_assembly):
     assert len(plan) == len(assembly.beams)
     for step, beam in zip(plan, assembly.beams):
         assert beam.key == step.element_ids[0]
+
+
+def test_iter_chunks(mock_assembly):
+    chunks = list(SimpleSequenceGenerator(mock_assembly).iter_chunks(2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [step.element_ids[0] for chunk in chunks for step in chunk] == [beam.key for beam in mock_assembly.beams]
+
+
+def test_stream_plan(mock_assembly, tmp_path):
+    filepath = str(tmp_path / "plan.jsonl")
+    generator = SimpleSequenceGenerator(mock_assembly)
+
+    with BuildingPlanWriter(filepath) as writer:
+        for chunk in generator.iter_chunks(2):
+            writer.write_steps(chunk)
+            assert len(list(BuildingPlanReader(filepath).iter_steps())) == writer.count  # readable while writing
+
+    with open(filepath) as f:
+        assert len(f.readlines()) == len(mock_assembly.beams)
+    reader = BuildingPlanReader(filepath)
+    assert [len(chunk) for chunk in reader.iter_chunks(3)] == [3, 2]
+    plan = reader.to_plan()
+    assert [step.element_ids[0] for step in plan] == [beam.key for beam in mock_assembly.beams]
+
+
+def test_stream_plan_round_trip(tmp_path):
+    filepath = str(tmp_path / "plan.jsonl")
+    location = Frame(Point(1, 2, 3), Vector(1, 1, 0), Vector(-1, 1, 0))
+    instructions = [
+        Text3d(0, location.copy(), "stud", 0.1),
+        LinearDimension(1, location.copy(), Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.2),
+    ]
+    steps = [
+        Step([7], actor=Actor.ROBOT, location=location, instructions=instructions, priority=3, elements_held=[7]),
+        Step([8]),
+    ]
+
+    with BuildingPlanWriter(filepath) as writer:
+        writer.write_steps(steps)
+    robot_step, step = BuildingPlanReader(filepath).to_plan()
+
+    assert isinstance(robot_step.location, Frame)
+    assert robot_step.location == location
+    assert robot_step.actor == Actor.ROBOT
+    assert robot_step.priority == 3
+    assert robot_step.elements_held == [7]
+    assert [type(instruction) for instruction in robot_step.instructions] == [Text3d, LinearDimension]
+    assert robot_step.instructions[0].location == location
+    assert robot_step.instructions[0].text == "stud"
+    assert robot_step.instructions[1].end == Point(1, 0, 0)
+    assert step.actor is None
+    assert step.location == Frame.worldXY()
+
+    robot_step.transform(Translation.from_vector([1, 0, 0]))
+    robot_step.instructions[1].transform(Translation.from_vector([1, 0, 0]))
+    assert robot_step.location.point == Point(2, 2, 3)
+    assert robot_step.instructions[1].end == Point(2, 0, 0)
+
+
+@pytest.fixture
+def frame_assembly():
+    # a wall frame, the studs butt against the bottom and top plates, the plates are mitered to the side studs
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    top = Beam.from_endpoints(Point(0, 2, 0), Point(2, 2, 0), 0.1, 0.1, z_vector=z)
+    stud = Beam.from_endpoints(Point(1, 0, 0), Point(1, 2, 0), 0.1, 0.1, z_vector=z)
+    bottom = Beam.from_endpoints(Point(0, 0, 0), Point(2, 0, 0), 0.1, 0.1, z_vector=z)
+    blocking = Beam.from_endpoints(Point(1, 1, 0), Point(2, 1, 0), 0.1, 0.1, z_vector=z)
+    for beam in (top, stud, bottom, blocking):
+        assembly.add_beam(beam)
+    TButtJoint.create(assembly, stud, bottom)
+    TButtJoint.create(assembly, stud, top)
+    TButtJoint.create(assembly, blocking, stud)
+    return assembly
+
+
+def test_dependency_sequence_generator(frame_assembly):
+    top, stud, bottom, blocking = frame_assembly.beams
+    generator = DependencySequenceGenerator(frame_assembly)
+
+    assert list(generator.iter_groups()) == [[top, bottom], [stud], [blocking]]
+    plan = generator.result
+    assert [step.element_ids[0] for step in plan] == [top.key, bottom.key, stud.key, blocking.key]
+    assert [step.priority for step in plan] == [0, 0, 1, 2]
+    assert generator.cycle_breaks == []
+
+    plan.transform(Translation.from_vector([5, 0, 0]))
+    assert top.frame.point == Point(0, 2, 0)
+
+
+def test_dependency_sequence_generator_symmetric_joints():
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    a = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.1, z_vector=z)
+    b = Beam.from_endpoints(Point(1, 0, 0), Point(1, 1, 0), 0.1, 0.1, z_vector=z)
+    assembly.add_beam(a)
+    assembly.add_beam(b)
+    LMiterJoint.create(assembly, a, b)
+
+    assert list(DependencySequenceGenerator(assembly).iter_groups()) == [[a, b]]
+
+
+def test_dependency_sequence_generator_cycle():
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    a = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.1, z_vector=z)
+    b = Beam.from_endpoints(Point(1, 0, 0), Point(0.5, 1, 0), 0.1, 0.1, z_vector=z)
+    c = Beam.from_endpoints(Point(0.5, 1, 0), Point(0, 0, 0), 0.1, 0.1, z_vector=z)
+    free = Beam.from_endpoints(Point(0, 5, 0), Point(1, 5, 0), 0.1, 0.1, z_vector=z)
+    for beam in (a, b, c, free):
+        assembly.add_beam(beam)
+    # a -> b -> c -> a
+    TButtJoint.create(assembly, b, a)
+    TButtJoint.create(assembly, c, b)
+    TButtJoint.create(assembly, a, c)
+    generator = DependencySequenceGenerator(assembly)
+
+    groups = list(generator.iter_groups())
+
+    assert groups == [[free], [a], [b], [c]]
+    assert generator.cycle_breaks == [a.key]
+
+
+def test_dependency_sequence_generator_cycle_upstream():
+    assembly = TimberAssembly()
+    z = Vector(0, 0, 1)
+    a = Beam.from_endpoints(Point(0.5, -1, 0), Point(0.5, 0, 0), 0.1, 0.1, z_vector=z)
+    b = Beam.from_endpoints(Point(0, 0, 0), Point(1, 0, 0), 0.1, 0.1, z_vector=z)
+    c = Beam.from_endpoints(Point(1, 0, 0), Point(0.5, 1, 0), 0.1, 0.1, z_vector=z)
+    d = Beam.from_endpoints(Point(0.5, 1, 0), Point(0, 0, 0), 0.1, 0.1, z_vector=z)
+    for beam in (a, b, c, d):
+        assembly.add_beam(beam)
+    # b -> c -> d -> b, and a waits for b without being part of the cycle
+    TButtJoint.create(assembly, a, b)
+    TButtJoint.create(assembly, c, b)
+    TButtJoint.create(assembly, d, c)
+    TButtJoint.create(assembly, b, d)
+    generator = DependencySequenceGenerator(assembly)
+
+    groups = list(generator.iter_groups())
+
+    assert generator.cycle_breaks == [b.key]
+    assert groups == [[b], [a, c], [d]]
+
+
+def _instruction_plan():
+    plan = BuildingPlan()
+    for index in range(3):
+        location = Frame(Point(index, 0, 0), Vector(1, 1, 0), Vector(-1, 1, 1))
+        instructions = [
+            Text3d(index, location.copy(), "beam {}".format(index), 0.1),
+            LinearDimension(index, location.copy(), Point(index, 0, 0), Point(index, 2, 0), 0.1, 0.2),
+            Removal(index, location.copy(), index, Vector(0, 0, 1)),
+        ]
+        plan.add_step(Step([index], actor=Actor.ROBOT, location=location, instructions=instructions))
+    return plan
+
+
+def _flatten(data):
+    if isinstance(data, dict):
+        return [v for key in sorted(data) if key != "guid" for v in [key] + _flatten(data[key])]
+    if isinstance(data, list):
+        return [v for item in data for v in _flatten(item)]
+    return [data]
+
+
+if not compas.IPY:
+
+    def test_building_plan_arrays_transform():
+        transformation = Transformation.from_frame(Frame(Point(1, 2, 3), Vector(0, 1, 0), Vector(-1, 0, 1)))
+        expected = _instruction_plan()
+        expected.transform(transformation)
+
+        arrays = BuildingPlanArrays(_instruction_plan())
+        arrays.transform(transformation)
+
+        assert arrays.points.shape == (12 + 6, 3)
+        assert arrays.vectors.shape == (24 + 3, 3)
+        data = _flatten(json.loads(json_dumps(arrays.__data__)))
+        expected_data = _flatten(json.loads(json_dumps(expected.__data__)))
+
+        assert [value for value in data if isinstance(value, str)] == [v for v in expected_data if isinstance(v, str)]
+        assert [value for value in data if not isinstance(value, str)] == pytest.approx(
+            [value for value in expected_data if not isinstance(value, str)]
+        )
+
+    def test_transform_plan_keeps_beam_frames(frame_assembly):
+        frames = [beam.frame.copy() for beam in frame_assembly.beams]
+        transformation = Translation.from_vector([5, 0, 0])
+
+        arrays = BuildingPlanArrays(SimpleSequenceGenerator(frame_assembly).result)
+        arrays.transform(transformation)
+        arrays.update_plan()
+        DependencySequenceGenerator(frame_assembly).result.transform(transformation)
+
+        assert [beam.frame for beam in frame_assembly.beams] == frames
+        assert arrays.plan.steps[0].location.point == Point(5, 2, 0)
@@ -0,0 +1,73 @@
+from compas.geometry import Point
+from compas.geometry import Vector
+
+from compas_timber.assembly import TimberAssembly
+from compas_timber.connections import BeamJoinningError
+from compas_timber.connections import LButtJoint
+from compas_timber.connections import TButtJoint
+from compas_timber.consumers import FeatureApplicationStats
+from compas_timber.ghpython import SolveStats
+from compas_timber.parts import Beam
+from compas_timber.parts import CutFeature
+from compas_timber.parts import DrillFeature
+
+
+def create_beams(count):
+    z = Vector(0, 0, 1)
+    return [Beam.from_endpoints(Point(0, i, 0), Point(1, i, 0), 0.1, 0.1, z_vector=z) for i in range(count)]
+
+
+def test_solve_stats_joints():
+    beams = create_beams(5)
+    stats = SolveStats(slowest_count=2, bins=[0.01, 0.1])
+
+    stats.add_joint(TButtJoint, beams[:2], 0.005)
+    stats.add_joint(TButtJoint, beams[1:3], 0.5)
+    stats.add_joint(LButtJoint, beams[2:4], 0.05, failed=True)
+    stats.add_joint(LButtJoint, beams[3:5], 0.05)
+
+    assert stats.joint_counts == {"TButtJoint": 2, "LButtJoint": 2}
+    assert stats.joint_failures == {"LButtJoint": 1}
+    assert stats.histograms == {"TButtJoint": [1, 0, 1], "LButtJoint": [0, 2, 0]}
+    assert stats.slowest_joints == [
+        (0.5, "TButtJoint", [beams[1].key, beams[2].key]),
+        (0.05, "LButtJoint", [beams[2].key, beams[3].key]),
+    ]
+    assert stats.histogram_labels() == ["<0.01s", "<0.1s", ">=0.1s"]
+    assert "TButtJoint: 2 joints, 0 failed" in stats.report()
+
+
+def test_solve_stats_measure_joint():
+    assembly = TimberAssembly()
+    main, cross = create_beams(2)  # parallel beams cannot be joined
+    assembly.add_beam(main)
+    assembly.add_beam(cross)
+    stats = SolveStats()
+
+    try:
+        with stats.measure_joint(TButtJoint, [main, cross]):
+            TButtJoint.create(assembly, main, cross)
+    except BeamJoinningError:
+        pass
+
+    assert stats.joint_counts == {"TButtJoint": 1}
+    assert stats.joint_failures == {"TButtJoint": 1}
+    assert stats.slowest_joints[0][2] == [main.key, cross.key]
+
+
+def test_solve_stats_features():
+    drill = DrillFeature(None, 0.01, 0.1)
+    cut = CutFeature(None)
+    feature_stats = FeatureApplicationStats()
+    feature_stats.add(drill, "applied", 3)
+    feature_stats.add(drill, "failed")
+    feature_stats.add(cut, "culled")
+    stats = SolveStats()
+
+    stats.add_feature_stats(feature_stats)
+    stats.add_feature_stats(feature_stats)
+
+    assert stats.feature_counts["DrillFeature"] == {"applied": 6, "culled": 0, "failed": 2}
+    assert stats.failure_rate("DrillFeature") == 0.25
+    assert stats.failure_rate("CutFeature") == 0.0
+    assert "DrillFeature: 6 applied, 0 culled, 2 failed, 25.0% failure rate" in stats.report()